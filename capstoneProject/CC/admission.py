@@ -0,0 +1,177 @@
+# Admission control di depan inferensi: setiap pool (misalnya 'inference' untuk /predict* dan
+# 'light' untuk route murah seperti / dan /articles) punya batas request yang diproses bersamaan,
+# antrean tunggu yang terbatas, dan token bucket per klien. Request yang tidak bisa dilayani segera
+# ditolak dengan 429 (rate limit) atau 503 (server penuh) beserta Retry-After, alih-alih menumpuk
+# sampai Cloud Run memutus request karena timeout.
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class Rejected(Exception):
+    def __init__(self, status, retry_after, message):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.message = message
+
+
+def client_id(forwarded_for, remote_addr, proxy_hops=1):
+    # Alamat klien: entri ke-`proxy_hops` dari belakang X-Forwarded-For (entri paling belakang ditambahkan
+    # oleh proxy di depan kita, entri di depannya bisa dipalsukan klien), selain itu alamat koneksi
+    if proxy_hops > 0 and forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(',')]
+        if len(hops) >= proxy_hops and hops[-proxy_hops]:
+            return hops[-proxy_hops]
+    return remote_addr or 'unknown'
+
+
+class ConcurrencyLimiter:
+    # Paling banyak `limit` request diproses bersamaan; paling banyak `queue_size` request menunggu,
+    # masing-masing paling lama `queue_timeout` detik. Request berikutnya langsung ditolak.
+    def __init__(self, limit, queue_size=0, queue_timeout=1.0):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._queued = 0
+        self._queue_full = 0
+        self._timeouts = 0
+        self._max_wait = 0.0
+
+    def acquire(self):
+        with self._cond:
+            # Slot kosong hanya langsung dipakai jika tidak ada yang sedang antre (urutan tetap adil)
+            if self._active < self.limit and self._waiting == 0:
+                self._active += 1
+                self._admitted += 1
+                return True
+            if self._waiting >= self.queue_size:
+                self._queue_full += 1
+                return False
+
+            self._waiting += 1
+            self._queued += 1
+            started = time.monotonic()
+            deadline = started + self.queue_timeout
+            try:
+                while self._active >= self.limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+            self._active += 1
+            self._admitted += 1
+            self._max_wait = max(self._max_wait, time.monotonic() - started)
+            return True
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'queue_size': self.queue_size,
+                'active': self._active,
+                'waiting': self._waiting,
+                'admitted': self._admitted,
+                'queued': self._queued,
+                'rejected_queue_full': self._queue_full,
+                'rejected_timeout': self._timeouts,
+                'max_queue_wait_ms': round(self._max_wait * 1000.0, 3),
+            }
+
+
+class RateLimiter:
+    # Token bucket per klien: `rate` token per detik, paling banyak `burst` token. Bucket disimpan
+    # dalam urutan LRU dan dibatasi `max_clients`; klien yang terbuang mulai lagi dengan bucket penuh.
+    def __init__(self, rate, burst, max_clients=10000):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()  # klien -> [token, waktu update]
+        self._limited = 0
+
+    def take(self, client):
+        # 0 jika request boleh lewat, selain itu jumlah detik sampai satu token tersedia
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = self._buckets[client] = [float(self.burst), now]
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            self._limited += 1
+            return (1.0 - bucket[0]) / self.rate
+
+    def stats(self):
+        with self._lock:
+            return {'rate': self.rate, 'burst': self.burst, 'clients': len(self._buckets),
+                    'rejected_rate_limited': self._limited}
+
+
+class AdmissionPool:
+    def __init__(self, name, limiter=None, rate_limiter=None, retry_after=1):
+        self.name = name
+        self.limiter = limiter
+        self.rate_limiter = rate_limiter
+        self.retry_after = retry_after  # detik, untuk Retry-After pada 503
+        self._lock = threading.Lock()
+        self._overloaded = 0
+
+    def check_rate(self, client):
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.take(client)
+            if wait > 0:
+                raise Rejected(429, max(1, math.ceil(wait)), 'Too many requests, slow down')
+
+    def overloaded(self):
+        # Exception untuk request yang ditolak karena server penuh (juga dipakai jalur ASGI)
+        with self._lock:
+            self._overloaded += 1
+        return Rejected(503, self.retry_after, 'Server is busy, retry later')
+
+    def admit(self, client):
+        # Rate limit diperiksa dulu agar klien yang terlalu sering tidak memakai tempat di antrean.
+        # Mengembalikan True jika slot diambil dan harus dilepas dengan release().
+        self.check_rate(client)
+        if self.limiter is None:
+            return False
+        if not self.limiter.acquire():
+            raise self.overloaded()
+        return True
+
+    def release(self):
+        self.limiter.release()
+
+    def stats(self):
+        stats = {'rejected_overloaded': self._overloaded}
+        if self.limiter is not None:
+            stats.update(self.limiter.stats())
+        if self.rate_limiter is not None:
+            stats.update(self.rate_limiter.stats())
+        return stats
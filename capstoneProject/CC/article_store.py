@@ -0,0 +1,102 @@
+# Field yang ditampilkan pada daftar artikel (/articles); isi lengkap hanya ada di detail
+SUMMARY_FIELDS = ('id', 'judul', 'gambar', 'penulis', 'predicted_class', 'tanggal_dibuat')
+
+# Ejaan lama label kelas yang pernah dipakai pada data artikel / klien
+CLASS_ALIASES = {
+    'severly_stunted': 'severely_stunted',
+    'several_stunted': 'severely_stunted',
+    'severely stunted': 'severely_stunted',
+}
+
+# Ejaan label yang dikirim sebelum label artikel diseragamkan. Build Android lama memfilter daftar
+# /articles sendiri dengan membandingkan predicted_class dengan 'severly_stunted', jadi selama build itu
+# masih dipakai respons artikel tetap memakai ejaan ini (lihat ARTICLES_LEGACY_LABELS di main.py)
+LEGACY_LABELS = {'severely_stunted': 'severly_stunted'}
+
+SORT_KEYS = ('tanggal_dibuat', '-tanggal_dibuat')
+
+
+def summarize(article):
+    return {field: article[field] for field in SUMMARY_FIELDS}
+
+
+class ArticleStore:
+    # Satu tempat penyimpanan artikel yang diindeks berdasarkan id. Daftar ringkas dan detail
+    # keduanya diturunkan dari data yang sama, sehingga tidak bisa lagi berbeda satu sama lain.
+    # Dengan legacy_labels, artikel yang disajikan memakai ejaan LEGACY_LABELS; indeks dan filter
+    # predicted_class tetap memakai label kanonik.
+    def __init__(self, articles, classes, legacy_labels=False):
+        self.classes = list(classes)
+        self._articles = []
+        self._article_classes = []
+        self._by_id = {}
+        for article in articles:
+            if article['id'] in self._by_id:
+                raise ValueError(f"Duplicate article id: {article['id']}")
+            if self.canonical_class(article['predicted_class']) != article['predicted_class']:
+                raise ValueError(f"Article {article['id']} has non-canonical class {article['predicted_class']}")
+            self._article_classes.append(article['predicted_class'])
+            if legacy_labels and article['predicted_class'] in LEGACY_LABELS:
+                article = {**article, 'predicted_class': LEGACY_LABELS[article['predicted_class']]}
+            self._articles.append(article)
+            self._by_id[article['id']] = article
+
+        self.summaries = [summarize(article) for article in self._articles]
+        self.fields = set().union(*(article.keys() for article in self._articles))
+
+        # Indeks per kelas dan per urutan, dihitung sekali saat start:
+        # (kelas atau None, sort atau None) -> tuple posisi artikel
+        by_date = sorted(range(len(self._articles)),
+                         key=lambda i: (self._articles[i]['tanggal_dibuat'], self._articles[i]['id']))
+        orders = {
+            None: tuple(range(len(self._articles))),
+            'tanggal_dibuat': tuple(by_date),
+            '-tanggal_dibuat': tuple(reversed(by_date)),
+        }
+        self._index = {}
+        for sort, order in orders.items():
+            self._index[(None, sort)] = order
+            for predicted_class in self.classes:
+                self._index[(predicted_class, sort)] = tuple(
+                    i for i in order if self._article_classes[i] == predicted_class)
+
+    def __len__(self):
+        return len(self._articles)
+
+    def __iter__(self):
+        return iter(self._articles)
+
+    def get(self, article_id):
+        return self._by_id.get(article_id)
+
+    def canonical_class(self, name):
+        name = CLASS_ALIASES.get(name.strip().lower(), name.strip().lower())
+        if name not in self.classes:
+            raise ValueError(f"Unknown predicted_class: {name}")
+        return name
+
+    def query(self, predicted_class=None, sort=None, fields=None, limit=None, offset=0):
+        # Mengembalikan (daftar artikel, offset berikutnya atau None)
+        if sort not in (None, *SORT_KEYS):
+            raise ValueError(f"sort must be one of: {', '.join(SORT_KEYS)}")
+        if fields is not None:
+            unknown = [field for field in fields if field not in self.fields]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be a positive integer")
+        if offset < 0:
+            raise ValueError("cursor must not be negative")
+
+        if predicted_class is not None:
+            predicted_class = self.canonical_class(predicted_class)
+        positions = self._index[(predicted_class, sort)]
+
+        end = len(positions) if limit is None else min(offset + limit, len(positions))
+        if fields is None:
+            items = [self.summaries[i] for i in positions[offset:end]]
+        else:
+            items = [{field: self._articles[i][field] for field in fields if field in self._articles[i]}
+                     for i in positions[offset:end]]
+
+        return items, (end if end < len(positions) else None)
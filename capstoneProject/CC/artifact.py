@@ -0,0 +1,174 @@
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from datetime import datetime, timezone
+
+import numpy as np
+
+from inference import NumpyMLP
+from scaling import AffineScaler
+
+# Format artefak model (little-endian):
+#   header 64 byte : magic (8) | format_version u32 | meta_len u32 | data_offset u64 | data_len u64 | sha256 (32)
+#   metadata JSON  : versi model, kelas, nama fitur, serta offset/shape/dtype setiap array
+#   data           : bobot, bias, dan parameter scaler, setiap array di-align ke 64 byte
+# Checksum sha256 dihitung atas metadata + data.
+MAGIC = b'STNTMDL\x00'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<8sIIQQ32s')
+ALIGNMENT = 64
+
+
+class ArtifactError(Exception):
+    pass
+
+
+def _align(n):
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_artifact(path, model, scaler, classes, model_version=None, source_fingerprint=None):
+    arrays = []
+    layers = []
+    for i, (kernel, bias, activation) in enumerate(model.layers):
+        layers.append({'kernel': f'layer{i}.kernel', 'bias': f'layer{i}.bias', 'activation': activation})
+        arrays.append((f'layer{i}.kernel', np.ascontiguousarray(kernel, dtype='<f4')))
+        arrays.append((f'layer{i}.bias', np.ascontiguousarray(bias, dtype='<f4')))
+    arrays.append(('scaler.scale', np.ascontiguousarray(scaler.scale_, dtype='<f8')))
+    arrays.append(('scaler.min', np.ascontiguousarray(scaler.min_, dtype='<f8')))
+
+    data = bytearray()
+    entries = {}
+    for name, array in arrays:
+        data.extend(b'\x00' * (_align(len(data)) - len(data)))
+        entries[name] = {'offset': len(data), 'shape': list(array.shape), 'dtype': array.dtype.str}
+        data.extend(array.tobytes())
+
+    content_digest = hashlib.sha256(bytes(data)).hexdigest()
+    meta = {
+        'model_version': model_version or content_digest[:12],
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'source_fingerprint': source_fingerprint,
+        'classes': list(classes),
+        'feature_names': list(scaler.feature_names),
+        'layers': layers,
+        'arrays': entries,
+    }
+    meta_bytes = json.dumps(meta, sort_keys=True).encode('utf-8')
+
+    data_offset = _align(HEADER.size + len(meta_bytes))
+    padding = b'\x00' * (data_offset - HEADER.size - len(meta_bytes))
+    checksum = hashlib.sha256(meta_bytes + bytes(data)).digest()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(meta_bytes), data_offset, len(data), checksum)
+
+    # Tulis ke file sementara lalu rename: proses yang sedang me-mmap artefak lama tetap membaca file
+    # lama (memotong file yang sedang di-mmap bisa membuat proses itu mati karena SIGBUS)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(meta_bytes)
+        f.write(padding)
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    return meta
+
+
+class ModelArtifact:
+    # Artefak di-mmap read-only; bobot dan parameter scaler adalah view ke halaman file
+    # tersebut (tanpa salinan), sehingga memuatnya hanya butuh beberapa mikrodetik.
+    def __init__(self, path, verify=True):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            raise ArtifactError(f"{path} is too small to be a model artifact")
+        magic, version, meta_len, data_offset, data_len, checksum = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ArtifactError(f"{path} is not a model artifact")
+        if version != FORMAT_VERSION:
+            raise ArtifactError(f"Unsupported artifact format version {version} (expected {FORMAT_VERSION})")
+        if data_offset + data_len > len(self._mmap):
+            raise ArtifactError(f"{path} is truncated")
+
+        meta_bytes = self._mmap[HEADER.size:HEADER.size + meta_len]
+        if verify:
+            digest = hashlib.sha256(meta_bytes)
+            digest.update(memoryview(self._mmap)[data_offset:data_offset + data_len])
+            if digest.digest() != checksum:
+                raise ArtifactError(f"Checksum mismatch in {path}")
+
+        self.format_version = version
+        self.checksum = checksum.hex()
+        self.meta = json.loads(meta_bytes)
+        self._data_offset = data_offset
+
+    @property
+    def model_version(self):
+        return self.meta['model_version']
+
+    @property
+    def classes(self):
+        return self.meta['classes']
+
+    @property
+    def source_fingerprint(self):
+        return self.meta.get('source_fingerprint')
+
+    def array(self, name):
+        entry = self.meta['arrays'][name]
+        dtype = np.dtype(entry['dtype'])
+        count = int(np.prod(entry['shape']))
+        array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=self._data_offset + entry['offset'])
+        return array.reshape(entry['shape'])
+
+    def model(self):
+        return NumpyMLP([
+            (self.array(layer['kernel']), self.array(layer['bias']), layer['activation'])
+            for layer in self.meta['layers']
+        ])
+
+    def scaler(self):
+        return AffineScaler(self.array('scaler.scale'), self.array('scaler.min'), self.meta['feature_names'])
+
+
+def convert(model_path, scaler_path, out_path, classes, model_version=None):
+    import joblib
+    from threshold_table import file_fingerprint
+
+    model = NumpyMLP.from_h5(model_path)
+    scaler = AffineScaler.from_sklearn(joblib.load(scaler_path))
+    return write_artifact(out_path, model, scaler, classes, model_version=model_version,
+                          source_fingerprint=file_fingerprint(model_path, scaler_path))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Convert mlp_model.h5 + scaler.pkl into a single model artifact')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert')
+    convert_parser.add_argument('--model', default='model/mlp_model.h5')
+    convert_parser.add_argument('--scaler', default='model/scaler.pkl')
+    convert_parser.add_argument('--out', default='model/model.stm')
+    convert_parser.add_argument('--version', default=None, help='model version label (default: content hash)')
+
+    inspect_parser = subparsers.add_parser('inspect')
+    inspect_parser.add_argument('path', nargs='?', default='model/model.stm')
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        meta = convert(args.model, args.scaler, args.out,
+                       ['severely_stunted', 'stunted', 'normal', 'tinggi'], model_version=args.version)
+        logging.info(f"Model artifact version {meta['model_version']} saved to {args.out}")
+    else:
+        artifact = ModelArtifact(args.path)
+        print(json.dumps({'format_version': artifact.format_version, 'checksum': artifact.checksum,
+                          **artifact.meta}, indent=2))
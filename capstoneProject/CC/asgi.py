@@ -0,0 +1,140 @@
+# Entry point ASGI: gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker asgi:app
+#
+# /predict ditangani langsung secara async: body dibaca di event loop (klien yang lambat tidak
+# menahan thread), lalu inferensi dijalankan di thread pool yang ukurannya dibatasi.
+# Route lain diteruskan ke aplikasi Flask lewat a2wsgi.
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from a2wsgi import WSGIMiddleware
+
+import main
+import metrics
+from admission import Rejected, client_id
+
+inference_threads = int(os.environ.get('INFERENCE_THREADS', 2))
+# Jumlah request /predict yang boleh menunggu thread inferensi sekaligus; request berikutnya
+# ditolak dengan 503 (jika admission control aktif) alih-alih ikut menunggu
+inference_queue_size = int(os.environ.get('INFERENCE_QUEUE_SIZE', inference_threads * 16))
+wsgi_threads = int(os.environ.get('WSGI_THREADS', 8))
+max_body_size = int(os.environ.get('MAX_PREDICT_BODY_SIZE', 64 * 1024))
+
+inference_executor = ThreadPoolExecutor(max_workers=inference_threads, thread_name_prefix='inference')
+flask_app = WSGIMiddleware(main.app, workers=wsgi_threads)
+
+_inference_slots = None
+
+
+def _slots():
+    # Semaphore dibuat di dalam event loop yang sedang berjalan
+    global _inference_slots
+    if _inference_slots is None:
+        _inference_slots = asyncio.Semaphore(inference_queue_size)
+    return _inference_slots
+
+
+def _is_json(headers):
+    content_type = headers.get(b'content-type', b'').split(b';')[0].strip().lower()
+    return content_type == b'application/json' or (
+        content_type.startswith(b'application/') and content_type.endswith(b'+json'))
+
+
+def _client(scope, headers):
+    forwarded_for = headers.get(b'x-forwarded-for', b'').decode('latin-1')
+    remote_addr = scope['client'][0] if scope.get('client') else None
+    return client_id(forwarded_for, remote_addr, main.admission_proxy_hops)
+
+
+async def _send_json(send, body, status, headers=()):
+    payload = main.app.json.dumps_bytes(body) + b'\n'
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(payload)).encode('ascii')),
+            *headers,
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+    return status
+
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > max_body_size:
+            raise ValueError('Request body too large')
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def predict(scope, receive, send):
+    try:
+        headers = dict(scope['headers'])
+
+        # Admission control sama dengan hook Flask: rate limit per klien, lalu tolak saat antrean penuh
+        pool = main.admission_pools.get('inference')
+        if pool is not None:
+            try:
+                pool.check_rate(_client(scope, headers))
+                if _slots().locked():
+                    raise pool.overloaded()
+            except Rejected as e:
+                logging.warning(f"Rejected POST /predict (inference): {e.status} {e.message}")
+                return await _send_json(send, {'error': e.message}, e.status,
+                                        [(b'retry-after', str(e.retry_after).encode('ascii'))])
+
+        if not _is_json(headers):
+            return await _send_json(send, {'error': 'Request must be JSON'}, 400)
+
+        try:
+            body = await _read_body(receive)
+        except ValueError as e:
+            return await _send_json(send, {'error': str(e)}, 413)
+        if body is None:
+            return
+
+        try:
+            with metrics.stage('/predict', 'parse'):
+                data = main.app.json.loads(body)
+        except ValueError:
+            return await _send_json(send, {'error': 'Request body is not valid JSON'}, 400)
+
+        async with _slots():
+            loop = asyncio.get_running_loop()
+            result, status = await loop.run_in_executor(inference_executor, main.run_prediction, data)
+        with metrics.stage('/predict', 'serialize'):
+            return await _send_json(send, result, status)
+
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}")
+        return await _send_json(send, {'error': f'Unexpected error: {str(e)}'}, 500)
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] == '/predict' and scope['method'] == 'POST':
+        if not metrics.enabled:
+            return await predict(scope, receive, send)
+
+        # /predict tidak melewati hook Flask, jadi metrik request dicatat di sini
+        started = time.perf_counter()
+        metrics.IN_FLIGHT.inc('/predict')
+        try:
+            status = await predict(scope, receive, send)
+        finally:
+            metrics.IN_FLIGHT.dec('/predict')
+        if status is not None:  # None: klien memutus koneksi sebelum body selesai dikirim
+            metrics.record_request('/predict', 'POST', status, time.perf_counter() - started)
+    else:
+        await flask_app(scope, receive, send)
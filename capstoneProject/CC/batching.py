@@ -0,0 +1,119 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class MicroBatcher:
+    # Mengumpulkan request /predict yang datang dalam jendela waktu singkat menjadi
+    # satu matriks, menjalankan satu inferensi, lalu mengembalikan hasil per request.
+    def __init__(self, run_batch, max_batch_size=32, window_ms=2.0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if window_ms < 0:
+            raise ValueError("window_ms must not be negative")
+
+        # fungsi: (matriks fitur mentah (n, 3), key) -> probabilitas (n, k); row dengan key
+        # berbeda (misalnya versi model yang berbeda saat hot reload) tidak pernah dicampur
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000.0
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._start()
+
+    def _start(self):
+        # Thread worker tidak ikut tersalin saat proses di-fork (gunicorn dengan preload_app),
+        # jadi setiap proses memulai queue, thread, dan statistiknya sendiri
+        self._pid = os.getpid()
+        self._queue = queue.Queue()
+        self._batches = 0
+        self._requests = 0
+        self._batch_sizes = {}
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+
+        self._thread = threading.Thread(target=self._worker, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, row, key=None):
+        # row: vektor fitur float. Pemanggil mengonversi input sebelum submit, karena satu row yang
+        # tidak bisa dikonversi di dalam matriks batch akan menggagalkan semua request di batch itu.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._start()
+
+        # Blok sampai batch yang memuat row ini selesai dijalankan
+        future = Future()
+        self._queue.put((row, time.perf_counter(), future, key))
+        return future.result()
+
+    def _collect(self):
+        first = self._queue.get()
+        batch = [first]
+        deadline = first[1] + self.window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            # Biasanya semua row punya key yang sama; urutan kemunculan key dipertahankan
+            groups = {}
+            for item in batch:
+                groups.setdefault(id(item[3]), []).append(item)
+            for group in groups.values():
+                self._run_group(group)
+
+            self._record(batch, started)
+
+    def _run_group(self, group):
+        try:
+            matrix = np.array([row for row, _, _, _ in group], dtype=np.float64)
+            predictions = np.asarray(self.run_batch(matrix, group[0][3]))
+        except Exception as e:
+            logging.error(f"Error in micro-batch of {len(group)} requests: {e}")
+            for _, _, future, _ in group:
+                future.set_exception(e)
+        else:
+            for i, (_, _, future, _) in enumerate(group):
+                future.set_result(predictions[i])
+
+    def _record(self, batch, started):
+        waits = [started - enqueued for _, enqueued, _, _ in batch]
+        with self._lock:
+            self._batches += 1
+            self._requests += len(batch)
+            self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+            self._wait_sum += sum(waits)
+            self._wait_max = max(self._wait_max, max(waits))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'window_ms': self.window * 1000.0,
+                'max_batch_size': self.max_batch_size,
+                'batches': self._batches,
+                'requests': self._requests,
+                'avg_batch_size': self._requests / self._batches if self._batches else 0.0,
+                'batch_size_counts': dict(sorted(self._batch_sizes.items())),
+                'avg_queue_wait_ms': self._wait_sum / self._requests * 1000.0 if self._requests else 0.0,
+                'max_queue_wait_ms': self._wait_max * 1000.0,
+                'queue_depth': self._queue.qsize(),
+            }
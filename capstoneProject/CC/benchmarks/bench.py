@@ -0,0 +1,403 @@
+# Benchmark untuk jalur utama API. Jalankan dari direktori CC/:
+#
+#   python benchmarks/bench.py run                           # microbenchmark + HTTP lewat Flask test client
+#   python benchmarks/bench.py run --launch                  # HTTP ke server gunicorn lokal yang dijalankan otomatis
+#   python benchmarks/bench.py run --url http://127.0.0.1:8080
+#   python benchmarks/bench.py compare benchmarks/baseline.json benchmarks/results/latest.json
+import argparse
+import csv
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import numpy as np
+
+CC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CC_DIR)
+
+DEFAULT_DATASET = os.path.join(CC_DIR, '..', 'ML', 'dataset', 'data_balita.csv')
+DEFAULT_OUTPUT = os.path.join(CC_DIR, 'benchmarks', 'results', 'latest.json')
+DEFAULT_CONCURRENCY = (1, 4, 16)
+GENDER_CODES = {'laki-laki': 1, 'perempuan': 0}
+
+# Metrik yang dibandingkan pada mode compare: nama -> True jika nilai lebih besar lebih baik
+COMPARED_METRICS = {
+    'median_us': False,
+    'p95_us': False,
+    'throughput_rps': True,
+    'p50_ms': False,
+    'p99_ms': False,
+}
+
+logging.basicConfig(level=logging.INFO)
+
+
+def load_payloads(path, count, seed):
+    # Ambil sampel baris dataset secara deterministik dan ubah menjadi body /predict
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    sample = random.Random(seed).sample(rows, min(count, len(rows)))
+    return [{
+        'umur': int(row['Umur (bulan)']),
+        'jenis_kelamin': GENDER_CODES[row['Jenis Kelamin']],
+        'tinggi_badan': float(row['Tinggi Badan (cm)']),
+    } for row in sample]
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def time_call(fn, repeat, warmup=20):
+    # Waktu per panggilan dalam mikrodetik
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    return {
+        'calls': repeat,
+        'median_us': statistics.median(samples),
+        'p95_us': _percentile(samples, 95),
+        'mean_us': statistics.fmean(samples),
+    }
+
+
+def run_microbenchmarks(payloads, repeat):
+    from flask.json.provider import DefaultJSONProvider
+
+    import main
+
+    bundle = main.model_manager.active
+    rows = np.array([[p['umur'], p['jenis_kelamin'], p['tinggi_badan']] for p in payloads], dtype=np.float64)
+    row = rows[0]
+    scaled_rows = bundle.scaler.transform(rows)
+    scaled_row = scaled_rows[:1]
+    result, _ = main.run_prediction(payloads[0])
+    # Respons yang sama untuk provider JSON bawaan Flask (modul json standar, probabilitas lewat .tolist())
+    stdlib_json = DefaultJSONProvider(main.app)
+    stdlib_result = {**result, 'prediction_probability': np.asarray(result['prediction_probability']).tolist()}
+    body = json.dumps(payloads[0]).encode('utf-8')
+    batch_repeat = max(10, repeat // 20)
+
+    with main.app.app_context():
+        benchmarks = {
+            'scale_row': (lambda: bundle.scaler.transform_row(*row), repeat),
+            'scale_batch': (lambda: bundle.scaler.transform(rows), batch_repeat),
+            'inference_row': (lambda: bundle.model.predict(scaled_row), repeat),
+            'inference_batch': (lambda: bundle.model.predict_on_batch(scaled_rows), batch_repeat),
+            'parse_request': (lambda: main.app.json.loads(body), repeat),
+            'parse_request_stdlib': (lambda: stdlib_json.loads(body), repeat),
+            'validate_request': (lambda: main.validate_features(payloads[0]), repeat),
+            'serialize_response': (lambda: main.app.json.response(result), repeat),
+            'serialize_response_stdlib': (lambda: stdlib_json.response(stdlib_result), repeat),
+            'run_prediction': (lambda: main.run_prediction(payloads[0]), repeat),
+        }
+        results = {}
+        for name, (fn, calls) in benchmarks.items():
+            results[f'micro/{name}'] = time_call(fn, calls)
+            logging.info(f"micro/{name}: median {results[f'micro/{name}']['median_us']:.1f} us")
+    results['micro/scale_batch']['rows'] = len(rows)
+    results['micro/inference_batch']['rows'] = len(rows)
+    return results
+
+
+class TestClientTarget:
+    # Request langsung ke aplikasi Flask tanpa socket; satu test client per thread
+    name = 'testclient'
+
+    def __init__(self):
+        import main
+        self.app = main.app
+        self._local = threading.local()
+
+    def request(self, method, path, payload=None):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=payload)
+        response.get_data()
+        return response.status_code
+
+
+class HttpTarget:
+    # Request HTTP/1.1 keep-alive ke server yang sedang berjalan; satu koneksi per thread
+    name = 'http'
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self._local = threading.local()
+
+    def request(self, method, path, payload=None):
+        body = None if payload is None else json.dumps(payload)
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        for attempt in range(2):
+            connection = getattr(self._local, 'connection', None)
+            if connection is None:
+                connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                return response.status
+            except (http.client.HTTPException, OSError):
+                # Koneksi ditutup server (misalnya worker restart): buka ulang sekali
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+
+
+def _scenarios(payloads, article_ids):
+    return {
+        'predict': lambda i: ('POST', '/predict', payloads[i % len(payloads)]),
+        'articles': lambda i: ('GET', '/articles', None),
+        'article_detail': lambda i: ('GET', f'/articles/{article_ids[i % len(article_ids)]}', None),
+    }
+
+
+def run_load(target, make_request, concurrency, requests_per_level, warmup):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    counter = iter(range(warmup, warmup + requests_per_level))
+    counter_lock = threading.Lock()
+
+    def next_index():
+        with counter_lock:
+            return next(counter, None)
+
+    def worker():
+        nonlocal errors
+        local_latencies = []
+        local_errors = 0
+        while True:
+            i = next_index()
+            if i is None:
+                break
+            method, path, payload = make_request(i)
+            started = time.perf_counter()
+            try:
+                status = target.request(method, path, payload)
+            except Exception:
+                status = None
+            local_latencies.append(time.perf_counter() - started)
+            if status is None or status >= 400:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    # Warmup tidak diukur: memanaskan cache, koneksi, dan jalur kode sebelum pengukuran
+    for i in range(warmup):
+        target.request(*make_request(i))
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies_ms = sorted(latency * 1000.0 for latency in latencies)
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies_ms),
+        'errors': errors,
+        'throughput_rps': len(latencies_ms) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies_ms, 50),
+        'p90_ms': _percentile(latencies_ms, 90),
+        'p99_ms': _percentile(latencies_ms, 99),
+        'max_ms': latencies_ms[-1] if latencies_ms else 0.0,
+    }
+
+
+def run_http_benchmarks(target, payloads, concurrency_levels, requests_per_level, warmup):
+    from articles import ARTICLES
+
+    article_ids = [article['id'] for article in ARTICLES]
+    results = {}
+    for scenario, make_request in _scenarios(payloads, article_ids).items():
+        for concurrency in concurrency_levels:
+            name = f'{target.name}/{scenario}/c{concurrency}'
+            results[name] = run_load(target, make_request, concurrency, requests_per_level, warmup)
+            logging.info(f"{name}: {results[name]['throughput_rps']:.0f} req/s, "
+                         f"p50 {results[name]['p50_ms']:.2f} ms, p99 {results[name]['p99_ms']:.2f} ms, "
+                         f"{results[name]['errors']} errors")
+    return results
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def launch_server(timeout=120):
+    # Menjalankan gunicorn dengan konfigurasi produksi pada port bebas, menunggu sampai siap
+    port = _free_port()
+    env = dict(os.environ, PORT=str(port))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}',
+         '--access-logfile', os.devnull, 'wsgi:app'],
+        cwd=CC_DIR, env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before becoming ready")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/')
+            if connection.getresponse().status == 200:
+                connection.close()
+                return process, f'http://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"Server did not become ready within {timeout} seconds")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=CC_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    payloads = load_payloads(args.dataset, args.payloads, args.seed)
+    concurrency_levels = [int(level) for level in args.concurrency.split(',')]
+    results = {}
+
+    server = None
+    try:
+        if not args.skip_micro:
+            results.update(run_microbenchmarks(payloads, args.repeat))
+
+        if args.launch:
+            server, url = launch_server()
+            target = HttpTarget(url)
+        elif args.url:
+            target = HttpTarget(args.url)
+        else:
+            target = TestClientTarget()
+        if not args.skip_http:
+            results.update(run_http_benchmarks(target, payloads, concurrency_levels, args.requests, args.warmup))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report = {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'target': 'server' if (args.launch or args.url) else 'testclient',
+            'seed': args.seed,
+            'env': {key: os.environ[key] for key in sorted(os.environ)
+                    if key.startswith(('INFERENCE_', 'MICROBATCH_', 'THRESHOLD_TABLE_', 'METRICS_', 'ADMISSION_',
+                                       'WEB_CONCURRENCY', 'GUNICORN_'))},
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logging.info(f"Benchmark results saved to {args.output}")
+
+
+def compare(baseline, current, threshold):
+    # Mengembalikan list (nama, metrik, nilai baseline, nilai sekarang, perubahan relatif, regresi?)
+    rows = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old = baseline['results'][name].get(metric)
+            new = current['results'][name].get(metric)
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            regression = (-change if higher_is_better else change) > threshold
+            rows.append((name, metric, old, new, change, regression))
+    return rows
+
+
+def run_compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    # Hasil hanya sebanding jika dijalankan di mesin, target, dan konfigurasi yang sama
+    for key in ('platform', 'cpu_count', 'target', 'env'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print(f"Warning: {key} differs (baseline {baseline['meta'].get(key)}, current {current['meta'].get(key)})")
+
+    rows = compare(baseline, current, args.threshold)
+    regressions = [row for row in rows if row[5]]
+    for name, metric, old, new, change, regression in rows:
+        flag = 'REGRESSION' if regression else ''
+        print(f"{name:40} {metric:15} {old:12.3f} -> {new:12.3f} {change:+8.1%} {flag}")
+
+    missing = sorted(set(baseline['results']) - set(current['results']))
+    if missing:
+        print(f"Missing from current run: {', '.join(missing)}")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} "
+          f"(baseline {baseline['meta'].get('commit')}, current {current['meta'].get('commit')})")
+    raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the StuntTrack API hot paths')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='run the benchmarks and save the results as JSON')
+    run_parser.add_argument('--dataset', default=DEFAULT_DATASET)
+    run_parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--payloads', type=int, default=1000, help='number of dataset rows used as payloads')
+    run_parser.add_argument('--repeat', type=int, default=2000, help='calls per microbenchmark')
+    run_parser.add_argument('--concurrency', default=','.join(map(str, DEFAULT_CONCURRENCY)))
+    run_parser.add_argument('--requests', type=int, default=2000, help='measured requests per concurrency level')
+    run_parser.add_argument('--warmup', type=int, default=100)
+    run_parser.add_argument('--url', help='benchmark an already running server instead of the test client')
+    run_parser.add_argument('--launch', action='store_true', help='start a local gunicorn server to benchmark')
+    run_parser.add_argument('--skip-micro', action='store_true')
+    run_parser.add_argument('--skip-http', action='store_true')
+
+    compare_parser = subparsers.add_parser('compare', help='compare a run against a stored baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='relative slowdown that counts as a regression (default 0.10)')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        args.dataset, args.output = os.path.abspath(args.dataset), os.path.abspath(args.output)
+        os.chdir(CC_DIR)  # main.py memuat model dengan path relatif terhadap CC/
+        run(args)
+    else:
+        run_compare(args)
@@ -0,0 +1,232 @@
+# Skoring massal file CSV register balita tanpa lewat HTTP. Jalankan dari direktori CC/:
+#
+#   python bulk_score.py ../ML/dataset/data_balita.csv hasil.csv
+#   python bulk_score.py register.csv hasil.parquet --workers 8 --chunk-size 50000
+#
+# File dibaca per chunk, setiap chunk dinormalisasi dan diprediksi di process pool, dan hasilnya
+# ditulis berurutan sehingga memori tetap datar dan output selalu sama untuk input yang sama.
+import argparse
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional, hanya dibutuhkan untuk output Parquet
+    pa = pq = None
+
+DEFAULT_CLASSES = ['severely_stunted', 'stunted', 'normal', 'tinggi']
+HFA_CLASSES = DEFAULT_CLASSES  # kelas z-score tinggi badan menurut umur (height_for_age.py)
+
+# Nama kolom fitur yang dikenali: dataset mentah, dataset yang sudah dibalance, dan body /predict
+FEATURE_COLUMNS = (
+    ('Umur (bulan)', 'Jenis Kelamin', 'Tinggi Badan (cm)'),
+    ('Umur', 'Jenis_Kelamin', 'Tinggi_Badan'),
+    ('umur', 'jenis_kelamin', 'tinggi_badan'),
+)
+
+# Encoding jenis kelamin seperti pada notebook data_stunting
+GENDER_CODES = {'laki-laki': 1, 'perempuan': 0}
+
+_bundle = None
+
+
+def _init_worker(*pipeline_args):
+    # pipeline_args: argumen inference.load_bundle, sehingga backend dipilih dan dimuat sama seperti server
+    global _bundle
+    from inference import load_bundle
+
+    _bundle = load_bundle(*pipeline_args)
+
+
+def _score_chunk(rows):
+    if not len(rows):
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray(_bundle.score(rows), dtype=np.float32)
+
+
+def find_feature_columns(columns):
+    for names in FEATURE_COLUMNS:
+        if all(name in columns for name in names):
+            return names
+    raise ValueError(f"Input has none of the expected feature columns: "
+                     f"{'; '.join(', '.join(names) for names in FEATURE_COLUMNS)}")
+
+
+def encode_features(chunk, names):
+    # Mengembalikan (matriks fitur (n, 3), mask baris yang valid)
+    umur, jenis_kelamin, tinggi_badan = names
+    sex = chunk[jenis_kelamin]
+    if not pd.api.types.is_numeric_dtype(sex):
+        # Label teks di-encode, nilai yang sudah berupa angka (misal '1') tetap dipakai
+        encoded = sex.map(GENDER_CODES)
+        sex = encoded.where(encoded.notna(), pd.to_numeric(sex, errors='coerce'))
+    matrix = np.column_stack([
+        pd.to_numeric(chunk[umur], errors='coerce').to_numpy(dtype=np.float64),
+        pd.to_numeric(sex, errors='coerce').to_numpy(dtype=np.float64),
+        pd.to_numeric(chunk[tinggi_badan], errors='coerce').to_numpy(dtype=np.float64),
+    ])
+    return matrix, np.isfinite(matrix).all(axis=1)
+
+
+def attach_predictions(chunk, valid, predictions, classes, height_for_age=None):
+    # Baris yang tidak valid (fitur kosong / jenis kelamin tidak dikenal) mendapat kelas kosong
+    result = chunk.copy()
+    predicted_class = np.full(len(chunk), None, dtype=object)
+    probabilities = np.full((len(chunk), len(classes)), np.nan, dtype=np.float32)
+    if len(predictions):
+        predicted_class[valid] = np.asarray(classes, dtype=object)[predictions.argmax(axis=1)]
+        probabilities[valid] = predictions
+    result['predicted_class'] = predicted_class
+    for i, name in enumerate(classes):
+        result[f'prob_{name}'] = probabilities[:, i]
+    if height_for_age is not None:
+        # (matriks fitur, HeightForAge): z-score WHO, persentil, dan kelasnya; kosong di luar umur 0-60 bulan
+        matrix, reference = height_for_age
+        z, percentile, band = reference.score(matrix)
+        result['hfa_z_score'] = z
+        result['hfa_percentile'] = percentile
+        result['hfa_status'] = np.where(band >= 0, np.asarray(HFA_CLASSES, dtype=object)[band], None)
+    return result
+
+
+class CsvWriter:
+    def __init__(self, path):
+        self.path = path
+        self._header = True
+
+    def write(self, frame):
+        frame.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+        self._header = False
+
+    def close(self):
+        if self._header:  # input kosong: tetap tulis file kosong
+            open(self.path, 'w').close()
+
+
+class ParquetWriter:
+    def __init__(self, path, classes):
+        if pq is None:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+        self.path = path
+        self.classes = classes
+        self._writer = None
+
+    def schema(self, columns):
+        # Skema ditentukan dari nama kolom, bukan dari isi chunk pertama: chunk yang semua barisnya tidak
+        # valid (predicted_class kosong) atau di luar umur 0-60 bulan (kolom hfa kosong) tetap bertipe benar
+        types = {'predicted_class': pa.string(), 'hfa_z_score': pa.float64(), 'hfa_percentile': pa.float64(),
+                 'hfa_status': pa.string()}
+        types.update((f'prob_{name}', pa.float32()) for name in self.classes)
+        # Kolom input dibaca sebagai teks (lihat score_file) dan ditulis apa adanya
+        return pa.schema([(name, types.get(name, pa.string())) for name in columns])
+
+    def write(self, frame):
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, self.schema(frame.columns))
+        table = pa.Table.from_pandas(frame, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(path, classes, output_format=None):
+    output_format = output_format or ('parquet' if path.endswith(('.parquet', '.pq')) else 'csv')
+    if output_format == 'parquet':
+        return ParquetWriter(path, classes)
+    if output_format == 'csv':
+        return CsvWriter(path)
+    raise ValueError(f"Unknown output format: {output_format}")
+
+
+def score_file(input_path, output_path, pipeline_args, workers=None, chunk_size=20000, output_format=None,
+               height_for_age=None):
+    from inference import load_bundle
+
+    workers = workers or os.cpu_count() or 1
+    classes = load_bundle(*pipeline_args).classes
+
+    # Setiap worker menjalankan BLAS dengan satu thread agar tidak saling berebut core
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ.setdefault(variable, '1')
+
+    writer = open_writer(output_path, classes, output_format)
+    pending = deque()  # (chunk, matriks fitur, mask valid, future), urut sesuai posisi di file
+    rows = 0
+    invalid = 0
+    started = time.perf_counter()
+
+    def flush_one():
+        nonlocal rows, invalid
+        chunk, matrix, valid, future = pending.popleft()
+        writer.write(attach_predictions(chunk, valid, future.result(), classes,
+                                        (matrix, height_for_age) if height_for_age is not None else None))
+        rows += len(chunk)
+        invalid += int((~valid).sum())
+
+    # spawn: TensorFlow (backend keras) tidak aman di-fork
+    context = multiprocessing.get_context('spawn')
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=pipeline_args) as executor:
+            names = None
+            # Kolom input dibaca sebagai teks sehingga nilainya ditulis ulang persis seperti di file input,
+            # dengan tipe yang sama di setiap chunk; fitur dikonversi ke angka di encode_features
+            for chunk in pd.read_csv(input_path, chunksize=chunk_size, dtype=str):
+                if names is None:
+                    names = find_feature_columns(chunk.columns)
+                matrix, valid = encode_features(chunk, names)
+                pending.append((chunk, matrix, valid, executor.submit(_score_chunk, matrix[valid])))
+                # Paling banyak dua chunk per worker yang menunggu, sisanya belum dibaca dari disk
+                while len(pending) > 2 * workers:
+                    flush_one()
+            while pending:
+                flush_one()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    return {'rows': rows, 'invalid_rows': invalid, 'seconds': elapsed,
+            'rows_per_second': rows / elapsed if elapsed else 0.0}
+
+
+if __name__ == '__main__':
+    from inference import BACKENDS, resolve_backend
+    from height_for_age import HeightForAge
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Score a CSV register with the server model, chunk by chunk')
+    parser.add_argument('input')
+    parser.add_argument('output', help='output file (.csv, or .parquet/.pq for Parquet)')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=None)
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--chunk-size', type=int, default=20000)
+    parser.add_argument('--model', default='model/mlp_model.h5')
+    parser.add_argument('--scaler', default='model/scaler.pkl')
+    parser.add_argument('--scaler-params', default='model/scaler.npz')
+    parser.add_argument('--artifact', default=os.environ.get('MODEL_ARTIFACT_PATH', 'model/model.stm'))
+    parser.add_argument('--tflite', default=os.environ.get('TFLITE_MODEL_PATH', 'model/model.tflite'))
+    parser.add_argument('--backend', choices=BACKENDS, default=None,
+                        help='inference backend (default: INFERENCE_BACKEND, or as the server)')
+    parser.add_argument('--no-height-for-age', action='store_true', help='skip the WHO height-for-age z-score columns')
+    args = parser.parse_args()
+
+    backend = args.backend or resolve_backend(args.artifact)
+    if backend not in BACKENDS:
+        parser.error(f"INFERENCE_BACKEND={backend} is not a known backend (choose from {', '.join(BACKENDS)})")
+    pipeline_args = (backend, args.model, args.scaler, args.scaler_params, args.artifact, args.tflite)
+    report = score_file(args.input, args.output, pipeline_args,
+                        workers=args.workers, chunk_size=args.chunk_size, output_format=args.format,
+                        height_for_age=None if args.no_height_for_age else HeightForAge())
+    logging.info(f"Scored {report['rows']} rows ({report['invalid_rows']} invalid) in {report['seconds']:.1f} s "
+                 f"({report['rows_per_second']:.0f} rows/s), written to {args.output}")
@@ -0,0 +1,88 @@
+# Konfigurasi gunicorn untuk produksi:
+#   gunicorn -c gunicorn.conf.py wsgi:app                                   (WSGI, thread)
+#   gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker asgi:app  (ASGI, async)
+import gc
+import glob
+import math
+import os
+import tempfile
+
+from inference import resolve_backend
+
+
+def cpu_count():
+    # Jumlah CPU yang benar-benar tersedia untuk container (kuota cgroup pada Cloud Run)
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 9898)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Worker yang macet (misalnya di inferensi atau saat mengunduh gambar artikel) di-restart setelah
+# sekian detik tanpa heartbeat; sama dengan batas waktu request Cloud Run. 0 mematikan deteksi ini.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+
+# Model dimuat sekali di proses master sebelum fork sehingga halaman memorinya dibagi
+# copy-on-write oleh semua worker (artefak model di-mmap, jadi bobotnya dibagi langsung oleh OS).
+# TensorFlow tidak aman dipakai setelah fork, jadi backend keras dan tflite (interpreter punya
+# thread pool sendiri) memuat model di setiap worker.
+preload_app = resolve_backend(os.environ.get('MODEL_ARTIFACT_PATH', 'model/model.stm')) not in ('keras', 'tflite')
+
+accesslog = '-'
+errorlog = '-'
+
+# /metrics menggabungkan metrik semua worker lewat snapshot di direktori sementara milik server ini
+# (lihat metrics.py); diatur sebelum aplikasi dimuat agar worker mewarisinya
+if not os.environ.get('METRICS_MULTIPROC_DIR'):
+    os.environ['METRICS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='stunttrack-metrics-')
+
+
+def on_starting(server):
+    # Snapshot dari server sebelumnya (jika METRICS_MULTIPROC_DIR diatur sendiri) tidak ikut dihitung
+    for path in glob.glob(os.path.join(os.environ['METRICS_MULTIPROC_DIR'], '*.json')):
+        os.remove(path)
+
+
+def when_ready(server):
+    # Pindahkan objek yang sudah dimuat ke generasi permanen agar garbage collector di worker
+    # tidak menyentuh (dan menyalin) halaman memori yang dibagi dari master
+    if preload_app:
+        gc.collect()
+        gc.freeze()
+    server.log.info(f"Serving with {workers} workers x {threads} threads (preload_app={preload_app}).")
+
+
+def post_worker_init(worker):
+    # Setiap worker mengikuti CURRENT di registry model sendiri (watcher) dan memuat ulang saat
+    # menerima SIGHUP (`kill -HUP <pid worker>`); SIGHUP ke master tetap me-restart semua worker
+    import main
+    import metrics
+
+    main.start_model_reloading()
+    metrics.registry.start_sync(float(os.environ.get('METRICS_SYNC_SECONDS', 2)))
+
+
+def worker_exit(server, worker):
+    # Snapshot terakhir agar request yang dilayani sejak sinkronisasi terakhir tetap terhitung
+    import metrics
+
+    if metrics.registry.directory is not None:
+        metrics.registry.write_snapshot()
+
+
+def child_exit(server, worker):
+    import metrics
+
+    metrics.mark_process_dead(worker.pid)
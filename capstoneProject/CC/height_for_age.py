@@ -0,0 +1,167 @@
+# Z-score tinggi badan menurut umur (TB/U) dari standar pertumbuhan WHO, dihitung langsung dari
+# parameter LMS (reference/who_lhfa_lms.csv) tanpa model:
+#
+#   z = ((tinggi / M) ** L - 1) / (L * S)          (L != 0)
+#   z = ln(tinggi / M) / S                         (L == 0)
+#
+#   python height_for_age.py 24 1 80               # z-score satu anak
+#   python height_for_age.py --verify ../ML/dataset/data_balita.csv
+import argparse
+import csv
+import json
+import math
+import os
+
+import numpy as np
+
+try:
+    from scipy.special import ndtr
+except ImportError:  # scipy opsional; tanpa scipy CDF normal dihitung dengan math.erfc per elemen
+    ndtr = None
+
+REFERENCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reference', 'who_lhfa_lms.csv')
+
+# Tabel WHO mencakup umur 0-60 bulan; sebelum 24 bulan panjang badan diukur berbaring (length),
+# mulai 24 bulan tinggi badan diukur berdiri (height)
+MAX_MONTH = 60
+HEIGHT_FROM_MONTH = 24
+
+# Kelas dari z-score, urutannya sama dengan kelas model
+CLASSES = ['severely_stunted', 'stunted', 'normal', 'tinggi']
+
+
+def _normal_cdf(z):
+    if ndtr is not None:
+        return ndtr(z)
+    return np.frompyfunc(lambda v: 0.5 * math.erfc(-v / math.sqrt(2.0)), 1, 1)(z).astype(np.float64)
+
+
+def band_index(z):
+    # z < -3: severely_stunted, -3 <= z < -2: stunted, -2 <= z <= 3: normal, z > 3: tinggi
+    return (z >= -3.0) * 1 + (z >= -2.0) + (z > 3.0)
+
+
+class HeightForAge:
+    # Indeks LMS yang sudah dihitung sebelumnya: untuk setiap (jenis kelamin, bulan) disimpan
+    # parameter bulan itu dan bulan berikutnya dengan cara ukur yang sama, sehingga umur pecahan
+    # cukup diinterpolasi linear dengan satu indexing array, tanpa pencarian per baris.
+    def __init__(self, path=REFERENCE_PATH):
+        with open(path, newline='') as f:
+            table = list(csv.DictReader(line for line in f if not line.startswith('#')))
+        lms = {}
+        for row in table:
+            lms[(int(row['jenis_kelamin']), str(row['measurement']), int(row['month']))] = (
+                float(row['L']), float(row['M']), float(row['S']))
+
+        # lower[sex, month] = LMS bulan itu, upper[sex, month] = LMS bulan berikutnya
+        self.lower = np.empty((2, MAX_MONTH + 1, 3), dtype=np.float64)
+        self.upper = np.empty((2, MAX_MONTH + 1, 3), dtype=np.float64)
+        for sex in (0, 1):
+            for month in range(MAX_MONTH + 1):
+                measurement = 'height' if month >= HEIGHT_FROM_MONTH else 'length'
+                self.lower[sex, month] = lms[(sex, measurement, month)]
+                self.upper[sex, month] = lms[(sex, measurement, min(month + 1, MAX_MONTH))]
+        self._rows = self.lower.tolist()
+        self._next_rows = self.upper.tolist()
+        self.path = path
+
+    def lms(self, umur, jenis_kelamin):
+        # Parameter (L, M, S) untuk array umur (bulan) dan jenis kelamin; NaN di luar domain tabel
+        umur = np.asarray(umur, dtype=np.float64)
+        sex = np.asarray(jenis_kelamin, dtype=np.float64)
+        umur, sex = np.broadcast_arrays(umur, sex)
+        valid = (umur >= 0) & (umur <= MAX_MONTH) & ((sex == 0) | (sex == 1))
+
+        month = np.where(valid, np.floor(umur), 0).astype(np.intp)
+        sex_index = np.where(valid, sex, 0).astype(np.intp)
+        frac = (np.where(valid, umur, 0) - month)[..., None]
+        lms = self.lower[sex_index, month] * (1 - frac) + self.upper[sex_index, month] * frac
+        lms[~valid] = np.nan
+        return lms
+
+    def z_scores(self, umur, jenis_kelamin, tinggi_badan):
+        lms = self.lms(umur, jenis_kelamin)
+        L, M, S = lms[..., 0], lms[..., 1], lms[..., 2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.asarray(tinggi_badan, dtype=np.float64) / M
+            z = np.where(L == 0, np.log(ratio) / S, (np.power(ratio, L) - 1) / (L * S))
+        z[~(ratio > 0)] = np.nan
+        return z
+
+    def score(self, rows):
+        # rows: matriks (n, 3) [umur, jenis_kelamin, tinggi_badan] seperti input model.
+        # Mengembalikan (z-score, persentil 0-100, indeks kelas); baris di luar domain mendapat NaN / -1.
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+        z = self.z_scores(rows[:, 0], rows[:, 1], rows[:, 2])
+        valid = np.isfinite(z)
+        percentile = np.where(valid, _normal_cdf(np.where(valid, z, 0)) * 100.0, np.nan)
+        band = np.where(valid, band_index(np.where(valid, z, 0)), -1)
+        return z, percentile, band
+
+    def score_row(self, umur, jenis_kelamin, tinggi_badan):
+        # Jalur satu baris untuk /predict dengan float Python; hasil sama dengan score()
+        if (isinstance(jenis_kelamin, bool) or jenis_kelamin not in (0, 1)
+                or not isinstance(umur, (int, float)) or not isinstance(tinggi_badan, (int, float))
+                or not 0 <= umur <= MAX_MONTH or not tinggi_badan > 0):
+            return None
+        month = int(umur)
+        frac = umur - month
+        lower = self._rows[int(jenis_kelamin)][month]
+        upper = self._next_rows[int(jenis_kelamin)][month]
+        L, M, S = (a * (1 - frac) + b * frac for a, b in zip(lower, upper))
+        if L == 0:
+            z = math.log(tinggi_badan / M) / S
+        else:
+            z = ((tinggi_badan / M) ** L - 1) / (L * S)
+        if not math.isfinite(z):
+            return None
+        return z, 0.5 * math.erfc(-z / math.sqrt(2.0)) * 100.0, int(band_index(z))
+
+
+def describe(result):
+    # Bentuk JSON satu hasil score_row (None di luar domain tabel WHO)
+    if result is None:
+        return None
+    z, percentile, band = result
+    return {'z_score': round(z, 3), 'percentile': round(percentile, 2), 'status': CLASSES[band]}
+
+
+def describe_many(z, percentile, band):
+    # Versi array dari describe() untuk /predict/batch dan /predict/stream
+    z = np.round(z, 3).tolist()
+    percentile = np.round(percentile, 2).tolist()
+    return [None if b < 0 else {'z_score': zi, 'percentile': pi, 'status': CLASSES[b]}
+            for zi, pi, b in zip(z, percentile, band.tolist())]
+
+
+def verify(reference, dataset_path):
+    # Bandingkan kelas dari z-score WHO dengan label Status Gizi di dataset mentah
+    import pandas as pd
+
+    dataset = pd.read_csv(dataset_path)
+    sex = dataset['Jenis Kelamin'].map({'laki-laki': 1, 'perempuan': 0})
+    rows = np.column_stack([dataset['Umur (bulan)'], sex, dataset['Tinggi Badan (cm)']])
+    _, _, band = reference.score(rows)
+    labels = dataset['Status Gizi'].str.replace(' ', '_').to_numpy()
+    predicted = np.asarray(CLASSES, dtype=object)[band]
+    return {
+        'rows': int(len(dataset)),
+        'agreement': float((predicted == labels).mean()),
+        'per_class': {name: float((predicted[labels == name] == name).mean()) for name in CLASSES},
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='WHO height-for-age z-scores from the bundled LMS tables')
+    parser.add_argument('values', nargs='*', type=float, help='umur (months), jenis_kelamin (1/0), tinggi_badan (cm)')
+    parser.add_argument('--reference', default=REFERENCE_PATH)
+    parser.add_argument('--verify', metavar='DATASET', help='compare the z-score bands with the dataset labels')
+    args = parser.parse_args()
+
+    reference = HeightForAge(args.reference)
+    if args.verify:
+        print(json.dumps(verify(reference, args.verify), indent=2))
+    elif len(args.values) == 3:
+        print(json.dumps(describe(reference.score_row(*args.values)), indent=2))
+    else:
+        parser.error('expected umur, jenis_kelamin and tinggi_badan, or --verify DATASET')
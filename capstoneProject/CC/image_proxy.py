@@ -0,0 +1,320 @@
+# Proxy gambar artikel: gambar asli dari host pihak ketiga diunduh sekali, disimpan di disk, lalu
+# varian yang sudah diperkecil (WebP/JPEG) disimpan dan disajikan dengan header cache panjang.
+#
+#   GET /articles/<id>/image?w=480
+#
+# Cache di disk dibatasi ukurannya (LRU), dan request bersamaan untuk gambar yang sama hanya
+# memicu satu unduhan / satu resize.
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow opsional; tanpa Pillow gambar asli disajikan tanpa diperkecil
+    Image = ImageOps = None
+
+# Batas piksel gambar asli yang mau di-decode (sekitar 160 MB RGBA). Pillow sendiri baru melempar
+# DecompressionBombError di atas dua kali MAX_IMAGE_PIXELS, jadi resize() juga memeriksanya.
+MAX_IMAGE_PIXELS = 40_000_000
+if Image is not None:
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+
+# Error saat membaca atau memperkecil gambar asli; DecompressionBombError bukan turunan OSError
+IMAGE_ERRORS = (OSError,) if Image is None else (OSError, Image.DecompressionBombError)
+
+# Lebar varian yang disediakan; ?w= dibulatkan ke atas ke salah satu nilai ini agar jumlah
+# varian per gambar terbatas
+WIDTHS = (160, 320, 480, 640, 960, 1280)
+
+FORMATS = {'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+ORIGINAL_MIMETYPES = ('image/jpeg', 'image/png', 'image/webp', 'image/gif')
+
+
+class FetchError(Exception):
+    pass
+
+
+class UrlFetcher:
+    # Fetcher bawaan: unduh URL dengan urllib. Fetcher lain (misalnya server lokal untuk pengujian)
+    # cukup berupa callable url -> (bytes, content type) yang melempar FetchError jika gagal.
+    def __init__(self, timeout=10.0, max_bytes=10 * 1024 * 1024, user_agent='StuntTrack-ImageProxy/1.0'):
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.user_agent = user_agent
+
+    def __call__(self, url):
+        request = urllib.request.Request(url, headers={'User-Agent': self.user_agent, 'Accept': 'image/*'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read(self.max_bytes + 1)
+                content_type = response.headers.get_content_type()
+        except (OSError, ValueError) as e:
+            raise FetchError(f"Error fetching {url}: {e}") from e
+        if len(body) > self.max_bytes:
+            raise FetchError(f"Image at {url} exceeds {self.max_bytes} bytes")
+        return body, content_type
+
+
+class SingleFlight:
+    # Coalescing: selama fungsi untuk satu key sedang berjalan, pemanggil lain dengan key yang sama
+    # menunggu hasilnya (atau exception-nya) alih-alih menjalankan fungsi itu lagi
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = {'done': threading.Event(), 'result': None, 'error': None}
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = fn()
+            return call['result']
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['done'].set()
+
+
+class DiskCache:
+    # Cache file di satu direktori dengan batas total ukuran. Urutan LRU mengikuti mtime file (diperbarui
+    # setiap hit), sehingga sama untuk semua worker yang memakai direktori ini. Setiap worker menghitung
+    # total ukuran sendiri (file yang ia tulis dan yang ia baca); file yang ditulis worker lain baru
+    # terhitung setelah daftar file dibaca ulang dari direktori setiap `rescan_interval` detik, jadi total
+    # semua worker bisa melewati batas paling lama selama itu.
+    # Direktori baru dibuat saat dipakai pertama kali; file ditulis ke file sementara lalu di-rename.
+    def __init__(self, directory, max_bytes, rescan_interval=60.0):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # nama file -> ukuran
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._ready = False
+        self._scanned_at = 0.0
+
+    def _ensure_directory(self):
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    os.makedirs(self.directory, exist_ok=True)
+                    self._rescan()
+                    self._ready = True
+
+    def _rescan(self):
+        # Bangun ulang daftar file (urut mtime) dari direktori; dipanggil dengan _lock dipegang
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith('.tmp'):
+                    # Penulisan yang sedang berjalan di worker lain, atau sisa penulisan yang terputus
+                    if stat.st_mtime < time.time() - 3600:
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            pass
+                    continue
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        self._entries = OrderedDict((name, size) for _, name, size in sorted(files))
+        self._size = sum(self._entries.values())
+        self._scanned_at = time.monotonic()
+
+    @staticmethod
+    def name(key, extension):
+        return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.{extension}"
+
+    def get(self, name):
+        self._ensure_directory()
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:  # dihapus oleh worker lain
+            with self._lock:
+                self._misses += 1
+                if name in self._entries:
+                    self._size -= self._entries.pop(name)
+            return None
+        with self._lock:
+            self._hits += 1
+            if name in self._entries:
+                self._entries.move_to_end(name)
+            else:  # ditulis oleh worker lain
+                self._entries[name] = len(body)
+                self._size += len(body)
+        try:
+            os.utime(path)  # urutan LRU tetap terjaga setelah restart
+        except FileNotFoundError:
+            pass
+        return body
+
+    def put(self, name, body):
+        self._ensure_directory()
+        path = os.path.join(self.directory, name)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if time.monotonic() - self._scanned_at >= self.rescan_interval:
+                self._rescan()  # sudah mencakup file yang baru ditulis
+            else:
+                self._size += len(body) - self._entries.pop(name, 0)
+                self._entries[name] = len(body)
+            self._evict()
+
+    def _evict(self):
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        self._ensure_directory()
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+
+def choose_width(requested):
+    # Lebar varian terkecil yang >= lebar yang diminta (dibatasi lebar terbesar)
+    for width in WIDTHS:
+        if requested <= width:
+            return width
+    return WIDTHS[-1]
+
+
+def resize(original, width, image_format, quality):
+    # Perkecil (tidak pernah diperbesar) dengan rasio aspek tetap, lalu encode ke WebP/JPEG
+    with Image.open(io.BytesIO(original)) as image:
+        if image.width * image.height > MAX_IMAGE_PIXELS:
+            raise Image.DecompressionBombError(
+                f"Image size ({image.width * image.height} pixels) exceeds limit of {MAX_IMAGE_PIXELS} pixels")
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+
+        if image_format == 'jpeg':
+            if image.mode in ('RGBA', 'LA', 'P', 'PA'):
+                image = image.convert('RGBA')
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel('A'))
+                image = background
+            elif image.mode != 'RGB':
+                image = image.convert('RGB')
+            options = {'quality': quality, 'optimize': True, 'progressive': True}
+        else:
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if image.mode in ('LA', 'P', 'PA') else 'RGB')
+            options = {'quality': quality, 'method': 4}
+
+        out = io.BytesIO()
+        image.save(out, format=image_format.upper(), **options)
+        return out.getvalue()
+
+
+class ImageProxy:
+    def __init__(self, cache, fetcher=None, quality=80, failure_ttl=60.0):
+        self.cache = cache
+        self.fetcher = fetcher or UrlFetcher()
+        self.quality = quality
+        self.failure_ttl = failure_ttl  # origin yang gagal tidak dicoba lagi selama ini (detik)
+        self.resizing = Image is not None
+        self._flight = SingleFlight()
+        self._failures = {}
+        self._fetches = 0
+
+    def original(self, url):
+        # (bytes, content type) gambar asli; diunduh sekali lalu dibaca dari cache disk.
+        # File cache diawali content type asli dan satu baris baru.
+        name = self.cache.name(url, 'orig')
+        cached = self.cache.get(name)
+        if cached is not None:
+            content_type, _, body = cached.partition(b'\n')
+            return body, content_type.decode('ascii')
+
+        failure = self._failures.get(url)
+        if failure is not None and failure[0] > time.monotonic():
+            raise FetchError(failure[1])
+
+        def fetch():
+            started = time.perf_counter()
+            try:
+                body, content_type = self.fetcher(url)
+                if content_type not in ORIGINAL_MIMETYPES:
+                    raise FetchError(f"Unsupported image type {content_type} at {url}")
+            except FetchError as e:
+                self._failures[url] = (time.monotonic() + self.failure_ttl, str(e))
+                raise
+            self._failures.pop(url, None)
+            self._fetches += 1
+            self.cache.put(name, content_type.encode('ascii') + b'\n' + body)
+            logging.info(f"Fetched article image {url} ({len(body)} bytes, {time.perf_counter() - started:.2f} s)")
+            return body, content_type
+
+        return self._flight.do(('original', url), fetch)
+
+    def variant(self, url, width, image_format):
+        # (bytes, mimetype) varian dengan lebar `width` dalam format `image_format`
+        name = self.cache.name(f'{url}|{width}', image_format)
+        body = self.cache.get(name)
+        if body is not None:
+            return body, FORMATS[image_format]
+
+        def build():
+            original, _ = self.original(url)
+            body = resize(original, width, image_format, self.quality)
+            self.cache.put(name, body)
+            return body
+
+        return self._flight.do(('variant', name), build), FORMATS[image_format]
+
+    def get(self, url, width=None, accept_webp=False):
+        if width is None or not self.resizing:
+            return self.original(url)
+        return self.variant(url, choose_width(width), 'webp' if accept_webp else 'jpeg')
+
+    def stats(self):
+        return {**self.cache.stats(), 'fetches': self._fetches, 'coalesced': self._flight.coalesced,
+                'resizing': self.resizing}
@@ -0,0 +1,239 @@
+import argparse
+import json
+import logging
+import os
+
+import numpy as np
+
+# Backend inferensi yang didukung:
+# - 'keras' : memuat model lewat tf.keras (perilaku lama)
+# - 'numpy' : membaca bobot dari file .h5 dan menjalankan forward pass dengan NumPy,
+#             TensorFlow tidak pernah di-import di proses server
+# - 'artifact' : seperti 'numpy', tetapi bobot dan scaler dibaca dari artefak model (artifact.py)
+# - 'tflite' : interpreter TFLite (float atau int8) dari `python tflite_model.py convert` (tflite_model.py)
+BACKENDS = ('keras', 'numpy', 'artifact', 'tflite')
+
+# Kelas keluaran model (urutan kolom probabilitas) jika tidak dibaca dari artefak model
+CLASSES = ['severely_stunted', 'stunted', 'normal', 'tinggi']
+
+
+def _relu(x):
+    return np.maximum(x, 0, out=x)
+
+
+def _softmax(x):
+    # Sama seperti keras: kurangi nilai maksimum per baris agar exp() stabil
+    x -= x.max(axis=1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=1, keepdims=True)
+    return x
+
+
+def _linear(x):
+    return x
+
+
+ACTIVATIONS = {
+    'relu': _relu,
+    'softmax': _softmax,
+    'linear': _linear,
+}
+
+
+class NumpyMLP:
+    def __init__(self, layers):
+        # layers: list of (kernel, bias, activation_name)
+        for _, _, activation in layers:
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"Unsupported activation: {activation}")
+        self.layers = [
+            (np.ascontiguousarray(kernel, dtype=np.float32),
+             np.ascontiguousarray(bias, dtype=np.float32),
+             activation)
+            for kernel, bias, activation in layers
+        ]
+
+    @classmethod
+    def from_h5(cls, path):
+        import h5py
+
+        with h5py.File(path, 'r') as f:
+            config = json.loads(f.attrs['model_config'])
+            if config.get('class_name') != 'Sequential':
+                raise ValueError(f"Unsupported model type: {config.get('class_name')}")
+
+            weights = f['model_weights']
+            layers = []
+            for layer in config['config']['layers']:
+                if layer['class_name'] == 'InputLayer':
+                    continue
+                if layer['class_name'] != 'Dense':
+                    raise ValueError(f"Unsupported layer type: {layer['class_name']}")
+
+                layer_config = layer['config']
+                group = weights[layer_config['name']]
+                names = [n.decode() if isinstance(n, bytes) else n for n in group.attrs['weight_names']]
+                kernel = group[names[0]][()]
+                if layer_config.get('use_bias', True):
+                    bias = group[names[1]][()]
+                else:
+                    bias = np.zeros(kernel.shape[1], dtype=np.float32)
+                layers.append((kernel, bias, layer_config.get('activation', 'linear')))
+
+        return cls(layers)
+
+    @property
+    def input_dim(self):
+        return self.layers[0][0].shape[0]
+
+    @property
+    def output_dim(self):
+        return self.layers[-1][0].shape[1]
+
+    def predict(self, x):
+        # Keras menghitung dalam float32, jadi input dikonversi terlebih dahulu
+        out = np.asarray(x, dtype=np.float32)
+        if out.ndim == 1:
+            out = out.reshape(1, -1)
+        for kernel, bias, activation in self.layers:
+            out = out @ kernel
+            out += bias
+            out = ACTIVATIONS[activation](out)
+        return out
+
+    # Satu forward pass untuk seluruh matriks, sama seperti Model.predict_on_batch di keras
+    predict_on_batch = predict
+
+
+def resolve_backend(artifact_path):
+    # INFERENCE_BACKEND jika di-set; selain itu artefak model jika ada, lalu keras
+    backend = os.environ.get('INFERENCE_BACKEND')
+    if backend:
+        return backend
+    return 'artifact' if os.path.exists(artifact_path) else 'keras'
+
+
+def load_model(model_path, backend='keras'):
+    if backend == 'numpy':
+        return NumpyMLP.from_h5(model_path)
+    if backend == 'keras':
+        import tensorflow as tf
+        return tf.keras.models.load_model(model_path)
+    raise ValueError(f"Unknown inference backend: {backend} (expected one of {', '.join(BACKENDS)})")
+
+
+def load_bundle(backend, model_path='model/mlp_model.h5', scaler_path='model/scaler.pkl',
+                scaler_params_path='model/scaler.npz', artifact_path='model/model.stm',
+                tflite_path='model/model.tflite', tflite_pool_size=4):
+    # Model, scaler, kelas, dan sidik sumbernya untuk satu backend sebagai ModelBundle.
+    # Dipakai server (main.py) dan bulk_score.py sehingga keduanya memuat model dengan cara yang sama.
+    from artifact import ModelArtifact
+    from model_registry import ModelBundle
+    from scaling import load_scaler
+    from threshold_table import file_fingerprint, matches_sources
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend} (expected one of {', '.join(BACKENDS)})")
+
+    model_artifact = None
+    try:
+        if backend == 'artifact':
+            model_artifact = ModelArtifact(artifact_path)
+            # Artefak yang tidak dibuat dari mlp_model.h5 + scaler.pkl yang sekarang (misalnya sisa dari
+            # sebelum model dilatih ulang) tidak dipakai; model dan scaler dimuat langsung dari file sumber
+            if not matches_sources(model_artifact.source_fingerprint, model_path, scaler_path):
+                logging.warning(f"{artifact_path} was not converted from the current {model_path} and {scaler_path}, "
+                                f"loading them with the numpy backend instead "
+                                f"(run `python artifact.py convert` to update it).")
+                model_artifact = None
+                backend = 'numpy'
+        elif backend == 'tflite':
+            from tflite_model import TFLiteModel, read_source_fingerprint
+
+            # Sama seperti artefak: model TFLite yang tidak dikonversi dari mlp_model.h5 yang sekarang tidak dipakai
+            if not matches_sources(read_source_fingerprint(tflite_path), model_path):
+                logging.warning(f"{tflite_path} was not converted from the current {model_path}, "
+                                f"loading it with the numpy backend instead "
+                                f"(run `python tflite_model.py convert` to update it).")
+                backend = 'numpy'
+        if model_artifact is not None:
+            trained_model = model_artifact.model()
+            logging.info(f"Model artifact loaded successfully from {artifact_path} "
+                         f"(format v{model_artifact.format_version}, model version {model_artifact.model_version}).")
+        elif backend == 'tflite':
+            trained_model = TFLiteModel(tflite_path, pool_size=tflite_pool_size)
+            logging.info(f"TFLite model loaded successfully from {tflite_path} "
+                         f"({trained_model.pool_size} interpreters).")
+        elif os.path.exists(model_path):
+            trained_model = load_model(model_path, backend)
+            logging.info(f"Model loaded successfully ({backend} backend).")
+        else:
+            raise FileNotFoundError(f"Model file not found at {model_path}")
+    except Exception as e:
+        logging.error(f"Error loading model: {e}")
+        raise
+
+    # Muat scaler yang sudah dilatih sebelumnya
+    try:
+        if model_artifact is not None:
+            scaler = model_artifact.scaler()
+            logging.info("Scaler loaded successfully from model artifact.")
+        elif os.path.exists(scaler_params_path) or os.path.exists(scaler_path):
+            scaler = load_scaler(scaler_params_path, scaler_path)
+            logging.info("Scaler loaded successfully.")
+        else:
+            raise FileNotFoundError(f"Scaler file not found at {scaler_path}")
+    except Exception as e:
+        logging.error(f"Error loading scaler: {e}")
+        raise
+
+    # Sidik model + scaler yang sedang dipakai; cache dan tabel ambang yang dibuat dari model lain diabaikan
+    if model_artifact is not None:
+        classes = model_artifact.classes
+        version = model_artifact.model_version
+        fingerprint = model_artifact.source_fingerprint
+    else:
+        classes = CLASSES
+        source = tflite_path if backend == 'tflite' else model_path
+        fingerprint = file_fingerprint(*[path for path in (source, scaler_path) if os.path.exists(path)])
+        version = fingerprint[:12]
+
+    return ModelBundle(version, trained_model, scaler, classes, fingerprint, source=backend)
+
+
+def verify_parity(model_path, scaler_path, dataset_path, atol=1e-5):
+    # Bandingkan hasil backend NumPy dengan Keras pada seluruh baris dataset
+    import joblib
+    import pandas as pd
+
+    scaler = joblib.load(scaler_path)
+    dataset = pd.read_csv(dataset_path)
+    features = scaler.transform(dataset[['Umur', 'Jenis_Kelamin', 'Tinggi_Badan']])
+
+    expected = load_model(model_path, 'keras').predict(features, verbose=0)
+    actual = load_model(model_path, 'numpy').predict(features)
+
+    max_abs_diff = float(np.abs(expected - actual).max())
+    class_mismatches = int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+
+    return {
+        'rows': int(len(features)),
+        'max_abs_diff': max_abs_diff,
+        'class_mismatches': class_mismatches,
+        'ok': class_mismatches == 0 and max_abs_diff <= atol,
+    }
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Check NumPy inference backend against Keras')
+    parser.add_argument('--model', default='model/mlp_model.h5')
+    parser.add_argument('--scaler', default='model/scaler.pkl')
+    parser.add_argument('--dataset', default='../ML/dataset/data_balita_balanced.csv')
+    parser.add_argument('--atol', type=float, default=1e-5)
+    args = parser.parse_args()
+
+    report = verify_parity(args.model, args.scaler, args.dataset, args.atol)
+    print(json.dumps(report, indent=2))
+    raise SystemExit(0 if report['ok'] else 1)
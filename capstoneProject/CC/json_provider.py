@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson opsional; tanpa orjson dipakai modul json standar seperti sebelumnya
+    orjson = None
+
+COMPACT_SEPARATORS = (',', ':')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    # Provider JSON Flask yang memakai orjson jika terpasang. Array dan skalar NumPy diserialisasi
+    # langsung tanpa .tolist(). Output yang mengandung karakter non-ASCII dibuat ulang dengan modul
+    # json standar (ensure_ascii), sehingga body error dan artikel sama persis byte per byte dengan
+    # provider bawaan Flask.
+    def __init__(self, app):
+        super().__init__(app)
+        self._options = 0
+        if orjson is not None:
+            # datetime dan dataclass diteruskan ke default() agar formatnya sama dengan Flask
+            self._options = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                             | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+            if self.sort_keys:
+                self._options |= orjson.OPT_SORT_KEYS
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return DefaultJSONProvider.default(o)
+
+    def dumps_bytes(self, obj):
+        # JSON ringkas (tanpa spasi) sebagai bytes UTF-8, tanpa baris baru di akhir
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(obj, default=self.default, option=self._options)
+            except TypeError:  # misalnya integer di luar 64 bit
+                payload = None
+            if payload is not None and (payload.isascii() or not self.ensure_ascii):
+                return payload
+        return json.dumps(obj, default=self.default, ensure_ascii=self.ensure_ascii, sort_keys=self.sort_keys,
+                          separators=COMPACT_SEPARATORS).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        if orjson is not None and kwargs == {'separators': COMPACT_SEPARATORS}:
+            return self.dumps_bytes(obj).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
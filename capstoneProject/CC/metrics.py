@@ -0,0 +1,333 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# METRICS_ENABLED=0 mematikan seluruh instrumentasi: timer menjadi no-op dan /metrics tidak tersedia
+enabled = os.environ.get('METRICS_ENABLED', '1') == '1'
+
+# Dengan beberapa proses worker (gunicorn), setiap worker menulis snapshot metriknya ke direktori ini
+# dan /metrics menggabungkan snapshot semua worker: counter dan histogram dijumlahkan, gauge dilaporkan
+# per worker dengan label pid. gunicorn.conf.py mengisinya dengan direktori sementara milik server.
+multiprocess_dir = os.environ.get('METRICS_MULTIPROC_DIR') or None
+
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_NULL_TIMER = nullcontext()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{_escape(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _header(self):
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+    def snapshot(self):
+        # Nilai semua label dalam bentuk yang bisa ditulis sebagai JSON
+        with self._lock:
+            return [[list(labelvalues), value] for labelvalues, value in self._values.items()]
+
+    @staticmethod
+    def merge(snapshots):
+        # snapshots: {pid: snapshot()} -> {label: nilai}; counter dijumlahkan antar worker
+        merged = {}
+        for values in snapshots.values():
+            for labelvalues, value in values:
+                labelvalues = tuple(labelvalues)
+                merged[labelvalues] = merged.get(labelvalues, 0) + value
+        return merged
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _header(self):
+        return [f'# HELP {self.name}_total {self.documentation}', f'# TYPE {self.name}_total {self.kind}']
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self, values=None):
+        lines = self._header()
+        if values is None:
+            with self._lock:
+                values = dict(self._values)
+        for labelvalues, value in sorted(values.items()):
+            lines.append(f'{self.name}_total{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}')
+        return lines
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def dec(self, *labelvalues, amount=1):
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value, *labelvalues):
+        with self._lock:
+            self._values[labelvalues] = value
+
+    @staticmethod
+    def merge(snapshots):
+        # Gauge tidak bisa dijumlahkan secara umum (misalnya rata-rata ukuran batch), jadi pid worker
+        # ditambahkan sebagai label terakhir
+        return {tuple(labelvalues) + (str(pid),): value
+                for pid, values in snapshots.items() for labelvalues, value in values}
+
+    def render(self, values=None):
+        lines = self._header()
+        labelnames = self.labelnames
+        if values is None:
+            with self._lock:
+                values = dict(self._values)
+        else:
+            labelnames += ('pid',)
+        for labelvalues, value in sorted(values.items()):
+            lines.append(f'{self.name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}')
+        return lines
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labelvalues)
+            if state is None:
+                state = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return [[list(labelvalues), [list(state[0]), state[1], state[2]]]
+                    for labelvalues, state in self._values.items()]
+
+    @staticmethod
+    def merge(snapshots):
+        merged = {}
+        for values in snapshots.values():
+            for labelvalues, (counts, total, count) in values:
+                state = merged.setdefault(tuple(labelvalues), [[0] * len(counts), 0.0, 0])
+                state[0] = [a + b for a, b in zip(state[0], counts)]
+                state[1] += total
+                state[2] += count
+        return merged
+
+    def render(self, values=None):
+        lines = self._header()
+        if values is None:
+            with self._lock:
+                values = {labelvalues: (list(state[0]), state[1], state[2])
+                          for labelvalues, state in self._values.items()}
+        for labelvalues, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, labelvalues, [('le', _format_value(bound))])
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class Registry:
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._metrics = []
+        self._collectors = []
+        self._sync_pid = None
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect):
+        # collect(): fungsi yang memperbarui metrik (misalnya gauge dari statistik micro-batcher)
+        # tepat sebelum /metrics dirender
+        self._collectors.append(collect)
+
+    def _collect(self):
+        for collect in self._collectors:
+            collect()
+
+    def write_snapshot(self):
+        # Tulis metrik proses ini ke <directory>/<pid>.json (atomik, file sementara lalu rename)
+        self._collect()
+        snapshot = {metric.name: [metric.kind, metric.snapshot()] for metric in self._metrics}
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        with open(f'{path}.tmp', 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(f'{path}.tmp', path)
+
+    def start_sync(self, interval=2.0):
+        # Dipanggil sekali di setiap worker: snapshot ditulis ulang setiap `interval` detik, sehingga
+        # /metrics yang dijawab worker lain paling lama tertinggal sebanyak itu
+        if self.directory is None or self._sync_pid == os.getpid():
+            return
+        self._sync_pid = os.getpid()
+
+        def sync():
+            while True:
+                try:
+                    self.write_snapshot()
+                except Exception as e:
+                    logging.error(f"Error writing metrics snapshot: {e}")
+                time.sleep(interval)
+
+        threading.Thread(target=sync, name='metrics-sync', daemon=True).start()
+
+    def _read_snapshots(self):
+        snapshots = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    snapshots[name[:-len('.json')]] = json.load(f)
+            except (OSError, ValueError):  # file sedang diganti oleh worker lain
+                continue
+        return snapshots
+
+    def render(self):
+        lines = []
+        if self.directory is None:
+            self._collect()
+            for metric in self._metrics:
+                lines.extend(metric.render())
+        else:
+            self.write_snapshot()
+            snapshots = self._read_snapshots()
+            for metric in self._metrics:
+                values = {pid: snapshot[metric.name][1] for pid, snapshot in snapshots.items()
+                          if metric.name in snapshot}
+                lines.extend(metric.render(metric.merge(values)))
+        return '\n'.join(lines) + '\n'
+
+
+# Counter dan histogram semua worker yang sudah berhenti digabung ke satu file, sehingga jumlah file
+# di direktori snapshot tidak bertambah setiap kali worker di-restart
+DEAD_SNAPSHOT = 'dead.json'
+
+
+def _accumulate(snapshots):
+    # Gabungkan beberapa snapshot menjadi satu: counter dan histogram dijumlahkan, gauge dibuang
+    # karena worker yang sudah berhenti tidak lagi melayani request
+    merges = {Counter.kind: Counter.merge, Histogram.kind: Histogram.merge}
+    grouped = {}
+    for i, snapshot in enumerate(snapshots):
+        for name, (kind, values) in snapshot.items():
+            if kind in merges:
+                grouped.setdefault(name, (kind, {}))[1][i] = values
+    return {name: [kind, [[list(labelvalues), value] for labelvalues, value in merges[kind](values).items()]]
+            for name, (kind, values) in grouped.items()}
+
+
+def mark_process_dead(pid, directory=None):
+    # Dipanggil oleh master gunicorn saat worker berhenti: counter dan histogram worker itu ditambahkan
+    # ke DEAD_SNAPSHOT (total tidak turun), lalu snapshot worker itu dihapus
+    directory = directory or multiprocess_dir
+    if directory is None:
+        return
+    path = os.path.join(directory, f'{pid}.json')
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return
+    dead_path = os.path.join(directory, DEAD_SNAPSHOT)
+    try:
+        with open(dead_path) as f:
+            accumulated = json.load(f)
+    except FileNotFoundError:
+        accumulated = {}
+    with open(f'{dead_path}.tmp', 'w') as f:
+        json.dump(_accumulate([accumulated, snapshot]), f)
+    os.replace(f'{dead_path}.tmp', dead_path)
+    os.remove(path)
+
+
+registry = Registry(multiprocess_dir if enabled else None)
+
+REQUESTS = registry.register(Counter(
+    'stunttrack_http_requests', 'HTTP requests by endpoint, method and status', ('endpoint', 'method', 'status')))
+REQUEST_SECONDS = registry.register(Histogram(
+    'stunttrack_http_request_duration_seconds', 'HTTP request latency by endpoint', ('endpoint', 'method')))
+IN_FLIGHT = registry.register(Gauge(
+    'stunttrack_http_requests_in_flight', 'Requests currently being handled', ('endpoint',)))
+STAGE_SECONDS = registry.register(Histogram(
+    'stunttrack_stage_duration_seconds', 'Time spent in each stage of a handler', ('endpoint', 'stage')))
+PREDICTIONS = registry.register(Counter(
+    'stunttrack_predictions', 'Predictions by predicted class and serving path', ('predicted_class', 'path')))
+
+
+class _StageTimer:
+    __slots__ = ('endpoint', 'stage', 'started')
+
+    def __init__(self, endpoint, stage):
+        self.endpoint = endpoint
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        STAGE_SECONDS.observe(time.perf_counter() - self.started, self.endpoint, self.stage)
+        return False
+
+
+def stage(endpoint, name):
+    # with stage('/predict', 'scale'): ...  -- no-op jika instrumentasi dimatikan
+    if not enabled:
+        return _NULL_TIMER
+    return _StageTimer(endpoint, name)
+
+
+def record_request(endpoint, method, status, seconds):
+    if enabled:
+        REQUESTS.inc(endpoint, method, str(status))
+        REQUEST_SECONDS.observe(seconds, endpoint, method)
+
+
+def record_prediction(predicted_class, path):
+    if enabled:
+        PREDICTIONS.inc(predicted_class, path)
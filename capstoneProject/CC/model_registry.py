@@ -0,0 +1,357 @@
+# Registry model di disk dan penggantian model tanpa downtime.
+#
+#   model/registry/
+#     CURRENT                 <- nama versi yang aktif
+#     <versi>/model.stm       <- artefak model + scaler (artifact.py)
+#     <versi>/threshold_table.npz  (opsional)
+#
+#   python model_registry.py publish --activate     # salin model/model.stm sebagai versi baru lalu aktifkan
+#   python model_registry.py list
+#   python model_registry.py activate <versi>
+import argparse
+import json
+import logging
+import os
+import re
+import shutil
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+ARTIFACT_FILE = 'model.stm'
+TABLE_FILE = 'threshold_table.npz'
+CURRENT_FILE = 'CURRENT'
+
+# Nama versi dipakai sebagai nama direktori, jadi dibatasi agar tidak bisa keluar dari registry
+VERSION_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$')
+
+# Baris contoh untuk warm-up model baru sebelum dipakai melayani request
+WARMUP_ROWS = np.array([[age, sex, height]
+                        for age in (0, 12, 24, 36, 48, 60)
+                        for sex in (0, 1)
+                        for height in (45.0, 70.0, 95.0, 120.0)], dtype=np.float64)
+
+
+def validate_version(version):
+    if not isinstance(version, str) or not VERSION_RE.match(version):
+        raise ValueError(f"Invalid model version: {version!r}")
+    return version
+
+
+class ModelBundle:
+    # Model, scaler, dan kelas yang selalu dipakai bersama. Request membaca bundle aktif satu kali
+    # di awal, sehingga penggantian bundle tidak pernah mencampur model lama dengan scaler baru.
+    def __init__(self, version, model, scaler, classes, fingerprint, source=None):
+        self.version = version
+        self.model = model
+        self.scaler = scaler
+        self.classes = list(classes)
+        self.fingerprint = fingerprint
+        self.source = source
+        self.threshold_table = None
+        self.loaded_at = time.time()
+
+    def score(self, rows):
+        # Normalisasi dan prediksi beberapa baris fitur sekaligus dalam satu forward pass
+        return np.asarray(self.model.predict_on_batch(self.scaler.transform(rows)))
+
+    def warm_up(self):
+        # Jalankan jalur batch dan satu baris sekali agar request pertama tidak menanggung inisialisasi
+        self.score(WARMUP_ROWS)
+        self.model.predict(self.scaler.transform_row(*WARMUP_ROWS[0]))
+
+    def describe(self):
+        return {
+            'version': self.version,
+            'fingerprint': self.fingerprint,
+            'source': self.source,
+            'threshold_table': self.threshold_table is not None,
+            'loaded_at': datetime.fromtimestamp(self.loaded_at, timezone.utc).isoformat(timespec='seconds'),
+        }
+
+
+class ModelRegistry:
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, version, name=ARTIFACT_FILE):
+        return os.path.join(self.root, validate_version(version), name)
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if VERSION_RE.match(name) and os.path.exists(os.path.join(self.root, name, ARTIFACT_FILE)))
+
+    def current(self):
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def activate(self, version):
+        if not os.path.exists(self.path(version)):
+            raise ValueError(f"Model version {version} is not in the registry")
+        pointer = os.path.join(self.root, CURRENT_FILE)
+        with open(f'{pointer}.tmp', 'w') as f:
+            f.write(f'{version}\n')
+        os.replace(f'{pointer}.tmp', pointer)
+
+    def publish(self, artifact_path, version=None, table_path=None):
+        # Salin artefak (dan tabel ambang) ke direktori versi baru. Versi baru terlihat (versions(),
+        # reload) hanya setelah model.stm ada, jadi tabel disalin dulu dan model.stm terakhir lewat file
+        # sementara. Tanpa rename direktori, cara ini juga berlaku di bucket Cloud Storage yang di-mount.
+        from artifact import ModelArtifact
+
+        artifact = ModelArtifact(artifact_path)
+        version = validate_version(version or artifact.model_version)
+        target = os.path.join(self.root, version)
+        if os.path.exists(os.path.join(target, ARTIFACT_FILE)):
+            raise ValueError(f"Model version {version} already exists in the registry")
+
+        os.makedirs(target, exist_ok=True)
+        if table_path and os.path.exists(table_path):
+            shutil.copyfile(table_path, os.path.join(target, TABLE_FILE))
+        tmp_path = os.path.join(target, f'{ARTIFACT_FILE}.tmp')
+        shutil.copyfile(artifact_path, tmp_path)
+        os.replace(tmp_path, os.path.join(target, ARTIFACT_FILE))
+        return version
+
+
+class ModelManager:
+    # Memegang bundle aktif (dan bundle shadow opsional). Reload memuat dan melakukan warm-up bundle
+    # baru di thread latar belakang, lalu menggantinya dengan satu assignment: request yang sedang
+    # berjalan selesai dengan bundle lama, request berikutnya memakai bundle baru.
+    def __init__(self, bundle, load_version, registry=None, shadow_queue_size=1000, failed_version=None):
+        self.active = bundle
+        self.shadow = None
+        self.registry = registry
+        self._load_version = load_version  # fungsi: versi registry -> ModelBundle
+        self.shadow_queue_size = shadow_queue_size
+
+        self._reload_lock = threading.Lock()
+        self._reload_state = {'state': 'idle', 'target': None, 'version': None, 'error': None}
+        # Versi yang gagal dimuat sebagai bundle aktif (juga saat start); watcher tidak mencobanya lagi
+        # sampai CURRENT berubah
+        self._failed_version = failed_version
+        self._failed_missing = False
+
+        self._stats_lock = threading.Lock()
+        self._reset_shadow_stats()
+        self._pid = None
+        self._shadow_executor = None
+
+    # --- reload ---
+
+    def reload(self, version=None, target='active', wait=False, activate=False):
+        # version None: versi CURRENT di registry. target 'shadow' memuat bundle sebagai shadow.
+        # activate: CURRENT di registry diganti ke versi ini, tetapi hanya setelah bundle berhasil dimuat
+        # dan di-warm-up, sehingga versi yang rusak tidak pernah menjadi CURRENT.
+        if version is None:
+            version = self.registry.current() if self.registry is not None else None
+            if version is None:
+                raise ValueError("No model version given and the registry has no current version")
+        validate_version(version)
+        if self.registry is not None and not os.path.exists(self.registry.path(version)):
+            raise ValueError(f"Model version {version} is not in the registry")
+
+        if not self._reload_lock.acquire(blocking=False):
+            raise RuntimeError("Another model reload is in progress")
+        self._reload_state = {'state': 'loading', 'target': target, 'version': version, 'error': None}
+
+        thread = threading.Thread(target=self._run_reload, args=(version, target, activate),
+                                  name='model-reload', daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+        return thread
+
+    def _run_reload(self, version, target, activate=False):
+        started = time.perf_counter()
+        try:
+            bundle = self._load_version(version)
+            bundle.warm_up()
+            if activate and target != 'shadow' and self.registry is not None:
+                # Worker lain ikut memuat versi ini lewat watcher
+                self.registry.activate(version)
+            if target == 'shadow':
+                self.shadow = bundle
+                self._reset_shadow_stats()
+            else:
+                previous = self.active
+                self.active = bundle
+                if self.shadow is not None and self.shadow.version == bundle.version:
+                    self.shadow = None  # versi shadow baru saja dipromosikan
+                self._failed_version = None
+                logging.info(f"Model version {bundle.version} is now active (was {previous.version}).")
+            self._reload_state = {'state': 'idle', 'target': target, 'version': version, 'error': None,
+                                  'seconds': time.perf_counter() - started}
+        except Exception as e:
+            logging.error(f"Error reloading model version {version}: {e}")
+            if target != 'shadow':
+                self._failed_version = version
+                self._failed_missing = False
+            self._reload_state = {'state': 'failed', 'target': target, 'version': version, 'error': str(e)}
+        finally:
+            self._reload_lock.release()
+
+    def clear_shadow(self):
+        self.shadow = None
+        self._reset_shadow_stats()
+
+    def check_registry(self):
+        # Reload jika CURRENT di registry menunjuk versi lain dari bundle aktif
+        if self.registry is None:
+            return False
+        version = self.registry.current()
+        if version != self._failed_version:
+            self._failed_version = None
+        elif self._failed_missing and version in self.registry.versions():
+            self._failed_version = None  # versi yang sebelumnya belum ada sekarang sudah selesai diunggah
+        if (version is None or version == self.active.version or version == self._failed_version
+                or self._reload_state['state'] == 'loading'):
+            return False
+        try:
+            self.reload(version)
+        except (RuntimeError, ValueError) as e:
+            logging.warning(f"Registry points to model version {version}, not reloading: {e}")
+            if isinstance(e, ValueError):  # versi (belum) ada di registry
+                self._failed_version = version
+                self._failed_missing = True
+            return False
+        return True
+
+    def start_watcher(self, poll_seconds):
+        # Setiap worker memeriksa CURRENT secara berkala, sehingga aktivasi versi lewat satu worker
+        # (atau lewat CLI) diikuti oleh semua worker
+        def watch():
+            while True:
+                time.sleep(poll_seconds)
+                try:
+                    self.check_registry()
+                except Exception as e:
+                    logging.error(f"Error checking model registry: {e}")
+
+        thread = threading.Thread(target=watch, name='model-registry-watcher', daemon=True)
+        thread.start()
+        return thread
+
+    def install_signal_handler(self, signum=signal.SIGHUP):
+        # Harus dipanggil dari main thread proses yang melayani request
+        signal.signal(signum, lambda *_: self.check_registry())
+
+    # --- shadow ---
+
+    def _reset_shadow_stats(self):
+        with self._stats_lock:
+            self._shadow_stats = {'compared': 0, 'disagreements': 0, 'prob_abs_diff_sum': 0.0,
+                                  'prob_abs_diff_max': 0.0, 'dropped': 0, 'errors': 0}
+            self._shadow_pending = 0
+
+    def compare_shadow(self, rows, predictions):
+        # Skor `rows` dengan bundle shadow di latar belakang dan bandingkan dengan `predictions`
+        # dari bundle aktif. Jika antrean penuh, perbandingan dilewati (dihitung sebagai dropped).
+        shadow = self.shadow
+        if shadow is None:
+            return
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._shadow_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='shadow')
+        with self._stats_lock:
+            if self._shadow_pending >= self.shadow_queue_size:
+                self._shadow_stats['dropped'] += 1
+                return
+            self._shadow_pending += 1
+        self._shadow_executor.submit(self._compare, shadow, np.array(rows, dtype=np.float64),
+                                     np.array(predictions, dtype=np.float32))
+
+    def _compare(self, shadow, rows, predictions):
+        try:
+            if rows.ndim == 1:
+                rows = rows.reshape(1, -1)
+                predictions = predictions.reshape(1, -1)
+            shadow_predictions = shadow.score(rows)
+            diff = np.abs(shadow_predictions - predictions).max(axis=1)
+            disagreements = int((shadow_predictions.argmax(axis=1) != predictions.argmax(axis=1)).sum())
+            with self._stats_lock:
+                if shadow is self.shadow:
+                    self._shadow_stats['compared'] += len(rows)
+                    self._shadow_stats['disagreements'] += disagreements
+                    self._shadow_stats['prob_abs_diff_sum'] += float(diff.sum())
+                    self._shadow_stats['prob_abs_diff_max'] = max(self._shadow_stats['prob_abs_diff_max'],
+                                                                  float(diff.max()))
+        except Exception as e:
+            logging.error(f"Error scoring shadow model: {e}")
+            with self._stats_lock:
+                self._shadow_stats['errors'] += 1
+        finally:
+            with self._stats_lock:
+                self._shadow_pending -= 1
+
+    def shadow_stats(self):
+        with self._stats_lock:
+            stats = dict(self._shadow_stats)
+        compared = stats.pop('compared')
+        diff_sum = stats.pop('prob_abs_diff_sum')
+        return {
+            'compared': compared,
+            'disagreements': stats['disagreements'],
+            'disagreement_rate': stats['disagreements'] / compared if compared else 0.0,
+            'mean_max_prob_diff': diff_sum / compared if compared else 0.0,
+            'max_prob_diff': stats['prob_abs_diff_max'],
+            'dropped': stats['dropped'],
+            'errors': stats['errors'],
+        }
+
+    def status(self):
+        shadow = self.shadow
+        return {
+            'active': self.active.describe(),
+            'shadow': {**shadow.describe(), **self.shadow_stats()} if shadow is not None else None,
+            'reload': dict(self._reload_state),
+            'failed_version': self._failed_version,
+            'registry': {
+                'path': self.registry.root,
+                'current': self.registry.current(),
+                'versions': self.registry.versions(),
+            } if self.registry is not None else None,
+        }
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Manage the on-disk model registry')
+    parser.add_argument('--registry', default=os.environ.get('MODEL_REGISTRY_PATH', 'model/registry'))
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    publish_parser = subparsers.add_parser('publish', help='copy a model artifact into the registry')
+    publish_parser.add_argument('--artifact', default='model/model.stm')
+    publish_parser.add_argument('--table', default='model/threshold_table.npz')
+    publish_parser.add_argument('--version', default=None, help='version name (default: the artifact version)')
+    publish_parser.add_argument('--activate', action='store_true', help='make it the current version')
+
+    subparsers.add_parser('list')
+
+    activate_parser = subparsers.add_parser('activate', help='point CURRENT at a published version')
+    activate_parser.add_argument('version')
+
+    args = parser.parse_args()
+    registry = ModelRegistry(args.registry)
+
+    if args.command == 'publish':
+        version = registry.publish(args.artifact, args.version, args.table)
+        logging.info(f"Published model version {version} to {args.registry}")
+        if args.activate:
+            registry.activate(version)
+            logging.info(f"Model version {version} is now current")
+    elif args.command == 'activate':
+        registry.activate(args.version)
+        logging.info(f"Model version {args.version} is now current")
+    else:
+        print(json.dumps({'current': registry.current(), 'versions': registry.versions()}, indent=2))
@@ -0,0 +1,64 @@
+import gzip
+import hashlib
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # brotli opsional, tanpa modul ini hanya gzip yang disediakan
+    brotli = None
+
+# Urutan preferensi encoding jika klien menerima beberapa encoding dengan kualitas yang sama
+ENCODINGS = ('br', 'gzip')
+
+# Artikel tidak berubah selama server berjalan, klien cukup memvalidasi ulang dengan ETag
+CACHE_CONTROL = 'public, max-age=300'
+
+
+class PrecompressedResponse:
+    # Body respons diserialisasi sekali saat start, beserta varian gzip/brotli dan ETag kuat.
+    # Setiap request hanya memilih varian yang sesuai tanpa encode ulang.
+    def __init__(self, body, mimetype='application/json', status=200):
+        self.mimetype = mimetype
+        self.status = status
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+
+        # Setiap representasi punya ETag sendiri agar cache perantara tidak mencampur encoding
+        self.variants = {None: (body, self.etag)}
+        self.variants['gzip'] = (gzip.compress(body, compresslevel=9, mtime=0), f'{self.etag}-gzip')
+        if brotli is not None:
+            self.variants['br'] = (brotli.compress(body, quality=11), f'{self.etag}-br')
+
+    @classmethod
+    def from_response(cls, response):
+        return cls(response.get_data(), mimetype=response.mimetype, status=response.status_code)
+
+    @property
+    def body(self):
+        return self.variants[None][0]
+
+    def _choose_encoding(self, request):
+        best, best_quality = None, 0
+        for encoding in ENCODINGS:
+            if encoding not in self.variants:
+                continue
+            quality = request.accept_encodings.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def respond(self, request):
+        encoding = self._choose_encoding(request)
+        body, etag = self.variants[encoding]
+
+        if any(request.if_none_match.contains_weak(tag) for _, tag in self.variants.values()):
+            response = Response(status=304)
+        else:
+            response = Response(body, status=self.status, mimetype=self.mimetype)
+            if encoding is not None:
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
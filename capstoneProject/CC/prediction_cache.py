@@ -0,0 +1,93 @@
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PredictionCache:
+    # Cache LRU untuk hasil /predict. Umur dan tinggi badan dibulatkan ke kelipatan `age_step` /
+    # `height_step` sebelum dijadikan key, dan prediksi dihitung dari nilai yang sudah dibulatkan,
+    # sehingga isi cache untuk satu key selalu sama tidak peduli request mana yang mengisinya.
+    def __init__(self, max_entries=10000, age_step=0.01, height_step=0.01):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if age_step <= 0 or height_step <= 0:
+            raise ValueError("Quantization steps must be positive")
+
+        self.max_entries = max_entries
+        self.age_step = age_step
+        self.height_step = height_step
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (indeks kelas, tuple probabilitas)
+        self._fingerprint = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def key(self, umur, jenis_kelamin, tinggi_badan):
+        # Mengembalikan key, atau None jika input tidak bisa di-cache (bukan angka / tidak berhingga)
+        if not all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                   for value in (umur, jenis_kelamin, tinggi_badan)):
+            return None
+        try:
+            if not (math.isfinite(umur) and math.isfinite(jenis_kelamin) and math.isfinite(tinggi_badan)):
+                return None
+            return round(umur / self.age_step), float(jenis_kelamin), round(tinggi_badan / self.height_step)
+        except (OverflowError, ValueError):  # hasil bagi tak berhingga, atau int terlalu besar untuk float
+            return None
+
+    def features(self, key):
+        # Nilai fitur hasil pembulatan yang dipakai untuk menghitung prediksi yang di-cache
+        age, sex, height = key
+        return age * self.age_step, sex, height * self.height_step
+
+    def _bind(self, fingerprint):
+        # Model atau scaler berganti: semua entri lama dibuang (dipanggil dengan lock dipegang)
+        if fingerprint != self._fingerprint:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def get(self, fingerprint, key):
+        with self._lock:
+            self._bind(fingerprint)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, fingerprint, key, predicted_class, probabilities):
+        with self._lock:
+            self._bind(fingerprint)
+            # Salinan array dengan dtype yang sama, agar respons dari cache sama dengan respons dari model
+            self._entries[key] = (int(predicted_class), np.array(probabilities))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'max_entries': self.max_entries,
+                'age_step': self.age_step,
+                'height_step': self.height_step,
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+            }
@@ -0,0 +1,225 @@
+# Profiling per request yang opsional: sebagian kecil request (PROFILE_SAMPLE_RATE) atau request
+# dengan header X-Debug-Profile yang ditandatangani PROFILE_SECRET direkam stack-nya, lalu ditulis
+# ke PROFILE_DIR dalam format collapsed stack (flamegraph.pl, speedscope, inferno):
+#
+#   python profiler.py sign --method POST --path /predict     # nilai header X-Debug-Profile
+#   python profiler.py merge profiles --endpoint /predict > predict.collapsed
+#
+# Request yang tidak diprofilkan hanya membayar satu bilangan acak dan satu pengecekan header.
+import argparse
+import hashlib
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+HEADER = 'X-Debug-Profile'
+
+# Tanda tangan header hanya berlaku sebentar agar tidak bisa dipakai ulang
+MAX_SIGNATURE_AGE = 300
+
+
+def sign(secret, method, path, timestamp=None):
+    # Nilai header: "<unix timestamp>:<hmac-sha256 hex dari 'timestamp:METHOD:path'>"
+    timestamp = int(time.time() if timestamp is None else timestamp)
+    message = f'{timestamp}:{method.upper()}:{path}'.encode('utf-8')
+    return f"{timestamp}:{hmac.new(secret.encode('utf-8'), message, hashlib.sha256).hexdigest()}"
+
+
+def verify_signature(secret, value, method, path, now=None, max_age=MAX_SIGNATURE_AGE):
+    timestamp, _, _ = value.partition(':')
+    if not timestamp.isdigit():
+        return False
+    now = time.time() if now is None else now
+    if abs(now - int(timestamp)) > max_age:
+        return False
+    return hmac.compare_digest(value.encode('utf-8'), sign(secret, method, path, int(timestamp)).encode('utf-8'))
+
+
+class StackSampler:
+    # Satu thread sampler untuk seluruh proses: setiap `interval` detik stack thread yang sedang
+    # diprofilkan dibaca lewat sys._current_frames() dan dihitung per stack. Saat tidak ada request
+    # yang diprofilkan thread ini tidur menunggu Event.
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._targets = {}  # thread id -> Counter(stack collapsed -> jumlah sampel)
+        self._wakeup = threading.Event()
+        self._names = {}  # code object -> nama frame
+        self._pid = None
+
+    def _ensure_thread(self):
+        # Thread tidak ikut tersalin saat fork (gunicorn preload_app), jadi dimulai di setiap proses
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    threading.Thread(target=self._run, name='stack-sampler', daemon=True).start()
+
+    def start(self, thread_id):
+        self._ensure_thread()
+        counts = Counter()
+        with self._lock:
+            self._targets[thread_id] = counts
+        self._wakeup.set()
+        return counts
+
+    def stop(self, thread_id):
+        with self._lock:
+            return self._targets.pop(thread_id, Counter())
+
+    def _frame_name(self, code):
+        name = self._names.get(code)
+        if name is None:
+            qualname = getattr(code, 'co_qualname', code.co_name)
+            name = f'{qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'.replace(';', ':')
+            self._names[code] = name
+        return name
+
+    def _collapse(self, frame):
+        names = []
+        while frame is not None:
+            names.append(self._frame_name(frame.f_code))
+            frame = frame.f_back
+        names.reverse()
+        return ';'.join(names)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                idle = not self._targets
+            if idle:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            frames = sys._current_frames()
+            with self._lock:
+                targets = list(self._targets.items())
+            for thread_id, counts in targets:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    counts[self._collapse(frame)] += 1
+            del frames
+            time.sleep(self.interval)
+
+
+class RequestProfiler:
+    def __init__(self, directory, sample_rate=0.0, secret=None, interval=0.001, max_files=200):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if max_files < 1:
+            raise ValueError("max_files must be at least 1")
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.max_files = max_files
+        self.sampler = StackSampler(interval)
+        self._lock = threading.Lock()
+        self._written = 0
+        self._rejected = 0
+
+    def wants(self, method, path, header_value):
+        # Apakah request ini diprofilkan: header bertanda tangan valid, atau terpilih secara acak
+        if header_value is not None and self.secret:
+            if verify_signature(self.secret, header_value, method, path):
+                return 'header'
+            with self._lock:
+                self._rejected += 1
+        if self.sample_rate and random.random() < self.sample_rate:
+            return 'sampled'
+        return None
+
+    def start(self):
+        # Token yang diteruskan ke finish(): (thread id, Counter, waktu mulai)
+        thread_id = threading.get_ident()
+        return thread_id, self.sampler.start(thread_id), time.perf_counter()
+
+    def finish(self, token, method, endpoint, status, model_version, reason):
+        thread_id, _, started = token
+        counts = self.sampler.stop(thread_id)
+        latency_ms = (time.perf_counter() - started) * 1000.0
+
+        # Tag request dijadikan frame akar, sehingga tetap terbaca di alat flamegraph mana pun
+        root = (f'{method} {endpoint} status={status} latency={latency_ms:.1f}ms '
+                f'model={model_version} reason={reason}').replace(';', ':')
+        if not counts:
+            counts = Counter({'(no samples)': 1})
+        lines = [f'{root};{stack} {count}' for stack, count in sorted(counts.items())]
+
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S.%f')
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', endpoint).strip('_') or 'root'
+        path = os.path.join(self.directory, f'{stamp}-{method}-{slug}-{latency_ms:.0f}ms-{os.getpid()}.collapsed')
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._written += 1
+            self._rotate()
+        logging.info(f"Profiled {method} {endpoint} ({latency_ms:.1f} ms, {sum(counts.values())} samples) -> {path}")
+        return path
+
+    def _rotate(self):
+        # Hanya `max_files` trace terbaru yang disimpan; nama file diawali timestamp
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith('.collapsed'))
+        for name in names[:-self.max_files]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {'sample_rate': self.sample_rate, 'header_enabled': bool(self.secret),
+                    'written': self._written, 'rejected_signatures': self._rejected}
+
+
+def merge(directory, endpoint=None, keep_root=False):
+    # Gabungkan beberapa trace menjadi satu collapsed stack; frame akar (tag request) dibuang
+    # kecuali keep_root, sehingga stack yang sama dari request berbeda dijumlahkan
+    totals = Counter()
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.collapsed'):
+            continue
+        with open(os.path.join(directory, name), encoding='utf-8') as f:
+            for line in f:
+                stack, _, count = line.rstrip('\n').rpartition(' ')
+                root, _, rest = stack.partition(';')
+                if endpoint is not None and root.split(' ')[1] != endpoint:
+                    break
+                totals[stack if keep_root else rest] += int(count)
+    return totals
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sign profiling requests and merge collapsed-stack traces')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sign_parser = subparsers.add_parser('sign', help=f'print a value for the {HEADER} header')
+    sign_parser.add_argument('--secret', default=os.environ.get('PROFILE_SECRET'))
+    sign_parser.add_argument('--method', default='POST')
+    sign_parser.add_argument('--path', default='/predict')
+
+    merge_parser = subparsers.add_parser('merge', help='merge traces into one collapsed-stack file on stdout')
+    merge_parser.add_argument('directory', nargs='?', default=os.environ.get('PROFILE_DIR', 'profiles'))
+    merge_parser.add_argument('--endpoint', default=None, help='only traces of this route, e.g. /predict')
+    merge_parser.add_argument('--keep-root', action='store_true', help='keep the per-request tag frame')
+
+    args = parser.parse_args()
+
+    if args.command == 'sign':
+        if not args.secret:
+            parser.error('--secret or PROFILE_SECRET is required')
+        print(sign(args.secret, args.method, args.path))
+    else:
+        for stack, count in sorted(merge(args.directory, args.endpoint, args.keep_root).items()):
+            print(f'{stack} {count}')
@@ -0,0 +1,125 @@
+import argparse
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from threshold_table import file_fingerprint, matches_sources
+
+
+class AffineScaler:
+    # Versi ringan dari MinMaxScaler yang sudah di-fit: transform(x) = x * scale_ + min_.
+    # Urutan operasinya sama dengan sklearn (X *= scale_; X += min_) sehingga hasilnya identik,
+    # tanpa DataFrame dan tanpa validasi input sklearn di setiap request.
+    def __init__(self, scale, offset, feature_names, source_fingerprint=None):
+        self.scale_ = np.ascontiguousarray(scale, dtype=np.float64)
+        self.min_ = np.ascontiguousarray(offset, dtype=np.float64)
+        self.feature_names = [str(name) for name in feature_names]
+        self.source_fingerprint = source_fingerprint  # sidik scaler.pkl asal parameter ini
+        if self.scale_.shape != self.min_.shape or self.scale_.shape != (len(self.feature_names),):
+            raise ValueError("scale_, min_ and feature_names must have the same length")
+        self._local = threading.local()
+
+    @classmethod
+    def from_sklearn(cls, scaler):
+        if getattr(scaler, 'clip', False):
+            raise ValueError("MinMaxScaler with clip=True is not supported")
+        return cls(scaler.scale_, scaler.min_, scaler.feature_names_in_)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            source_fingerprint = str(data['source_fingerprint']) if 'source_fingerprint' in data.files else None
+            return cls(data['scale'], data['min'], data['feature_names'], source_fingerprint or None)
+
+    def save(self, path):
+        np.savez(path, scale=self.scale_, min=self.min_, feature_names=np.array(self.feature_names),
+                 source_fingerprint=np.array(self.source_fingerprint or ''))
+
+    @property
+    def n_features(self):
+        return len(self.feature_names)
+
+    def transform(self, x, out=None):
+        # x: matriks (n, n_features); hasil ditulis ke `out` jika diberikan
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim != 2 or x.shape[1] != self.n_features:
+            raise ValueError(f"Expected input with {self.n_features} features, got shape {x.shape}")
+        out = np.multiply(x, self.scale_, out=out)
+        out += self.min_
+        return out
+
+    def transform_row(self, *values):
+        # Satu baris fitur ditulis ke buffer (1, n_features) milik thread ini, tanpa alokasi baru.
+        # Buffer dipakai ulang pada panggilan berikutnya di thread yang sama.
+        row = getattr(self._local, 'row', None)
+        if row is None:
+            row = self._local.row = np.empty((1, self.n_features), dtype=np.float64)
+        row[0] = values
+        row *= self.scale_
+        row += self.min_
+        return row
+
+
+def load_scaler(npz_path, pkl_path):
+    # Utamakan parameter .npz agar joblib/sklearn tidak perlu di-import saat server start, tetapi hanya
+    # jika diekspor dari scaler.pkl yang sekarang (bukan sisa dari sebelum model dilatih ulang)
+    if os.path.exists(npz_path):
+        scaler = AffineScaler.load(npz_path)
+        if matches_sources(scaler.source_fingerprint, pkl_path):
+            return scaler
+        logging.warning(f"{npz_path} was not exported from the current {pkl_path}, loading {pkl_path} instead "
+                        f"(run `python scaling.py export` to update it).")
+
+    import joblib
+    return AffineScaler.from_sklearn(joblib.load(pkl_path))
+
+
+def export_scaler(pkl_path, npz_path):
+    import joblib
+
+    scaler = AffineScaler.from_sklearn(joblib.load(pkl_path))
+    scaler.source_fingerprint = file_fingerprint(pkl_path)
+    scaler.save(npz_path)
+    return scaler
+
+
+def verify_scaler(pkl_path, dataset_path):
+    # Hasil AffineScaler harus sama persis dengan scaler.transform
+    import joblib
+    import pandas as pd
+
+    scaler = joblib.load(pkl_path)
+    affine = AffineScaler.from_sklearn(scaler)
+    features = pd.read_csv(dataset_path)[list(affine.feature_names)]
+
+    expected = scaler.transform(features)
+    batch = affine.transform(features.to_numpy())
+    rows = np.vstack([affine.transform_row(*row).copy() for row in features.to_numpy()[:1000]])
+
+    return {
+        'rows': int(len(features)),
+        'batch_identical': bool(np.array_equal(expected, batch)),
+        'single_row_identical': bool(np.array_equal(expected[:1000], rows)),
+    }
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Export or verify the precomputed affine scaler')
+    parser.add_argument('command', choices=['export', 'verify'])
+    parser.add_argument('--scaler', default='model/scaler.pkl')
+    parser.add_argument('--out', default='model/scaler.npz')
+    parser.add_argument('--dataset', default='../ML/dataset/data_balita_balanced.csv')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        export_scaler(args.scaler, args.out)
+        logging.info(f"Scaler parameters saved to {args.out}")
+    else:
+        report = verify_scaler(args.scaler, args.dataset)
+        print(json.dumps(report, indent=2))
+        raise SystemExit(0 if report['batch_identical'] and report['single_row_identical'] else 1)
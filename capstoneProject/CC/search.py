@@ -0,0 +1,162 @@
+import hashlib
+import heapq
+import html
+import math
+import re
+from collections import Counter
+from html.parser import HTMLParser
+
+# Kata umum bahasa Indonesia yang tidak membantu pencarian
+STOPWORDS = frozenset('''
+ada adalah agar akan aku anda antara apa apabila atau bagi bahwa banyak begitu belum beberapa
+bila bisa boleh dalam dan dapat dari dengan di dia ini itu jadi jika juga kali kami kamu karena
+ke kita lagi lain lebih maka masih mereka misalnya nya oleh pada para perlu saat sangat saja
+sampai secara sebagai sebelum sedang sehingga sejak selain seperti serta sesuai setelah si
+sudah supaya tak tanpa tapi telah tersebut tetapi tidak untuk yaitu yakni yang
+'''.split())
+
+# Partikel dan kata ganti milik yang menempel di akhir kata (misal: makanannya, apakah, bundalah)
+SUFFIXES = ('lah', 'kah', 'tah', 'pun', 'nya', 'ku', 'mu')
+MIN_STEM_LENGTH = 4
+
+WORD_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+TITLE_WEIGHT = 3  # token pada judul dihitung lebih berat daripada token pada isi
+SNIPPET_WORDS = 30
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def strip_html(markup):
+    parser = _TextExtractor()
+    parser.feed(markup)
+    parser.close()
+    return ' '.join(' '.join(parser.parts).split())
+
+
+def normalize(word):
+    word = word.lower()
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text):
+    terms = []
+    for match in WORD_RE.finditer(text):
+        term = normalize(match.group())
+        if term not in STOPWORDS:
+            terms.append(term)
+    return terms
+
+
+class SearchIndex:
+    # Inverted index dengan ranking BM25. Setiap dokumen disimpan beserta hash isinya sehingga
+    # sync() hanya men-tokenisasi ulang artikel yang berubah.
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}  # term -> {doc_id: bobot frekuensi}
+        self._documents = {}  # doc_id -> (hash, teks tanpa HTML, span kata, Counter term, panjang)
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._documents)
+
+    @staticmethod
+    def _digest(title, body):
+        return hashlib.sha256(f'{title}\x00{body}'.encode('utf-8')).hexdigest()
+
+    def add(self, doc_id, title, body):
+        if doc_id in self._documents:
+            self.remove(doc_id)
+
+        text = strip_html(body)
+        spans = [(m.start(), m.end(), normalize(m.group())) for m in WORD_RE.finditer(text)]
+
+        terms = Counter({term: TITLE_WEIGHT * count for term, count in Counter(tokenize(title)).items()})
+        terms.update(term for _, _, term in spans if term not in STOPWORDS)
+
+        for term, count in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+        length = sum(terms.values())
+        self._total_length += length
+        self._documents[doc_id] = (self._digest(title, body), text, spans, terms, length)
+
+    def remove(self, doc_id):
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        terms, length = document[3], document[4]
+        for term in terms:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+        self._total_length -= length
+
+    def sync(self, articles):
+        # Perbarui indeks sesuai daftar artikel saat ini: tambah/ubah yang berbeda, hapus yang hilang
+        seen = set()
+        changed = 0
+        for article in articles:
+            doc_id = article['id']
+            seen.add(doc_id)
+            document = self._documents.get(doc_id)
+            if document is None or document[0] != self._digest(article['judul'], article['isi']):
+                self.add(doc_id, article['judul'], article['isi'])
+                changed += 1
+        for doc_id in set(self._documents) - seen:
+            self.remove(doc_id)
+            changed += 1
+        return changed
+
+    def search(self, query, limit=10):
+        # Mengembalikan list (doc_id, skor, potongan teks dengan <mark>) terurut dari skor tertinggi
+        query_terms = set(tokenize(query))
+        if not query_terms or not self._documents:
+            return []
+
+        n = len(self._documents)
+        average_length = self._total_length / n
+        scores = {}
+        for term in query_terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                length = self._documents[doc_id][4]
+                norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(doc_id, score, self.snippet(doc_id, query_terms)) for doc_id, score in best]
+
+    def snippet(self, doc_id, query_terms):
+        _, text, spans, _, _ = self._documents[doc_id]
+        if not spans:
+            return ''
+
+        first = next((i for i, span in enumerate(spans) if span[2] in query_terms), 0)
+        start = max(0, first - SNIPPET_WORDS // 3)
+        window = spans[start:start + SNIPPET_WORDS]
+
+        parts = ['…'] if start > 0 else []
+        position = window[0][0]
+        for word_start, word_end, term in window:
+            parts.append(html.escape(text[position:word_start]))
+            word = html.escape(text[word_start:word_end])
+            parts.append(f'<mark>{word}</mark>' if term in query_terms else word)
+            position = word_end
+        if start + SNIPPET_WORDS < len(spans):
+            parts.append('…')
+        return ''.join(parts)
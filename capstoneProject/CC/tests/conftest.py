@@ -0,0 +1,141 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Modul server berada di CC/, satu tingkat di atas direktori tests
+CC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CC_DIR)
+
+from artifact import write_artifact  # noqa: E402
+from inference import NumpyMLP  # noqa: E402
+from scaling import AffineScaler  # noqa: E402
+
+COLUMNS = ['Umur', 'Jenis_Kelamin', 'Tinggi_Badan']
+CLASSES = ['severely_stunted', 'stunted', 'normal', 'tinggi']
+
+# Model kecil buatan sendiri, sehingga pengujian tidak butuh file di model/.
+# Lapisan tersembunyi memisahkan tinggi badan (t) dan umur (a) hasil MinMaxScaler menjadi
+# relu(t - 0.5), relu(0.5 - t), relu(a), relu(-a); logit keluaran linear terhadap t dengan kemiringan
+# berbeda, sehingga setiap (umur, jenis kelamin) punya tiga titik potong kelas di rentang 30-140 cm.
+# Logitnya curam (probabilitas berubah tajam dalam satu langkah grid 0.25 cm), sehingga interpolasi
+# linear di dekat titik potong bisa memilih kelas lain dari argmax.
+HIDDEN_KERNEL = np.array([[0, 0, 1, -1], [0, 0, 0, 0], [1, -1, 0, 0]], dtype=np.float32)
+HIDDEN_BIAS = np.array([-0.5, 0.5, 0, 0], dtype=np.float32)
+SLOPES = 50 * np.array([-20.0, -6.0, 6.0, 20.0], dtype=np.float32)
+OUTPUT_KERNEL = np.stack([SLOPES, -SLOPES, 0.05 * SLOPES, -0.05 * SLOPES])
+OUTPUT_BIAS = 50 * np.array([-5.6, 0.0, 0.0, -5.6], dtype=np.float32)
+
+
+# Rentang fitur untuk scaler model buatan sendiri: umur 0-60 bulan, jenis kelamin 0/1, tinggi 45-120 cm
+FEATURE_MIN = np.array([0.0, 0.0, 45.0])
+FEATURE_MAX = np.array([60.0, 1.0, 120.0])
+
+# Variabel lingkungan yang dibaca main.py dan modul-modulnya; dikosongkan sebelum aplikasi dimuat
+APP_ENV_PREFIXES = ('INFERENCE_', 'MODEL_', 'TFLITE_', 'THRESHOLD_TABLE_', 'HEIGHT_FOR_AGE_', 'MAX_',
+                    'MICROBATCH_', 'PREDICTION_CACHE_', 'STREAM_', 'SHADOW_', 'ADMIN_TOKEN', 'ADMISSION_',
+                    'PROFILE_', 'METRICS_', 'IMAGE_', 'ARTICLES_')
+
+
+def fixture_model():
+    return NumpyMLP([(HIDDEN_KERNEL, HIDDEN_BIAS, 'relu'), (OUTPUT_KERNEL, OUTPUT_BIAS, 'softmax')])
+
+
+def fixture_scaler():
+    scale = 1.0 / (FEATURE_MAX - FEATURE_MIN)
+    return AffineScaler(scale, -FEATURE_MIN * scale, COLUMNS)
+
+
+def write_fixture_artifact(path, model_version='fixture', source_fingerprint=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return write_artifact(str(path), fixture_model(), fixture_scaler(), CLASSES,
+                          model_version=model_version, source_fingerprint=source_fingerprint)
+
+
+def write_fixture_h5(path):
+    # mlp_model.h5 dengan bobot model buatan sendiri (butuh TensorFlow)
+    tf = pytest.importorskip('tensorflow')
+    model = tf.keras.Sequential([
+        tf.keras.Input(shape=(3,)),
+        tf.keras.layers.Dense(4, activation='relu'),
+        tf.keras.layers.Dense(4, activation='softmax'),
+    ])
+    model.layers[0].set_weights([HIDDEN_KERNEL, HIDDEN_BIAS])
+    model.layers[1].set_weights([OUTPUT_KERNEL, OUTPUT_BIAS])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    model.save(str(path))
+    return model
+
+
+def write_fixture_pkl(path):
+    # scaler.pkl (MinMaxScaler) dengan rentang fitur yang sama seperti fixture_scaler()
+    joblib = pytest.importorskip('joblib')
+    from sklearn.preprocessing import MinMaxScaler
+
+    scaler = MinMaxScaler().fit(pd.DataFrame([FEATURE_MIN, FEATURE_MAX], columns=COLUMNS))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    joblib.dump(scaler, path)
+    return scaler
+
+
+@pytest.fixture
+def load_app(tmp_path, monkeypatch):
+    # load_app(**env) memuat main.py dari awal dengan environment `env`, di direktori kerja sementara
+    # yang berisi model/model.stm dari model buatan sendiri
+    write_fixture_artifact(tmp_path / 'model' / 'model.stm')
+    monkeypatch.chdir(tmp_path)
+    for key in list(os.environ):
+        if key.startswith(APP_ENV_PREFIXES):
+            monkeypatch.delenv(key)
+    monkeypatch.setenv('HEIGHT_FOR_AGE_REFERENCE_PATH', os.path.join(CC_DIR, 'reference', 'who_lhfa_lms.csv'))
+
+    def load(**env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, str(value))
+        for name in ('asgi', 'main', 'metrics'):
+            sys.modules.pop(name, None)
+        import main
+        return main
+
+    yield load
+    for name in ('asgi', 'main', 'metrics'):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def client(load_app):
+    return load_app().app.test_client()
+
+
+@pytest.fixture(scope='session')
+def dataset(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        'Umur': rng.integers(0, 61, 200),
+        'Jenis_Kelamin': rng.integers(0, 2, 200),
+        'Tinggi_Badan': np.round(rng.uniform(45.0, 120.0, 200), 1),
+    })
+    path = tmp_path_factory.mktemp('data') / 'dataset.csv'
+    frame.to_csv(path, index=False)
+    return path, frame
+
+
+@pytest.fixture(scope='session')
+def scaler_path(dataset, tmp_path_factory):
+    joblib = pytest.importorskip('joblib')
+    from sklearn.preprocessing import MinMaxScaler
+
+    path = tmp_path_factory.mktemp('scaler') / 'scaler.pkl'
+    joblib.dump(MinMaxScaler().fit(dataset[1][COLUMNS]), path)
+    return path
+
+
+@pytest.fixture(scope='session')
+def score(scaler_path):
+    import joblib
+
+    scaler = AffineScaler.from_sklearn(joblib.load(scaler_path))
+    model = fixture_model()
+    return lambda rows: model.predict(scaler.transform(np.asarray(rows, dtype=np.float64)))
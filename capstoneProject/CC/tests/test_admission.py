@@ -0,0 +1,48 @@
+RECORD = {'umur': 24, 'jenis_kelamin': 0, 'tinggi_badan': 85.5}
+
+
+def test_admission_control_is_off_by_default(client):
+    assert client.get('/metrics/admission').get_json() == {'enabled': False}
+    for _ in range(50):
+        assert client.post('/predict', json=RECORD).status_code == 200
+
+
+def test_rate_limit_per_client_returns_429(load_app):
+    client = load_app(ADMISSION_ENABLED=1, ADMISSION_INFERENCE_RATE=0.1, ADMISSION_INFERENCE_BURST=2).app.test_client()
+    first = {'X-Forwarded-For': '203.0.113.7'}
+    for _ in range(2):
+        assert client.post('/predict', json=RECORD, headers=first).status_code == 200
+    response = client.post('/predict', json=RECORD, headers=first)
+    assert response.status_code == 429
+    assert response.get_json() == {'error': 'Too many requests, slow down'}
+    assert 1 <= int(response.headers['Retry-After']) <= 10
+
+    # Klien lain, route ringan (pool 'light') dan /metrics tidak ikut dibatasi
+    assert client.post('/predict', json=RECORD, headers={'X-Forwarded-For': '203.0.113.8'}).status_code == 200
+    assert client.get('/articles', headers=first).status_code == 200
+    stats = client.get('/metrics/admission', headers=first).get_json()
+    assert stats['enabled'] is True
+    assert stats['inference']['rejected_rate_limited'] == 1 and stats['inference']['clients'] == 2
+    assert stats['light']['rejected_rate_limited'] == 0
+
+
+def test_full_inference_pool_returns_503(load_app):
+    client = load_app(ADMISSION_ENABLED=1, ADMISSION_INFERENCE_CONCURRENCY=1, ADMISSION_INFERENCE_QUEUE=0,
+                      ADMISSION_RETRY_AFTER=3).app.test_client()
+    # Respons /predict/stream yang belum selesai dibaca tetap memegang satu-satunya slot inferensi
+    stream = client.post('/predict/stream', data=b'{"umur": 24, "jenis_kelamin": 0, "tinggi_badan": 85.5}\n',
+                         content_type='application/x-ndjson', buffered=False)
+    assert stream.status_code == 200
+    response = client.post('/predict', json=RECORD)
+    assert response.status_code == 503
+    assert response.get_json() == {'error': 'Server is busy, retry later'}
+    assert response.headers['Retry-After'] == '3'
+    assert client.get('/articles').status_code == 200
+
+    stats = client.get('/metrics/admission').get_json()['inference']
+    assert (stats['active'], stats['rejected_overloaded'], stats['rejected_queue_full']) == (1, 1, 1)
+
+    assert b'predicted_class' in stream.get_data()
+    stream.close()
+    assert client.post('/predict', json=RECORD).status_code == 200
+    assert client.get('/metrics/admission').get_json()['inference']['active'] == 0
@@ -0,0 +1,126 @@
+import gzip
+
+import pytest
+
+try:
+    import brotli
+except ImportError:  # tanpa brotli hanya varian gzip yang disediakan
+    brotli = None
+
+
+@pytest.mark.parametrize('path', ['/articles', '/articles/1'])
+def test_article_responses_are_precompressed(client, path):
+    identity = client.get(path)
+    assert identity.status_code == 200
+    assert 'Content-Encoding' not in identity.headers
+    assert identity.headers['Vary'] == 'Accept-Encoding'
+    assert identity.headers['Cache-Control'] == 'public, max-age=300'
+
+    compressed = client.get(path, headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.data) == identity.data
+
+    if brotli is not None:
+        compressed = client.get(path, headers={'Accept-Encoding': 'gzip, br'})
+        assert compressed.headers['Content-Encoding'] == 'br'
+        assert brotli.decompress(compressed.data) == identity.data
+
+        compressed = client.get(path, headers={'Accept-Encoding': 'gzip;q=1.0, br;q=0.5'})
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+
+
+@pytest.mark.parametrize('path', ['/articles', '/articles/1', '/articles?predicted_class=stunted&limit=2'])
+def test_article_responses_revalidate_with_etag(client, path):
+    identity = client.get(path)
+    compressed = client.get(path, headers={'Accept-Encoding': 'gzip'})
+    etag = identity.headers['ETag']
+    # Setiap encoding punya ETag sendiri
+    assert compressed.headers['ETag'] != etag
+
+    for tag in (etag, compressed.headers['ETag']):
+        response = client.get(path, headers={'If-None-Match': tag, 'Accept-Encoding': 'gzip'})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == compressed.headers['ETag']
+
+    assert client.get(path, headers={'If-None-Match': '"other"'}).status_code == 200
+
+
+def test_article_list_and_detail_come_from_the_same_articles(client):
+    summaries = client.get('/articles').get_json()
+    assert len(summaries) == 20
+    for summary in summaries:
+        detail = client.get(f"/articles/{summary['id']}").get_json()
+        assert {field: detail[field] for field in summary} == summary
+        assert 'isi' in detail and 'isi' not in summary
+
+    response = client.get('/articles/999')
+    assert response.status_code == 404
+    assert response.get_json() == {'error': 'Article not found'}
+
+
+@pytest.mark.parametrize('predicted_class', ['stunted', 'Stunted', 'severely_stunted', 'severly_stunted'])
+def test_articles_filter_by_predicted_class(client, predicted_class):
+    articles = client.get('/articles', query_string={'predicted_class': predicted_class}).get_json()
+    assert len(articles) == 5
+    # Tanpa ARTICLES_LEGACY_LABELS=0 label severely_stunted dikirim dengan ejaan lama
+    expected = {'stunted': 'stunted', 'severely_stunted': 'severly_stunted', 'severly_stunted': 'severly_stunted'}
+    assert {article['predicted_class'] for article in articles} == {expected[predicted_class.lower()]}
+
+
+def test_articles_serve_canonical_labels_when_legacy_labels_are_off(load_app):
+    client = load_app(ARTICLES_LEGACY_LABELS=0).app.test_client()
+    labels = {article['predicted_class'] for article in client.get('/articles').get_json()}
+    assert labels == {'severely_stunted', 'stunted', 'normal', 'tinggi'}
+    assert client.get('/articles/1').get_json()['predicted_class'] in labels
+
+
+def test_articles_sort_project_and_paginate(client):
+    dates = [article['tanggal_dibuat'] for article in
+             client.get('/articles', query_string={'sort': '-tanggal_dibuat'}).get_json()]
+    assert dates == sorted(dates, reverse=True)
+
+    assert client.get('/articles', query_string={'fields': 'id,judul', 'limit': 1}).get_json()[0].keys() == {
+        'id', 'judul'}
+
+    pages = []
+    cursor = 0
+    while cursor is not None:
+        response = client.get('/articles', query_string={'sort': 'tanggal_dibuat', 'limit': 6, 'cursor': cursor})
+        pages.append([article['id'] for article in response.get_json()])
+        cursor = response.headers.get('X-Next-Cursor')
+    assert [len(page) for page in pages] == [6, 6, 6, 2]
+    assert sorted(sum(pages, [])) == list(range(1, 21))
+
+
+@pytest.mark.parametrize('query', [
+    {'predicted_class': 'unknown'},
+    {'sort': 'judul'},
+    {'fields': 'id,unknown'},
+    {'limit': 0},
+    {'limit': 'x'},
+    {'cursor': -1},
+])
+def test_articles_reject_invalid_queries(client, query):
+    response = client.get('/articles', query_string=query)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_article_search_ranks_title_matches(client):
+    results = client.get('/articles/search', query_string={'q': 'serat pencernaan'}).get_json()
+    assert results[0]['id'] == 2
+    assert results[0]['score'] > 0
+    assert results[0]['snippet']
+    assert set(results[0]) == {'id', 'judul', 'gambar', 'penulis', 'predicted_class', 'tanggal_dibuat',
+                               'score', 'snippet'}
+    scores = [result['score'] for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+    assert len(client.get('/articles/search', query_string={'q': 'anak', 'limit': 3}).get_json()) == 3
+    assert client.get('/articles/search', query_string={'q': 'xyzzy'}).get_json() == []
+
+
+@pytest.mark.parametrize('query', [{}, {'q': '  '}, {'q': 'anak', 'limit': 0}, {'q': 'anak', 'limit': 'x'}])
+def test_article_search_rejects_invalid_queries(client, query):
+    assert client.get('/articles/search', query_string=query).status_code == 400
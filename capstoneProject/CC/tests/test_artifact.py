@@ -0,0 +1,58 @@
+import os
+
+import numpy as np
+import pytest
+
+from artifact import ArtifactError, ModelArtifact, convert
+from conftest import CLASSES, fixture_model, fixture_scaler, write_fixture_artifact, write_fixture_h5, write_fixture_pkl
+
+
+def test_artifact_round_trip(tmp_path):
+    path = tmp_path / 'model.stm'
+    meta = write_fixture_artifact(path, model_version='v1', source_fingerprint='abc')
+
+    artifact = ModelArtifact(str(path))
+    assert artifact.model_version == 'v1'
+    assert artifact.source_fingerprint == 'abc'
+    assert artifact.classes == CLASSES == meta['classes']
+    rows = np.array([[12.0, 1.0, 60.0], [48.0, 0.0, 110.0]])
+    np.testing.assert_array_equal(artifact.model().predict(artifact.scaler().transform(rows)),
+                                  fixture_model().predict(fixture_scaler().transform(rows)))
+
+
+def test_rewriting_an_artifact_keeps_open_mappings_valid(tmp_path):
+    path = tmp_path / 'model.stm'
+    write_fixture_artifact(path, model_version='v1')
+    old = ModelArtifact(str(path))
+
+    write_fixture_artifact(path, model_version='v2')
+    # Artefak lama yang sudah di-mmap tetap bisa dibaca; file baru menggantikannya lewat rename
+    assert old.model_version == 'v1'
+    assert old.model().predict(np.zeros((1, 3))).shape == (1, 4)
+    assert ModelArtifact(str(path)).model_version == 'v2'
+    assert os.listdir(tmp_path) == ['model.stm']
+
+
+def test_truncated_artifact_is_rejected(tmp_path):
+    path = tmp_path / 'model.stm'
+    write_fixture_artifact(path)
+    path.write_bytes(path.read_bytes()[:-16])
+    with pytest.raises(ArtifactError, match='truncated'):
+        ModelArtifact(str(path))
+
+
+def test_server_ignores_an_artifact_from_other_sources(load_app, tmp_path):
+    write_fixture_h5(tmp_path / 'model' / 'mlp_model.h5')
+    write_fixture_pkl(tmp_path / 'model' / 'scaler.pkl')
+
+    # model.stm dari load_app tidak mencatat sumbernya: model dimuat dari mlp_model.h5 dan scaler.pkl
+    main = load_app()
+    assert main.model_manager.active.source == 'numpy'
+    client = main.app.test_client()
+    response = client.post('/predict', json={'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.0})
+    assert response.status_code == 200
+
+    convert('model/mlp_model.h5', 'model/scaler.pkl', 'model/model.stm', CLASSES, model_version='current')
+    main = load_app()
+    assert main.model_manager.active.source == 'artifact'
+    assert main.model_manager.active.version == 'current'
@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip('a2wsgi')
+
+RECORD = {'umur': 24, 'jenis_kelamin': 0, 'tinggi_badan': 85.5}
+
+
+def call_asgi(app, path, body, content_type='application/json'):
+    # Satu request HTTP langsung ke aplikasi ASGI: (status, body JSON)
+    scope = {'type': 'http', 'method': 'POST', 'path': path, 'query_string': b'', 'root_path': '',
+             'scheme': 'http', 'server': ('testserver', 80), 'client': ('127.0.0.1', 1234),
+             'http_version': '1.1', 'headers': [(b'content-type', content_type.encode('ascii')),
+                                                (b'content-length', str(len(body)).encode('ascii'))]}
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    status = next(message['status'] for message in sent if message['type'] == 'http.response.start')
+    return status, json.loads(b''.join(message.get('body', b'') for message in sent
+                                       if message['type'] == 'http.response.body'))
+
+
+@pytest.fixture
+def asgi(load_app):
+    load_app()
+    import asgi
+    return asgi
+
+
+@pytest.mark.parametrize('body', [b'{"umur": 24,', b'', b'\xff'])
+def test_invalid_json_gets_the_same_400_from_flask_and_asgi(asgi, body):
+    expected = {'error': 'Request body is not valid JSON'}
+    assert call_asgi(asgi.app, '/predict', body) == (400, expected)
+    response = asgi.main.app.test_client().post('/predict', data=body, content_type='application/json')
+    assert (response.status_code, response.get_json()) == (400, expected)
+
+
+def test_valid_json_gets_the_same_prediction_from_flask_and_asgi(asgi):
+    body = json.dumps(RECORD).encode('utf-8')
+    status, result = call_asgi(asgi.app, '/predict', body)
+    assert status == 200
+    assert asgi.main.app.test_client().post('/predict', json=RECORD).get_json() == result
+    assert call_asgi(asgi.app, '/predict', body, 'text/plain') == (400, {'error': 'Request must be JSON'})
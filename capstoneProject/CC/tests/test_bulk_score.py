@@ -0,0 +1,87 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bulk_score
+from conftest import CC_DIR, CLASSES, fixture_model, fixture_scaler, write_fixture_artifact
+from height_for_age import HeightForAge
+
+
+@pytest.fixture
+def register(tmp_path):
+    # Chunk pertama (2 baris) semuanya tidak valid dan di luar umur 0-60 bulan
+    frame = pd.DataFrame({
+        'Umur (bulan)': ['', '70', '12', '24', '36', '48'],
+        'Jenis Kelamin': ['laki-laki', 'wanita', 'perempuan', 'laki-laki', '1', '0'],
+        'Tinggi Badan (cm)': ['80.0', '90.0', '70.5', '86', '95.25', '101.0'],
+    })
+    path = tmp_path / 'register.csv'
+    frame.to_csv(path, index=False)
+    return path
+
+
+def pipeline_args(tmp_path, backend='artifact'):
+    artifact_path = tmp_path / 'model' / 'model.stm'
+    write_fixture_artifact(artifact_path)
+    return (backend, str(tmp_path / 'model' / 'mlp_model.h5'), str(tmp_path / 'model' / 'scaler.pkl'),
+            str(tmp_path / 'model' / 'scaler.npz'), str(artifact_path), str(tmp_path / 'model' / 'model.tflite'))
+
+
+def expected_classes():
+    rows = np.array([[12, 0, 70.5], [24, 1, 86.0], [36, 1, 95.25], [48, 0, 101.0]])
+    predictions = fixture_model().predict(fixture_scaler().transform(rows))
+    return [None, None] + [CLASSES[i] for i in predictions.argmax(axis=1)]
+
+
+@pytest.mark.parametrize('suffix', ['csv', 'parquet'])
+def test_bulk_score_keeps_types_when_first_chunk_is_invalid(tmp_path, register, suffix):
+    if suffix == 'parquet':
+        pytest.importorskip('pyarrow')
+    output = tmp_path / f'scored.{suffix}'
+    report = bulk_score.score_file(str(register), str(output), pipeline_args(tmp_path), workers=1, chunk_size=2,
+                                   height_for_age=HeightForAge())
+    assert report['rows'] == 6 and report['invalid_rows'] == 2
+
+    if suffix == 'parquet':
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(output)
+        assert str(schema.field('predicted_class').type) == 'string'
+        assert str(schema.field('prob_normal').type) == 'float'
+        assert str(schema.field('hfa_z_score').type) == 'double'
+        assert str(schema.field('hfa_status').type) == 'string'
+        assert str(schema.field('Tinggi Badan (cm)').type) == 'string'
+        scored = pd.read_parquet(output)
+        # Nilai input ditulis ulang persis seperti di file
+        assert scored['Tinggi Badan (cm)'].tolist() == ['80.0', '90.0', '70.5', '86', '95.25', '101.0']
+    else:
+        scored = pd.read_csv(output)
+    assert [value if isinstance(value, str) else None for value in scored['predicted_class']] == expected_classes()
+    assert scored['hfa_z_score'][:2].isna().all() and scored['hfa_z_score'][2:].notna().all()
+
+
+def test_bulk_score_tflite_backend(tmp_path, register):
+    pytest.importorskip('tensorflow')
+    from conftest import write_fixture_h5, write_fixture_pkl
+    import tflite_model
+
+    args = pipeline_args(tmp_path, backend='tflite')
+    write_fixture_h5(args[1])
+    write_fixture_pkl(args[2])
+    tflite_model.convert(args[1], args[5])
+    output = tmp_path / 'scored.csv'
+    bulk_score.score_file(str(register), str(output), args, workers=1, chunk_size=2)
+    scored = pd.read_csv(output)
+    assert [value if isinstance(value, str) else None for value in scored['predicted_class']] == expected_classes()
+
+
+def test_bulk_score_rejects_unknown_backend(tmp_path, register):
+    command = [sys.executable, 'bulk_score.py', str(register), str(tmp_path / 'scored.csv')]
+    result = subprocess.run(command + ['--backend', 'onnx'], cwd=CC_DIR, capture_output=True, text=True)
+    assert result.returncode == 2 and "invalid choice: 'onnx'" in result.stderr
+    result = subprocess.run(command, cwd=CC_DIR, capture_output=True, text=True,
+                            env={'INFERENCE_BACKEND': 'onnx', 'PATH': ''})
+    assert result.returncode == 2 and 'INFERENCE_BACKEND=onnx is not a known backend' in result.stderr
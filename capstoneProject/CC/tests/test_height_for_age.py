@@ -0,0 +1,47 @@
+import json
+import os
+
+import pytest
+
+from conftest import CC_DIR
+from height_for_age import HeightForAge, describe
+
+RECORDS = [
+    {'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 76.0},
+    {'umur': 36, 'jenis_kelamin': 0, 'tinggi_badan': 95.5},
+    {'umur': 72, 'jenis_kelamin': 1, 'tinggi_badan': 110.0},  # di luar tabel WHO 0-60 bulan
+]
+
+
+@pytest.fixture(scope='module')
+def reference():
+    return HeightForAge(os.path.join(CC_DIR, 'reference', 'who_lhfa_lms.csv'))
+
+
+def expected(reference, record):
+    return describe(reference.score_row(record['umur'], record['jenis_kelamin'], record['tinggi_badan']))
+
+
+def test_height_for_age_is_absent_by_default(client):
+    assert 'height_for_age' not in client.post('/predict', json=RECORDS[0]).get_json()
+    assert 'height_for_age' not in client.post('/predict/batch', json=RECORDS[:1]).get_json()['results'][0]
+
+
+@pytest.mark.parametrize('env', [{}, {'PREDICTION_CACHE_ENABLED': 1}, {'MICROBATCH_ENABLED': 1}])
+def test_height_for_age_on_every_predict_route(load_app, reference, env):
+    client = load_app(HEIGHT_FOR_AGE_ENABLED=1, **env).app.test_client()
+    assert expected(reference, RECORDS[0])['status'] == 'normal'
+    assert expected(reference, RECORDS[2]) is None
+
+    for _ in range(2):  # request kedua dijawab dari cache jika cache aktif
+        for record in RECORDS:
+            assert client.post('/predict', json=record).get_json()['height_for_age'] == expected(reference, record)
+
+    results = client.post('/predict/batch', json=RECORDS + [{'umur': 12}]).get_json()['results']
+    assert [result['height_for_age'] for result in results[:3]] == [expected(reference, r) for r in RECORDS]
+    assert 'height_for_age' not in results[3]
+
+    body = ''.join(json.dumps(record) + '\n' for record in RECORDS)
+    response = client.post('/predict/stream', data=body, content_type='application/x-ndjson')
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [result['height_for_age'] for result in results] == [expected(reference, r) for r in RECORDS]
@@ -0,0 +1,167 @@
+import io
+import os
+import threading
+import time
+
+import pytest
+
+import image_proxy
+from image_proxy import DiskCache, FetchError, ImageProxy, UrlFetcher
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def png(width=200, height=100):
+    out = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 40, 40)).save(out, format='PNG')
+    return out.getvalue()
+
+
+class FakeFetcher:
+    # Pengganti host gambar: menghitung unduhan, dan bisa ditahan sampai `release` di-set
+    def __init__(self, body=None, content_type='image/png', error=None):
+        self.body = body if body is not None else png()
+        self.content_type = content_type
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, url):
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise FetchError(self.error)
+        return self.body, self.content_type
+
+
+def test_concurrent_requests_for_one_image_fetch_and_resize_once(tmp_path):
+    fetcher = FakeFetcher()
+    fetcher.release.clear()
+    proxy = ImageProxy(DiskCache(str(tmp_path), 1 << 20), fetcher)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(proxy.get('https://example.com/a.png', 160)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    # Unduhan ditahan sampai semua request lain menunggu hasilnya
+    deadline = time.monotonic() + 5
+    while proxy.stats()['coalesced'] < 7 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    fetcher.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert fetcher.calls == 1
+    assert proxy.stats()['coalesced'] == 7 and proxy.stats()['fetches'] == 1
+    assert len(results) == 8 and len({body for body, _ in results}) == 1
+    assert results[0][1] == 'image/jpeg'
+    with Image.open(io.BytesIO(results[0][0])) as image:
+        assert image.size == (160, 80)
+
+
+def test_disk_cache_evicts_least_recently_used_without_rescanning(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path), max_bytes=250)
+    cache.put('a', b'a' * 100)
+    cache.put('b', b'b' * 100)
+    assert cache.get('a') == b'a' * 100
+
+    def rescan():
+        raise AssertionError('put rescanned the cache directory')
+
+    monkeypatch.setattr(cache, '_rescan', rescan)
+    cache.put('c', b'c' * 100)
+    assert sorted(os.listdir(tmp_path)) == ['a', 'c']
+    assert cache.get('b') is None
+    stats = cache.stats()
+    assert (stats['entries'], stats['bytes'], stats['evictions']) == (2, 200, 1)
+    # Menulis ulang file yang sama tidak menghitung ukurannya dua kali
+    cache.put('c', b'c' * 50)
+    assert cache.stats()['bytes'] == 150
+
+
+def test_disk_cache_picks_up_other_workers_files_on_rescan(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=250, rescan_interval=0)
+    cache.put('a', b'a' * 100)
+    other = DiskCache(str(tmp_path), max_bytes=250)
+    other.put('b', b'b' * 100)
+    cache.put('c', b'c' * 100)
+    assert sorted(os.listdir(tmp_path)) == ['b', 'c']
+
+
+def test_failed_origin_is_not_retried_within_failure_ttl(tmp_path, monkeypatch):
+    fetcher = FakeFetcher(error='connection refused')
+    proxy = ImageProxy(DiskCache(str(tmp_path), 1 << 20), fetcher, failure_ttl=60)
+    for _ in range(3):
+        with pytest.raises(FetchError, match='connection refused'):
+            proxy.get('https://example.com/a.png')
+    assert fetcher.calls == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(image_proxy.time, 'monotonic', lambda: now + 61)
+    fetcher.error = None
+    assert proxy.get('https://example.com/a.png') == (fetcher.body, 'image/png')
+    assert fetcher.calls == 2
+
+
+def test_oversized_images_are_rejected(tmp_path, monkeypatch):
+    path = tmp_path / 'large.png'
+    path.write_bytes(png())
+    with pytest.raises(FetchError, match='exceeds 100 bytes'):
+        UrlFetcher(max_bytes=100)(path.as_uri())
+    assert UrlFetcher()(path.as_uri()) == (path.read_bytes(), 'image/png')
+
+    monkeypatch.setattr(image_proxy, 'MAX_IMAGE_PIXELS', 100 * 100)
+    proxy = ImageProxy(DiskCache(str(tmp_path / 'cache'), 1 << 20), FakeFetcher())
+    with pytest.raises(Image.DecompressionBombError):
+        proxy.get('https://example.com/large.png', 160)
+
+
+def test_image_proxy_is_disabled_by_default(client):
+    assert client.get('/articles/1/image').status_code == 404
+    assert client.get('/metrics/images').get_json() == {'enabled': False}
+
+
+@pytest.fixture
+def image_app(load_app, tmp_path):
+    main = load_app(IMAGE_PROXY_ENABLED=1, IMAGE_CACHE_DIR=tmp_path / 'images')
+    main.image_proxy.fetcher = FakeFetcher()
+    return main
+
+
+def test_article_image_route(image_app):
+    client = image_app.app.test_client()
+    response = client.get('/articles/1/image?w=300', headers={'Accept': 'image/webp,image/*'})
+    assert response.status_code == 200
+    assert response.mimetype == 'image/webp'
+    assert response.headers['Cache-Control'] == 'public, max-age=2592000'
+    assert response.headers['Vary'] == 'Accept'
+    with Image.open(io.BytesIO(response.data)) as image:
+        assert image.size == (200, 100)  # tidak pernah diperbesar
+
+    etag = response.headers['ETag']
+    assert client.get('/articles/1/image?w=300', headers={'Accept': 'image/webp',
+                                                          'If-None-Match': etag}).status_code == 304
+    response = client.get('/articles/1/image?w=160&format=jpeg')
+    assert response.mimetype == 'image/jpeg' and 'Vary' not in response.headers
+    assert client.get('/articles/1/image').data == image_app.image_proxy.fetcher.body
+    assert image_app.image_proxy.fetcher.calls == 1
+
+    stats = client.get('/metrics/images').get_json()
+    assert stats['enabled'] and stats['fetches'] == 1 and stats['entries'] == 3
+
+    assert client.get('/articles/1/image?w=0').status_code == 400
+    assert client.get('/articles/1/image?format=gif').status_code == 400
+    assert client.get('/articles/999/image').status_code == 404
+
+
+def test_article_image_route_reports_origin_errors_as_502(image_app, monkeypatch):
+    client = image_app.app.test_client()
+    image_app.image_proxy.fetcher.error = 'connection refused'
+    response = client.get('/articles/1/image')
+    assert response.status_code == 502 and 'connection refused' in response.get_json()['error']
+
+    image_app.image_proxy.fetcher.error = None
+    monkeypatch.setattr(image_proxy, 'MAX_IMAGE_PIXELS', 100 * 100)
+    response = client.get('/articles/2/image?w=160')
+    assert response.status_code == 502 and 'exceeds limit' in response.get_json()['error']
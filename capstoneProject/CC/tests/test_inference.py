@@ -0,0 +1,33 @@
+# Pengujian memakai model kecil buatan sendiri (conftest.py), sehingga tidak butuh file di model/:
+#   python -m pytest tests
+import numpy as np
+
+from conftest import fixture_model, write_fixture_h5
+from inference import resolve_backend, verify_parity
+
+
+def test_numpy_backend_matches_keras(dataset, scaler_path, tmp_path):
+    model_path = tmp_path / 'model.h5'
+    write_fixture_h5(model_path)
+
+    report = verify_parity(str(model_path), str(scaler_path), str(dataset[0]))
+    assert report['ok'], report
+
+
+
+def test_numpy_backend_predicts_probabilities():
+    model = fixture_model()
+    predictions = model.predict(np.array([[0.5, 1.0, 0.2], [0.5, 0.0, 0.9]]))
+    assert predictions.shape == (2, 4)
+    np.testing.assert_allclose(predictions.sum(axis=1), 1.0, rtol=1e-6)
+    np.testing.assert_array_equal(model.predict(np.array([0.5, 1.0, 0.2])), predictions[:1])
+
+
+def test_resolve_backend_order(tmp_path, monkeypatch):
+    artifact_path = tmp_path / 'model.stm'
+    monkeypatch.delenv('INFERENCE_BACKEND', raising=False)
+    assert resolve_backend(str(artifact_path)) == 'keras'
+    artifact_path.write_bytes(b'')
+    assert resolve_backend(str(artifact_path)) == 'artifact'
+    monkeypatch.setenv('INFERENCE_BACKEND', 'numpy')
+    assert resolve_backend(str(artifact_path)) == 'numpy'
@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+import metrics
+
+
+def write_worker_snapshot(directory, pid, requests, latency, in_flight):
+    registry = metrics.Registry(str(directory))
+    counter = registry.register(metrics.Counter('requests', 'Requests', ('endpoint',)))
+    histogram = registry.register(metrics.Histogram('latency', 'Latency', ('endpoint',), buckets=(0.1, 1.0)))
+    gauge = registry.register(metrics.Gauge('in_flight', 'In flight', ('endpoint',)))
+    counter.inc('/predict', amount=requests)
+    histogram.observe(latency, '/predict')
+    gauge.set(in_flight, '/predict')
+    snapshot = {metric.name: [metric.kind, metric.snapshot()] for metric in (counter, histogram, gauge)}
+    with open(os.path.join(directory, f'{pid}.json'), 'w') as f:
+        json.dump(snapshot, f)
+    return registry
+
+
+def test_dead_workers_are_merged_into_one_snapshot(tmp_path):
+    for pid, requests, latency in ((101, 3, 0.05), (102, 4, 0.5), (103, 5, 2.0)):
+        write_worker_snapshot(tmp_path, pid, requests, latency, in_flight=1)
+    registry = write_worker_snapshot(tmp_path, 104, 0, 0.05, in_flight=2)
+
+    for pid in (101, 102, 103):
+        metrics.mark_process_dead(pid, str(tmp_path))
+    # Worker baru dengan pid yang sama tidak menimpa total worker yang sudah berhenti
+    write_worker_snapshot(tmp_path, 101, 1, 0.05, in_flight=0)
+    metrics.mark_process_dead(101, str(tmp_path))
+
+    assert sorted(os.listdir(tmp_path)) == ['104.json', metrics.DEAD_SNAPSHOT]
+    snapshots = registry._read_snapshots()
+    requests, latency, in_flight = registry._metrics
+    assert requests.merge({pid: s['requests'][1] for pid, s in snapshots.items()}) == {('/predict',): 13}
+    (counts, total, count), = latency.merge({pid: s['latency'][1] for pid, s in snapshots.items()}).values()
+    assert (counts, count) == ([3, 1, 1], 5)
+    assert total == pytest.approx(2.65)
+    # Gauge worker yang sudah berhenti dibuang
+    assert in_flight.merge({pid: s['in_flight'][1] for pid, s in snapshots.items() if 'in_flight' in s}) == {
+        ('/predict', '104'): 2}
+
+
+def test_mark_process_dead_ignores_unknown_workers(tmp_path):
+    metrics.mark_process_dead(999, str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_metrics_route_counts_requests(load_app):
+    client = load_app().app.test_client()
+    client.post('/predict', json={'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.0})
+    client.get('/articles/999')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    text = response.get_data(as_text=True)
+    assert 'stunttrack_http_requests_total{endpoint="/predict",method="POST",status="200"} 1' in text
+    assert 'stunttrack_http_requests_total{endpoint="/articles/<int:id>",method="GET",status="404"} 1' in text
+    assert 'stunttrack_stage_duration_seconds_count{endpoint="/predict",stage="inference"} 1' in text
+
+
+def test_metrics_route_merges_worker_snapshots(load_app, tmp_path):
+    directory = tmp_path / 'metrics'
+    directory.mkdir()
+    client = load_app(METRICS_MULTIPROC_DIR=directory).app.test_client()
+    client.get('/')
+    # Snapshot worker lain yang sudah berhenti
+    with open(directory / metrics.DEAD_SNAPSHOT, 'w') as f:
+        json.dump({'stunttrack_http_requests': ['counter', [[['/', 'GET', '200'], 5]]]}, f)
+
+    text = client.get('/metrics').get_data(as_text=True)
+    assert 'stunttrack_http_requests_total{endpoint="/",method="GET",status="200"} 6' in text
+    assert f'stunttrack_http_requests_in_flight{{endpoint="/metrics",pid="{os.getpid()}"}} 1' in text
+
+
+def test_metrics_route_is_off_when_disabled(load_app):
+    client = load_app(METRICS_ENABLED=0).app.test_client()
+    assert client.get('/metrics').status_code == 404
@@ -0,0 +1,79 @@
+import threading
+
+import numpy as np
+
+from batching import MicroBatcher
+
+GOOD = {'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.0}
+NUMERIC_STRING = {'umur': 24, 'jenis_kelamin': '0', 'tinggi_badan': 85.5}
+BAD = {'umur': 36, 'jenis_kelamin': 'perempuan', 'tinggi_badan': 95.0}
+NESTED = {'umur': 36, 'jenis_kelamin': [1], 'tinggi_badan': 95.0}
+RECORDS = [GOOD, NUMERIC_STRING, BAD, NESTED] * 4
+
+
+def predict_concurrently(app, records):
+    # Semua request dikirim bersamaan agar masuk ke batch yang sama
+    results = [None] * len(records)
+    barrier = threading.Barrier(len(records))
+
+    def send(i):
+        client = app.test_client()
+        barrier.wait()
+        response = client.post('/predict', json=records[i])
+        results[i] = response.status_code, response.get_json()
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(len(records))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_micro_batching_does_not_change_responses(load_app):
+    unbatched = load_app().app.test_client()
+    expected = [(response.status_code, response.get_json())
+                for response in (unbatched.post('/predict', json=record) for record in RECORDS)]
+    assert [status for status, _ in expected[:4]] == [200, 200, 500, 500]
+
+    main = load_app(MICROBATCH_ENABLED=1, MICROBATCH_WINDOW_MS=50, MICROBATCH_MAX_SIZE=64)
+    results = predict_concurrently(main.app, RECORDS)
+
+    for (status, body), (expected_status, expected_body) in zip(results, expected):
+        assert status == expected_status
+        if status == 200:
+            assert body['predicted_class'] == expected_body['predicted_class']
+            np.testing.assert_allclose(body['prediction_probability'], expected_body['prediction_probability'],
+                                       atol=1e-6)
+        else:
+            assert body == expected_body
+
+    # Request yang valid memang dijalankan bersama dalam batch
+    stats = main.micro_batcher.stats()
+    assert stats['requests'] == 8
+    assert stats['batches'] < stats['requests']
+
+
+def test_micro_batcher_keeps_keys_apart():
+    seen = []
+
+    def run_batch(matrix, key):
+        seen.append((key, len(matrix)))
+        return matrix * key
+
+    batcher = MicroBatcher(run_batch, max_batch_size=8, window_ms=50)
+    results = {}
+    barrier = threading.Barrier(6)
+
+    def submit(i, key):
+        barrier.wait()
+        results[i] = batcher.submit(np.array([float(i)]), key=key)
+
+    threads = [threading.Thread(target=submit, args=(i, 1 if i % 2 else 10)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {i: float(value[0]) for i, value in results.items()} == {i: i * (1 if i % 2 else 10) for i in range(6)}
+    assert sum(size for _, size in seen) == 6
@@ -0,0 +1,67 @@
+import os
+import time
+
+import pytest
+
+from conftest import write_fixture_artifact
+from model_registry import ModelRegistry
+
+HEADERS = {'Authorization': 'Bearer secret'}
+
+
+@pytest.fixture
+def registry(load_app):
+    # Registry di direktori kerja load_app: v1 aktif, v2 dengan model.stm terpotong
+    registry = ModelRegistry('model/registry')
+    write_fixture_artifact('build/v1.stm', model_version='v1')
+    registry.publish('build/v1.stm')
+    registry.activate('v1')
+    os.makedirs('model/registry/v2')
+    with open('build/v1.stm', 'rb') as source, open('model/registry/v2/model.stm', 'wb') as f:
+        f.write(source.read()[:200])
+    return registry
+
+
+def wait_for_reload(client):
+    for _ in range(200):
+        status = client.get('/admin/model', headers=HEADERS).get_json()
+        if status['reload']['state'] != 'loading':
+            return status
+        time.sleep(0.01)
+    raise AssertionError('reload did not finish')
+
+
+def test_reload_of_corrupt_version_keeps_current(load_app, registry):
+    client = load_app(ADMIN_TOKEN='secret', MODEL_REGISTRY_POLL_SECONDS=0).app.test_client()
+    assert client.post('/predict', json={'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 75}).get_json()[
+        'model_version'] == 'v1'
+
+    response = client.post('/admin/model/reload', json={'version': 'v2'}, headers=HEADERS)
+    assert response.status_code == 202
+    status = wait_for_reload(client)
+    assert status['reload']['state'] == 'failed' and 'truncated' in status['reload']['error']
+    assert status['active']['version'] == 'v1'
+    assert registry.current() == 'v1'
+
+    # Versi yang berhasil dimuat baru menjadi CURRENT
+    write_fixture_artifact('build/v3.stm', model_version='v3')
+    registry.publish('build/v3.stm')
+    assert client.post('/admin/model/reload', json={'version': 'v3'}, headers=HEADERS).status_code == 202
+    status = wait_for_reload(client)
+    assert status['reload']['state'] == 'idle' and status['active']['version'] == 'v3'
+    assert registry.current() == 'v3'
+
+
+def test_startup_with_corrupt_current_falls_back_to_local_model(load_app, registry):
+    registry.activate('v2')
+    main = load_app(MODEL_REGISTRY_POLL_SECONDS=0)
+    status = main.model_manager.status()
+    assert status['active']['version'] == 'fixture'
+    assert status['failed_version'] == 'v2'
+    # Watcher tidak mencoba versi yang sama lagi sampai CURRENT berubah
+    assert main.model_manager.check_registry() is False
+    registry.activate('v1')
+    assert main.model_manager.check_registry() is True
+    main.model_manager._reload_lock.acquire()
+    main.model_manager._reload_lock.release()
+    assert main.model_manager.active.version == 'v1'
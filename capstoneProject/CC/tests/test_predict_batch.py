@@ -0,0 +1,42 @@
+import numpy as np
+
+RECORDS = [
+    {'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.0},
+    {'umur': 24, 'jenis_kelamin': 0, 'tinggi_badan': 85.5},
+    {'umur': 48, 'jenis_kelamin': 1, 'tinggi_badan': 115.0},
+]
+
+
+def test_batch_matches_single_predictions(client):
+    response = client.post('/predict/batch', json=RECORDS)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['model_version'] == 'fixture'
+    assert len(body['results']) == len(RECORDS)
+
+    for record, result in zip(RECORDS, body['results']):
+        single = client.post('/predict', json=record).get_json()
+        assert result['predicted_class'] == single['predicted_class']
+        np.testing.assert_allclose(result['prediction_probability'], single['prediction_probability'], atol=1e-6)
+
+
+def test_batch_reports_invalid_records_per_row(client):
+    records = [RECORDS[0], {'umur': 12}, 'not a record', {'umur': 'x', 'jenis_kelamin': 1, 'tinggi_badan': 60}]
+    results = client.post('/predict/batch', json=records).get_json()['results']
+    assert 'predicted_class' in results[0]
+    assert results[1] == {'error': 'Missing features in request'}
+    assert results[2] == {'error': 'Record must be a JSON object'}
+    assert results[3] == {'error': 'Umur and Tinggi_Badan must be numeric values'}
+
+
+def test_batch_rejects_bad_bodies(load_app):
+    client = load_app(MAX_BATCH_SIZE=2).app.test_client()
+    assert client.post('/predict/batch', data='x', content_type='text/plain').status_code == 400
+    assert client.post('/predict/batch', json={'umur': 12}).get_json() == {
+        'error': 'Request body must be a JSON array of records'}
+    response = client.post('/predict/batch', json=RECORDS)
+    assert response.status_code == 413
+    assert client.post('/predict/batch', json=[]).get_json()['results'] == []
+    response = client.post('/predict/batch', data='[{"umur": 12,', content_type='application/json')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Request body is not valid JSON'}
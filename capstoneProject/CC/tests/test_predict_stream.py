@@ -0,0 +1,59 @@
+import json
+
+import numpy as np
+
+RECORDS = [
+    {'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.0},
+    {'umur': 24, 'jenis_kelamin': 0, 'tinggi_badan': 85.5},
+    {'umur': 48, 'jenis_kelamin': 1, 'tinggi_badan': 115.0},
+]
+
+
+def ndjson(*lines):
+    return ''.join(lines).encode('utf-8')
+
+
+def post_stream(client, body, content_type='application/x-ndjson'):
+    response = client.post('/predict/stream', data=body, content_type=content_type)
+    return response, [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_stream_matches_batch_predictions(load_app):
+    # Batch kecil: hasil ditulis dalam beberapa potongan, urutan tetap sama dengan input
+    client = load_app(STREAM_BATCH_SIZE=2).app.test_client()
+    response, results = post_stream(client, ndjson(*(json.dumps(record) + '\n' for record in RECORDS)))
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    expected = client.post('/predict/batch', json=RECORDS).get_json()['results']
+    assert len(results) == len(RECORDS)
+    for result, single in zip(results, expected):
+        assert result['predicted_class'] == single['predicted_class']
+        np.testing.assert_allclose(result['prediction_probability'], single['prediction_probability'], atol=1e-6)
+
+
+def test_stream_reports_errors_per_line(client):
+    body = ndjson(json.dumps(RECORDS[0]) + '\n', '{"umur": 12,\n', '\n', '[1, 2]\n',
+                  '{"umur": 12, "jenis_kelamin": "x", "tinggi_badan": 80}\n', json.dumps(RECORDS[1]))
+    response, results = post_stream(client, body, 'application/jsonl')
+    assert response.status_code == 200
+    # Baris kosong dilewati, baris lain mendapat tepat satu hasil
+    assert len(results) == 5
+    assert 'predicted_class' in results[0] and 'predicted_class' in results[4]
+    assert results[1] == {'error': 'Record is not valid JSON'}
+    assert results[2] == {'error': 'Record must be a JSON object'}
+    assert results[3] == {'error': 'Jenis_Kelamin must be a numeric value'}
+
+
+def test_stream_skips_oversized_lines(load_app):
+    client = load_app(MAX_STREAM_LINE_SIZE=100).app.test_client()
+    padded = dict(RECORDS[0], catatan='x' * 500)
+    response, results = post_stream(client, ndjson(json.dumps(padded) + '\n', json.dumps(RECORDS[1]) + '\n'))
+    assert response.status_code == 200
+    assert results[0] == {'error': 'Record exceeds the maximum line size of 100 bytes'}
+    assert 'predicted_class' in results[1]
+
+
+def test_stream_requires_ndjson(client):
+    response = client.post('/predict/stream', json=RECORDS)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Request must be NDJSON (application/x-ndjson)'}
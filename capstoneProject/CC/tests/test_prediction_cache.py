@@ -0,0 +1,46 @@
+import pytest
+
+from prediction_cache import PredictionCache
+
+RECORD = {'umur': 12, 'jenis_kelamin': 1, 'tinggi_badan': 60.004}
+
+
+@pytest.mark.parametrize('values', [
+    (1e308, 1, 60.0),
+    (12, 1, 1e308),
+    (10 ** 400, 1, 60.0),
+    (float('nan'), 1, 60.0),
+    (12, '1', 60.0),
+    (12, True, 60.0),
+])
+def test_uncacheable_inputs_have_no_key(values):
+    assert PredictionCache().key(*values) is None
+
+
+def test_key_quantizes_inputs():
+    cache = PredictionCache(age_step=0.5, height_step=0.1)
+    assert cache.key(12.2, 1, 60.04) == cache.key(12.0, 1, 59.96)
+    assert cache.features(cache.key(12.2, 1, 60.04)) == (12.0, 1.0, pytest.approx(60.0))
+
+
+def test_cached_predictions_match_the_model(load_app):
+    uncached = load_app().app.test_client().post('/predict', json={**RECORD, 'tinggi_badan': 60.0}).get_json()
+
+    client = load_app(PREDICTION_CACHE_ENABLED=1).app.test_client()
+    first = client.post('/predict', json=RECORD).get_json()
+    second = client.post('/predict', json=RECORD).get_json()
+    assert first == second == uncached
+    stats = client.get('/metrics/cache').get_json()
+    assert (stats['enabled'], stats['hits'], stats['misses'], stats['entries']) == (True, 1, 1, 1)
+
+
+@pytest.mark.parametrize('umur', [1e308, 1.7976931348623157e308])
+def test_huge_inputs_skip_the_cache(load_app, umur):
+    record = {**RECORD, 'umur': umur}
+    expected = load_app().app.test_client().post('/predict', json=record)
+
+    client = load_app(PREDICTION_CACHE_ENABLED=1).app.test_client()
+    response = client.post('/predict', json=record)
+    assert response.status_code == expected.status_code == 200
+    assert response.get_json() == expected.get_json()
+    assert client.get('/metrics/cache').get_json()['entries'] == 0
@@ -0,0 +1,44 @@
+import joblib
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+
+from conftest import COLUMNS
+from scaling import AffineScaler, export_scaler, load_scaler, verify_scaler
+
+
+def test_affine_scaler_matches_sklearn(dataset, scaler_path):
+    report = verify_scaler(str(scaler_path), str(dataset[0]))
+    assert report['batch_identical'] and report['single_row_identical'], report
+
+
+def test_load_scaler_prefers_exported_parameters(scaler_path, tmp_path):
+    npz_path = tmp_path / 'scaler.npz'
+    exported = export_scaler(str(scaler_path), str(npz_path))
+
+    scaler = load_scaler(str(npz_path), str(scaler_path))
+    assert scaler.source_fingerprint == exported.source_fingerprint
+    np.testing.assert_array_equal(scaler.scale_, exported.scale_)
+
+
+def test_load_scaler_ignores_parameters_exported_from_another_pkl(dataset, scaler_path, tmp_path):
+    npz_path = tmp_path / 'scaler.npz'
+    pkl_path = tmp_path / 'scaler.pkl'
+    export_scaler(str(scaler_path), str(npz_path))
+
+    # Model dilatih ulang: scaler.pkl baru, scaler.npz masih dari scaler lama
+    retrained = MinMaxScaler().fit(dataset[1][COLUMNS] * 2)
+    joblib.dump(retrained, pkl_path)
+
+    scaler = load_scaler(str(npz_path), str(pkl_path))
+    np.testing.assert_array_equal(scaler.scale_, retrained.scale_)
+
+
+def test_load_scaler_ignores_parameters_without_source(scaler_path, tmp_path):
+    npz_path = tmp_path / 'scaler.npz'
+    stale = AffineScaler(np.ones(3), np.zeros(3), COLUMNS)
+    stale.save(str(npz_path))
+
+    scaler = load_scaler(str(npz_path), str(scaler_path))
+    np.testing.assert_array_equal(scaler.scale_, joblib.load(scaler_path).scale_)
+    # Tanpa scaler.pkl parameter yang diekspor tetap dipakai
+    assert load_scaler(str(npz_path), str(tmp_path / 'missing.pkl')).scale_.tolist() == [1.0, 1.0, 1.0]
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import write_fixture_h5, write_fixture_pkl
+from inference import load_bundle
+
+ROWS = np.array([[12, 0, 70.5], [24, 1, 86.0], [36, 1, 95.25], [48, 0, 101.0]])
+
+
+@pytest.fixture
+def converted(tmp_path):
+    pytest.importorskip('tensorflow')
+    import tflite_model
+
+    paths = {name: str(tmp_path / 'model' / name) for name in ('mlp_model.h5', 'scaler.pkl', 'model.tflite')}
+    model = write_fixture_h5(paths['mlp_model.h5'])
+    write_fixture_pkl(paths['scaler.pkl'])
+    tflite_model.convert(paths['mlp_model.h5'], paths['model.tflite'])
+    return model, paths
+
+
+def load(paths):
+    return load_bundle('tflite', paths['mlp_model.h5'], paths['scaler.pkl'], 'missing.npz', 'missing.stm',
+                       paths['model.tflite'], tflite_pool_size=1)
+
+
+def test_tflite_model_is_used_when_converted_from_current_h5(converted):
+    _, paths = converted
+    assert os.path.exists(paths['model.tflite'] + '.json')
+    bundle = load(paths)
+    assert bundle.source == 'tflite'
+    assert bundle.model.__class__.__name__ == 'TFLiteModel'
+
+
+def test_tflite_model_from_another_h5_falls_back_to_numpy(converted, caplog):
+    model, paths = converted
+    # Model dilatih ulang setelah konversi: model.tflite masih berisi bobot lama
+    kernel, bias = model.layers[1].get_weights()
+    model.layers[1].set_weights([kernel, bias + np.array([0, 0, 0, 1e4], dtype=np.float32)])
+    model.save(paths['mlp_model.h5'])
+
+    bundle = load(paths)
+    assert bundle.source == 'numpy'
+    assert 'was not converted from the current' in caplog.text
+    assert (bundle.score(ROWS).argmax(axis=1) == 3).all()
+
+
+def test_tflite_model_without_recorded_source_falls_back_to_numpy(converted):
+    _, paths = converted
+    os.remove(paths['model.tflite'] + '.json')
+    assert load(paths).source == 'numpy'
+    # Tanpa mlp_model.h5, model.tflite tidak bisa diperiksa dan tetap dipakai
+    os.remove(paths['mlp_model.h5'])
+    assert load(paths).source == 'tflite'
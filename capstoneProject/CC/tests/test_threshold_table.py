@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from conftest import CLASSES
+from threshold_table import ThresholdTable, build_table, verify_table
+
+
+@pytest.fixture(scope='module')
+def table(score):
+    return build_table(score, 'fixture', CLASSES)
+
+
+def test_threshold_table_matches_model(table, score):
+    report = verify_table(ThresholdTable(table, exact_score=score), score, step=0.01)
+    assert report['disagreements'] == 0, report['examples']
+    assert report['class_probability_mismatches'] == 0, report['class_probability_examples']
+
+
+def test_threshold_table_class_is_probability_argmax_near_cuts(table, score):
+    interp = ThresholdTable(table, exact_score=score)
+    without_model = ThresholdTable(table)
+    probed = 0
+    for key, cuts in enumerate(interp._cuts):
+        umur, jenis_kelamin = divmod(key, 2)
+        assert len(cuts) == 3
+        for cut in cuts:
+            for tinggi_badan in np.arange(cut - 0.3, cut + 0.3, 0.013):
+                predicted_class, probabilities = interp.lookup(umur, jenis_kelamin, float(tinggi_badan))
+                assert predicted_class == int(np.argmax(probabilities))
+                # Tanpa fungsi skor, tinggi badan di dekat titik potong diteruskan ke model
+                result = without_model.lookup(umur, jenis_kelamin, float(tinggi_badan))
+                assert result is None or result[0] == int(np.argmax(result[1]))
+                probed += 1
+    assert probed > 0
+
+
+def test_threshold_table_skips_inputs_outside_its_domain(table, score):
+    interp = ThresholdTable(table, exact_score=score)
+    assert interp.lookup(12.5, 1, 80.0) is None
+    assert interp.lookup(12, 2, 80.0) is None
+    assert interp.lookup(12, 1, 200.0) is None
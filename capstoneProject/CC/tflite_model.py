@@ -0,0 +1,216 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import statistics
+import time
+
+import numpy as np
+
+from threshold_table import file_fingerprint
+
+FEATURES = ['Umur', 'Jenis_Kelamin', 'Tinggi_Badan']
+QUANTIZATION = ('float', 'int8')
+DEFAULT_PATHS = {'float': 'model/model.tflite', 'int8': 'model/model_int8.tflite'}
+
+
+def _interpreter_class():
+    # tflite_runtime jauh lebih kecil dari TensorFlow; dipakai jika terpasang
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteModel:
+    # Satu interpreter TFLite tidak boleh dipakai dua thread sekaligus, jadi disediakan pool
+    # interpreter: setiap prediksi meminjam satu interpreter lalu mengembalikannya.
+    def __init__(self, path, pool_size=4, num_threads=1):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        with open(path, 'rb') as f:
+            self._content = f.read()  # satu salinan flatbuffer dipakai bersama semua interpreter
+        Interpreter = _interpreter_class()
+
+        self.path = path
+        self.pool_size = pool_size
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            interpreter = Interpreter(model_content=self._content, num_threads=num_threads)
+            interpreter.allocate_tensors()
+            self._pool.put(interpreter)
+
+        interpreter = self._pool.queue[0]
+        input_detail = interpreter.get_input_details()[0]
+        output_detail = interpreter.get_output_details()[0]
+        self.input_dim = int(input_detail['shape'][-1])
+        self.output_dim = int(output_detail['shape'][-1])
+        self.input_dtype = np.dtype(input_detail['dtype'])
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=self.input_dtype)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+
+        interpreter = self._pool.get()
+        try:
+            input_index = interpreter.get_input_details()[0]['index']
+            # Ukuran batch tensor input diubah hanya jika berbeda dari prediksi sebelumnya
+            if tuple(interpreter.get_input_details()[0]['shape']) != x.shape:
+                interpreter.resize_tensor_input(input_index, x.shape)
+                interpreter.allocate_tensors()
+            interpreter.set_tensor(input_index, np.ascontiguousarray(x))
+            interpreter.invoke()
+            return interpreter.get_tensor(interpreter.get_output_details()[0]['index']).copy()
+        finally:
+            self._pool.put(interpreter)
+
+    # Satu forward pass untuk seluruh matriks, sama seperti Model.predict_on_batch di keras
+    predict_on_batch = predict
+
+
+def source_path(path):
+    # File JSON di samping model TFLite yang mencatat sidik mlp_model.h5 asal konversinya
+    return f'{path}.json'
+
+
+def read_source_fingerprint(path):
+    try:
+        with open(source_path(path)) as f:
+            return json.load(f).get('source_fingerprint')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def calibration_rows(scaler_path, dataset_path, count=1000, seed=42):
+    # Sampel baris dataset balanced yang sudah dinormalisasi, untuk kalibrasi kuantisasi int8
+    import joblib
+    import pandas as pd
+
+    dataset = pd.read_csv(dataset_path)
+    sample = dataset.sample(n=min(count, len(dataset)), random_state=seed)
+    return joblib.load(scaler_path).transform(sample[FEATURES]).astype(np.float32)
+
+
+def convert(model_path, out_path, quantization='float', calibration=None):
+    # Konversi seperti di Model_Stunting.ipynb (Optimize.DEFAULT). Dengan 'int8', bobot dan
+    # aktivasi dikuantisasi penuh ke int8 (dikalibrasi dengan `calibration`); input dan output
+    # tetap float32 sehingga pemanggil tidak perlu tahu model dikuantisasi.
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(model_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    if quantization == 'int8':
+        if calibration is None:
+            raise ValueError("int8 quantization needs calibration rows")
+
+        def representative_dataset():
+            for row in calibration:
+                yield [row.reshape(1, -1)]
+
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    elif quantization != 'float':
+        raise ValueError(f"Unknown quantization: {quantization} (expected one of {', '.join(QUANTIZATION)})")
+
+    content = converter.convert()
+    tmp_path = f'{out_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, out_path)
+    # Sidik ditulis setelah modelnya, sehingga konversi yang terputus tidak pernah tercatat sebagai terbaru
+    source = {'source_fingerprint': file_fingerprint(model_path), 'quantization': quantization}
+    with open(f'{source_path(out_path)}.tmp', 'w') as f:
+        json.dump(source, f)
+    os.replace(f'{source_path(out_path)}.tmp', source_path(out_path))
+    return len(content)
+
+
+def _median_us(fn, repeat):
+    for _ in range(10):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def report(model_path, scaler_path, dataset_path, tflite_paths, repeat=200):
+    # Paritas kelas/probabilitas setiap model TFLite terhadap Keras pada seluruh dataset,
+    # akurasi terhadap label, dan latensi satu baris maupun satu batch
+    import joblib
+    import pandas as pd
+    from inference import load_model
+
+    dataset = pd.read_csv(dataset_path)
+    features = joblib.load(scaler_path).transform(dataset[FEATURES]).astype(np.float32)
+    labels = dataset['Status_Gizi'].to_numpy()
+    row = features[:1]
+    batch = features[:1000]
+
+    keras_model = load_model(model_path, 'keras')
+    expected = keras_model.predict(features, verbose=0)
+    models = {
+        'keras': keras_model,
+        'numpy': load_model(model_path, 'numpy'),
+        **{name: TFLiteModel(path, pool_size=1) for name, path in tflite_paths.items()},
+    }
+
+    results = {}
+    for name, model in models.items():
+        actual = expected if name == 'keras' else model.predict_on_batch(features)
+        predict_row = (lambda m=model: m.predict(row, verbose=0)) if name == 'keras' else (lambda m=model: m.predict(row))
+        results[name] = {
+            'accuracy': float((actual.argmax(axis=1) == labels).mean()),
+            'class_agreement': float((actual.argmax(axis=1) == expected.argmax(axis=1)).mean()),
+            'class_mismatches': int((actual.argmax(axis=1) != expected.argmax(axis=1)).sum()),
+            'max_abs_diff': float(np.abs(actual - expected).max()),
+            'row_latency_us': _median_us(predict_row, repeat),
+            'batch_1000_latency_us': _median_us(lambda m=model: m.predict_on_batch(batch), max(10, repeat // 10)),
+        }
+        if name in tflite_paths:
+            results[name]['size_bytes'] = os.path.getsize(tflite_paths[name])
+
+    return {'rows': int(len(features)), 'models': results}
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Convert the model to TFLite and compare it with the Keras model')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert')
+    convert_parser.add_argument('--quantization', choices=QUANTIZATION, default='float')
+    convert_parser.add_argument('--model', default='model/mlp_model.h5')
+    convert_parser.add_argument('--scaler', default='model/scaler.pkl')
+    convert_parser.add_argument('--dataset', default='../ML/dataset/data_balita_balanced.csv',
+                                help='calibration data for int8 quantization')
+    convert_parser.add_argument('--out', default=None)
+
+    report_parser = subparsers.add_parser('report')
+    report_parser.add_argument('--model', default='model/mlp_model.h5')
+    report_parser.add_argument('--scaler', default='model/scaler.pkl')
+    report_parser.add_argument('--dataset', default='../ML/dataset/data_balita_balanced.csv')
+    report_parser.add_argument('--repeat', type=int, default=200)
+
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        out_path = args.out or DEFAULT_PATHS[args.quantization]
+        calibration = None
+        if args.quantization == 'int8':
+            calibration = calibration_rows(args.scaler, args.dataset)
+        size = convert(args.model, out_path, args.quantization, calibration)
+        logging.info(f"TFLite model ({args.quantization}, {size} bytes) saved to {out_path}")
+    else:
+        paths = {f'tflite_{q}': path for q, path in DEFAULT_PATHS.items() if os.path.exists(path)}
+        print(json.dumps(report(args.model, args.scaler, args.dataset, paths, args.repeat), indent=2))
@@ -0,0 +1,284 @@
+import argparse
+import bisect
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+# Domain input yang dicakup tabel. Di luar domain ini (umur bukan bilangan bulat,
+# jenis kelamin selain 0/1, tinggi badan di luar rentang) /predict tetap memakai model.
+AGES = range(0, 61)
+SEXES = (0, 1)
+HEIGHT_MIN = 30.0
+HEIGHT_MAX = 140.0
+
+PROBABILITY_MODES = ('interp', 'exact')
+
+
+def file_fingerprint(*paths):
+    # Hash isi file model dan scaler, tabel dianggap basi jika salah satunya berubah
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def matches_sources(fingerprint, *paths):
+    # File turunan (scaler.npz, model.stm, model.tflite) hanya dipakai jika dibuat dari file sumber yang
+    # sekarang. Jika ada file sumber yang tidak tersedia, file turunan tidak bisa diperiksa dan tetap dipakai.
+    if not all(os.path.exists(path) for path in paths):
+        return True
+    return fingerprint is not None and fingerprint == file_fingerprint(*paths)
+
+
+def _feature_matrix(age, sex, heights):
+    matrix = np.empty((len(heights), 3), dtype=np.float64)
+    matrix[:, 0] = age
+    matrix[:, 1] = sex
+    matrix[:, 2] = heights
+    return matrix
+
+
+def build_table(score, fingerprint, classes, step=0.01, proba_step=0.25, tolerance=1e-6):
+    # score: fungsi matriks fitur mentah (n, 3) -> probabilitas (n, k), yaitu scaler + model
+    heights = np.round(np.arange(HEIGHT_MIN, HEIGHT_MAX + step / 2, step), 6)
+    proba_heights = np.round(np.arange(HEIGHT_MIN, HEIGHT_MAX + proba_step / 2, proba_step), 6)
+
+    cuts, labels, probabilities = [], [], []
+    cut_offsets, label_offsets = [0], [0]
+
+    for age in AGES:
+        for sex in SEXES:
+            predicted = np.asarray(score(_feature_matrix(age, sex, heights))).argmax(axis=1)
+            changes = np.flatnonzero(predicted[1:] != predicted[:-1])
+
+            # Persempit setiap titik perubahan kelas dengan bisection sampai toleransi
+            lo = heights[changes].copy()
+            hi = heights[changes + 1].copy()
+            lo_class = predicted[changes]
+            while len(changes) and (hi - lo).max() > tolerance:
+                mid = (lo + hi) / 2
+                mid_class = np.asarray(score(_feature_matrix(age, sex, mid))).argmax(axis=1)
+                same = mid_class == lo_class
+                lo = np.where(same, mid, lo)
+                hi = np.where(same, hi, mid)
+
+            cuts.extend(hi.tolist())
+            labels.append(int(predicted[0]))
+            labels.extend(predicted[changes + 1].tolist())
+            cut_offsets.append(len(cuts))
+            label_offsets.append(len(labels))
+
+            probabilities.append(np.asarray(score(_feature_matrix(age, sex, proba_heights)), dtype=np.float32))
+
+    return {
+        'fingerprint': np.array(fingerprint),
+        'classes': np.array(classes),
+        'height_range': np.array([HEIGHT_MIN, HEIGHT_MAX]),
+        'proba_step': np.array(proba_step),
+        'cuts': np.array(cuts, dtype=np.float64),
+        'cut_offsets': np.array(cut_offsets, dtype=np.int32),
+        'labels': np.array(labels, dtype=np.int8),
+        'label_offsets': np.array(label_offsets, dtype=np.int32),
+        'probabilities': np.stack(probabilities),
+    }
+
+
+def save_table(path, table):
+    np.savez_compressed(path, **table)
+
+
+class ThresholdTable:
+    def __init__(self, table, probability_mode='interp', exact_score=None):
+        if probability_mode not in PROBABILITY_MODES:
+            raise ValueError(f"Unknown probability mode: {probability_mode}")
+        if probability_mode == 'exact' and exact_score is None:
+            raise ValueError("exact probability mode needs a scoring function")
+
+        self.fingerprint = str(table['fingerprint'])
+        self.classes = [str(c) for c in table['classes']]
+        self.height_min, self.height_max = (float(v) for v in table['height_range'])
+        self.proba_step = float(table['proba_step'])
+        self.probabilities = table['probabilities']
+        self.probability_mode = probability_mode
+        self.exact_score = exact_score
+
+        # List Python per (umur, jenis kelamin) agar bisect tidak perlu membuat array baru
+        cuts, cut_offsets = table['cuts'], table['cut_offsets']
+        labels, label_offsets = table['labels'], table['label_offsets']
+        self._cuts = []
+        self._labels = []
+        for i in range(len(cut_offsets) - 1):
+            self._cuts.append(cuts[cut_offsets[i]:cut_offsets[i + 1]].tolist())
+            self._labels.append(labels[label_offsets[i]:label_offsets[i + 1]].tolist())
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        with np.load(path) as data:
+            table = {key: data[key] for key in data.files}
+        return cls(table, **kwargs)
+
+    def _key(self, umur, jenis_kelamin, tinggi_badan):
+        if not float(umur).is_integer() or not AGES.start <= umur < AGES.stop:
+            return None
+        if jenis_kelamin not in SEXES:
+            return None
+        if not self.height_min <= tinggi_badan <= self.height_max:
+            return None
+        return int(umur) * len(SEXES) + int(jenis_kelamin)
+
+    def classify(self, key, tinggi_badan):
+        # Indeks titik potong kelas untuk tinggi badan ini (posisi bisect dalam daftar cut)
+        return bisect.bisect_right(self._cuts[key], tinggi_badan)
+
+    def probability(self, key, tinggi_badan):
+        # Interpolasi linear antar titik grid probabilitas
+        position = (tinggi_badan - self.height_min) / self.proba_step
+        i = min(int(position), self.probabilities.shape[1] - 2)
+        fraction = position - i
+        row = self.probabilities[key]
+        return (1.0 - fraction) * row[i] + fraction * row[i + 1]
+
+    def _interpolable(self, key, tinggi_badan, cut):
+        # Interpolasi hanya konsisten dengan kelas jika kedua titik grid di sekitar tinggi badan berada
+        # di sisi titik potong yang sama: argmax kombinasi dua vektor dengan argmax yang sama tidak berubah
+        i = min(int((tinggi_badan - self.height_min) / self.proba_step), self.probabilities.shape[1] - 2)
+        lower = self.height_min + i * self.proba_step
+        upper = lower + self.proba_step
+        return self.classify(key, lower) == cut and self.classify(key, upper) == cut
+
+    def lookup(self, umur, jenis_kelamin, tinggi_badan):
+        # (indeks kelas, probabilitas) atau None jika input harus diproses oleh model
+        key = self._key(umur, jenis_kelamin, tinggi_badan)
+        if key is None:
+            return None
+
+        cut = self.classify(key, tinggi_badan)
+        if self.probability_mode == 'interp' and self._interpolable(key, tinggi_badan, cut):
+            return self._labels[key][cut], self.probability(key, tinggi_badan)
+
+        # Mode exact, atau tinggi badan kurang dari satu langkah grid dari titik potong: probabilitas
+        # dihitung model dan kelas diambil dari argmax-nya agar keduanya tidak saling bertentangan
+        if self.exact_score is None:
+            return None
+        probabilities = np.asarray(self.exact_score([(umur, jenis_kelamin, tinggi_badan)]))[0]
+        return int(probabilities.argmax()), probabilities
+
+
+def verify_table(table, score, step=0.002, max_examples=20):
+    # Bandingkan kelas dari tabel dengan model penuh pada grid yang rapat, dan periksa bahwa kelas dari
+    # lookup() selalu argmax probabilitas yang dikembalikannya
+    heights = np.round(np.arange(table.height_min, table.height_max + step / 2, step), 6)
+    checked = 0
+    disagreements = 0
+    max_probability_error = 0.0
+    consistency_checked = 0
+    inconsistent = 0
+    examples = []
+    consistency_examples = []
+
+    for age in AGES:
+        for sex in SEXES:
+            key = age * len(SEXES) + sex
+            expected = np.asarray(score(_feature_matrix(age, sex, heights)))
+            expected_class = expected.argmax(axis=1)
+
+            cuts = np.asarray(table._cuts[key])
+            labels = np.asarray(table._labels[key])
+            actual_class = labels[np.searchsorted(cuts, heights, side='right')]
+
+            mismatched = np.flatnonzero(expected_class != actual_class)
+            checked += len(heights)
+            disagreements += len(mismatched)
+            for i in mismatched[:max(0, max_examples - len(examples))]:
+                examples.append({
+                    'umur': age,
+                    'jenis_kelamin': sex,
+                    'tinggi_badan': float(heights[i]),
+                    'model_class': table.classes[expected_class[i]],
+                    'table_class': table.classes[actual_class[i]],
+                })
+
+            interpolated = np.array([table.probability(key, h) for h in heights[::50]])
+            max_probability_error = max(max_probability_error,
+                                        float(np.abs(interpolated - expected[::50]).max()))
+
+            # Kelas yang dikembalikan lookup() harus argmax probabilitasnya, terutama di dekat titik potong
+            probes = np.arange(0, len(heights), 50)
+            for cut in cuts:
+                probes = np.union1d(probes, np.flatnonzero(np.abs(heights - cut) <= table.proba_step))
+            for i in probes:
+                result = table.lookup(age, sex, float(heights[i]))
+                if result is None:
+                    continue
+                consistency_checked += 1
+                if result[0] != int(np.argmax(result[1])):
+                    inconsistent += 1
+                    if len(consistency_examples) < max_examples:
+                        consistency_examples.append({
+                            'umur': age,
+                            'jenis_kelamin': sex,
+                            'tinggi_badan': float(heights[i]),
+                            'table_class': table.classes[result[0]],
+                            'probability_argmax': table.classes[int(np.argmax(result[1]))],
+                        })
+
+    return {
+        'checked': checked,
+        'disagreements': disagreements,
+        'disagreement_rate': disagreements / checked,
+        'max_interpolated_probability_error': max_probability_error,
+        'consistency_checked': consistency_checked,
+        'class_probability_mismatches': inconsistent,
+        'class_probability_examples': consistency_examples,
+        'examples': examples,
+    }
+
+
+def _load_scorer(model_path, scaler_path, backend):
+    import joblib
+    import pandas as pd
+    from inference import load_model
+
+    scaler = joblib.load(scaler_path)
+    model = load_model(model_path, backend)
+    columns = ['Umur', 'Jenis_Kelamin', 'Tinggi_Badan']
+
+    def score(rows):
+        return model.predict_on_batch(scaler.transform(pd.DataFrame(rows, columns=columns)))
+
+    return score
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Build or verify the per-age/sex height threshold table')
+    parser.add_argument('command', choices=['build', 'verify'])
+    parser.add_argument('--model', default='model/mlp_model.h5')
+    parser.add_argument('--scaler', default='model/scaler.pkl')
+    parser.add_argument('--table', default='model/threshold_table.npz')
+    parser.add_argument('--backend', default=os.environ.get('INFERENCE_BACKEND', 'keras'))
+    parser.add_argument('--step', type=float, default=None,
+                        help='height grid step in cm (build default 0.01, verify default 0.002)')
+    args = parser.parse_args()
+
+    score = _load_scorer(args.model, args.scaler, args.backend)
+
+    if args.command == 'build':
+        table = build_table(score, file_fingerprint(args.model, args.scaler),
+                            ['severely_stunted', 'stunted', 'normal', 'tinggi'],
+                            step=args.step or 0.01)
+        save_table(args.table, table)
+        logging.info(f"Threshold table with {len(table['cuts'])} cut points saved to {args.table}")
+    else:
+        table = ThresholdTable.load(args.table, exact_score=score)
+        if table.fingerprint != file_fingerprint(args.model, args.scaler):
+            logging.warning("Threshold table was built from a different model or scaler.")
+        report = verify_table(table, score, step=args.step or 0.002)
+        print(json.dumps(report, indent=2))
+        raise SystemExit(0 if report['disagreements'] == 0 and report['class_probability_mismatches'] == 0 else 1)
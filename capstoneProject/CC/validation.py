@@ -0,0 +1,45 @@
+import itertools
+
+# Tipe Python yang bisa dihasilkan parser JSON
+JSON_TYPES = (type(None), bool, int, float, str, list, dict)
+PRESENT = tuple(t for t in JSON_TYPES if t is not type(None))
+NUMERIC = (int, float)  # bool ikut diterima, sama seperti isinstance(True, int)
+
+
+class RecordSchema:
+    # Schema record JSON dengan field tetap. Aturan (field, tipe yang diterima, pesan error) dievaluasi
+    # sekali untuk setiap kombinasi tipe JSON field saat schema dibuat. Validasi satu record cukup
+    # mengambil field lalu satu lookup dict dengan tuple tipe field-nya, tanpa percabangan per field.
+    def __init__(self, fields, rules):
+        self.fields = tuple(fields)
+        self.rules = [(tuple(self.fields.index(name) for name in names), allowed, message)
+                      for names, allowed, message in rules]
+        self._errors = {types: self._evaluate(types)
+                        for types in itertools.product(JSON_TYPES, repeat=len(self.fields))}
+        self.validate = self._validator()
+
+    def _evaluate(self, types):
+        # Pesan error aturan pertama yang dilanggar, atau None jika record valid
+        for positions, allowed, message in self.rules:
+            if not all(issubclass(types[i], allowed) for i in positions):
+                return message
+        return None
+
+    def _validator(self):
+        # validate(data) -> (nilai field dalam urutan schema, None) atau (None, pesan error)
+        fields = self.fields
+        errors = self._errors
+        evaluate = self._evaluate
+
+        def validate(data):
+            values = tuple(map(data.get, fields))
+            types = tuple(map(type, values))
+            try:
+                error = errors[types]
+            except KeyError:  # tipe di luar hasil parser JSON (subclass, objek Python)
+                error = evaluate(types)
+            if error is None:
+                return values, None
+            return None, error
+
+        return validate
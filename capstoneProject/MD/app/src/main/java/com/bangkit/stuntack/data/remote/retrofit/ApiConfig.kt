@@ -7,6 +7,12 @@ import retrofit2.converter.gson.GsonConverterFactory
 
 class ApiConfig {
     companion object {
+        private const val BASE_URL = "https://stuntrack-app-792955132014.asia-southeast2.run.app/"
+
+        // Gambar artikel lewat proxy server: sudah diperkecil ke lebar yang dibutuhkan dan di-cache
+        fun articleImageUrl(id: Int, width: Int): String =
+            "${BASE_URL}articles/$id/image?w=$width&format=webp"
+
         fun getApiService(): ApiService {
             val client = OkHttpClient.Builder()
                 .addInterceptor(HttpLoggingInterceptor().apply {
@@ -15,7 +21,7 @@ class ApiConfig {
                 .build()
 
             val retrofit = Retrofit.Builder()
-                .baseUrl("https://stuntrack-app-792955132014.asia-southeast2.run.app/")
+                .baseUrl(BASE_URL)
                 .addConverterFactory(GsonConverterFactory.create())
                 .client(client)
                 .build()
@@ -9,6 +9,7 @@ import retrofit2.http.Body
 import retrofit2.http.GET
 import retrofit2.http.POST
 import retrofit2.http.Path
+import retrofit2.http.Query
 
 interface ApiService {
     @POST("predict")
@@ -19,7 +20,9 @@ interface ApiService {
 
 
     @GET("articles")
-    suspend fun getNews(): List<NewsResponseItem>
+    suspend fun getNews(
+        @Query("predicted_class") predictedClass: String? = null
+    ): List<NewsResponseItem>
 
     @GET("articles/{id}")
     suspend fun getNewsDetail(
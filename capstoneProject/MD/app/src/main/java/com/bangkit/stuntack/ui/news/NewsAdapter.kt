@@ -9,6 +9,7 @@ import androidx.recyclerview.widget.ListAdapter
 import androidx.recyclerview.widget.RecyclerView
 import com.bangkit.stuntack.R
 import com.bangkit.stuntack.data.remote.response.NewsResponseItem
+import com.bangkit.stuntack.data.remote.retrofit.ApiConfig
 import com.bangkit.stuntack.databinding.CardNewsBinding
 import com.bangkit.stuntack.ui.news.detail.NewsDetailsActivity
 import com.bumptech.glide.Glide
@@ -32,7 +33,7 @@ class NewsAdapter(private val context: Context) : ListAdapter<NewsResponseItem,
         fun bind(newsItem: NewsResponseItem, context: Context) {
             binding.newsTitle.text = newsItem.judul
             Glide.with(binding.root.context)
-                .load(newsItem.gambar)
+                .load(newsItem.id?.let { ApiConfig.articleImageUrl(it, CARD_IMAGE_WIDTH) } ?: newsItem.gambar)
                 .error(R.drawable.placeholder_image)
                 .into(binding.newsImage)
 
@@ -45,6 +46,8 @@ class NewsAdapter(private val context: Context) : ListAdapter<NewsResponseItem,
     }
 
     companion object {
+        private const val CARD_IMAGE_WIDTH = 640
+
         val DIFF_CALLBACK = object : DiffUtil.ItemCallback<NewsResponseItem>() {
             override fun areItemsTheSame(
                 oldItem: NewsResponseItem,
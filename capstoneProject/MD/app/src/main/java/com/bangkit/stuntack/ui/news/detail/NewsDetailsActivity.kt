@@ -7,6 +7,7 @@ import androidx.appcompat.app.AppCompatActivity
 import androidx.core.text.HtmlCompat
 import com.bangkit.stuntack.R
 import com.bangkit.stuntack.data.remote.response.NewsDetailResponse
+import com.bangkit.stuntack.data.remote.retrofit.ApiConfig
 import com.bangkit.stuntack.databinding.ActivityNewsDetailsBinding
 import com.bumptech.glide.Glide
 import java.text.SimpleDateFormat
@@ -65,7 +66,7 @@ class NewsDetailsActivity : AppCompatActivity() {
         }
 
         Glide.with(this)
-            .load(detail.gambar)
+            .load(detail.id?.let { ApiConfig.articleImageUrl(it, DETAIL_IMAGE_WIDTH) } ?: detail.gambar)
             .placeholder(R.drawable.placeholder_image)
             .into(binding.imageNews)
     }
@@ -89,4 +90,8 @@ class NewsDetailsActivity : AppCompatActivity() {
         binding.progressBar.visibility = View.GONE
         binding.textDescription.text = getString(R.string.error_message, message)
     }
+
+    companion object {
+        private const val DETAIL_IMAGE_WIDTH = 1280
+    }
 }
\ No newline at end of file
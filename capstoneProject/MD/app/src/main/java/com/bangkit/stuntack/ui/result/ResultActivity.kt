@@ -113,24 +113,14 @@ class ResultActivity : AppCompatActivity() {
         }
     }
 
-    private fun mapPredictedClass(predictedClass: String): String {
-        return when (predictedClass.lowercase()) {
-            "severely_stunted" -> "severly_stunted"
-            else -> predictedClass
-        }
-    }
-
     private fun fetchAndFilterNews(predictedClass: String) {
         binding.progressBar.visibility = View.VISIBLE // Tampilkan loading animation
         binding.rvArticles.visibility = View.GONE // Sembunyikan RecyclerView
 
         lifecycleScope.launch {
             try {
-                val newsList = ApiConfig.getApiService().getNews()
-                val mappedClass = mapPredictedClass(predictedClass)
-                val filteredNews = newsList.filter { news ->
-                    news.predictedClass.equals(mappedClass, ignoreCase = true)
-                }
+                // Server hanya mengirim artikel untuk kelas hasil prediksi
+                val filteredNews = ApiConfig.getApiService().getNews(predictedClass)
                 newsAdapter.submitList(filteredNews)
 
                 // Sembunyikan animasi dan tampilkan RecyclerView setelah data selesai dimuat
@@ -0,0 +1,211 @@
+# Pipeline persiapan data dari notebook data_stunting.ipynb, dijalankan dari file lokal di dataset/:
+#
+#   data_balita.csv -> (hapus duplikat, encode) -> data_balita_encoded.csv
+#                   -> (undersampling kelas normal) -> data_balita_balanced.csv
+#
+#   python data_pipeline.py            # jalankan pipeline dan tulis kedua CSV
+#   python data_pipeline.py --verify   # pastikan hasil pipeline sama persis dengan CSV di dataset/
+#
+# Hasil setiap tahap disimpan di .cache/ sebagai array per kolom (npz) dengan key hash input,
+# sehingga tahap yang inputnya tidak berubah tidak dijalankan ulang.
+import argparse
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+ML_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_DIR = os.path.join(ML_DIR, 'dataset')
+CACHE_DIR = os.path.join(ML_DIR, '.cache')
+
+RAW_FILE = 'data_balita.csv'
+ENCODED_FILE = 'data_balita_encoded.csv'
+BALANCED_FILE = 'data_balita_balanced.csv'
+
+# Dinaikkan jika logika salah satu tahap berubah, agar cache lama tidak dipakai
+PIPELINE_VERSION = 1
+
+GENDER_CODES = {'laki-laki': 1, 'perempuan': 0}
+STATUS_CODES = {'severely stunted': 0, 'stunted': 1, 'normal': 2, 'tinggi': 3}
+
+# Kelas mayoritas (normal) di-undersample ke jumlah kelas terkecil lainnya
+MAJORITY_CLASS = 2
+RANDOM_STATE = 42
+
+# Nama kolom dataset yang dipakai untuk training (Model_Stunting.ipynb)
+BALANCED_COLUMNS = {
+    'Umur (bulan)': 'Umur',
+    'Jenis Kelamin': 'Jenis_Kelamin',
+    'Tinggi Badan (cm)': 'Tinggi_Badan',
+    'Status Gizi': 'Status_Gizi',
+}
+
+# CSV di dataset/ disimpan dengan akhir baris Windows; data_balita_balanced.csv tanpa baris baru di akhir file
+LINE_TERMINATOR = '\r\n'
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_key(stage, *parts):
+    payload = json.dumps([PIPELINE_VERSION, stage, *parts], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _encode_column(column, codes):
+    # Lookup kategori tervektorisasi; label yang tidak dikenal dianggap error, bukan NaN diam-diam
+    encoded = pd.Categorical(column, categories=list(codes)).codes
+    if (encoded < 0).any():
+        unknown = sorted(set(column[encoded < 0].astype(str)))
+        raise ValueError(f"Unknown labels in {column.name}: {', '.join(unknown)}")
+    return np.asarray(list(codes.values()), dtype=np.int64)[encoded]
+
+
+def encode(raw):
+    # Hapus baris duplikat lalu encode Jenis Kelamin dan Status Gizi
+    data = raw.drop_duplicates()
+    return pd.DataFrame({
+        'Umur (bulan)': data['Umur (bulan)'].to_numpy(),
+        'Jenis Kelamin': _encode_column(data['Jenis Kelamin'], GENDER_CODES),
+        'Tinggi Badan (cm)': data['Tinggi Badan (cm)'].to_numpy(),
+        'Status Gizi': _encode_column(data['Status Gizi'], STATUS_CODES),
+    })
+
+
+def balance(encoded, majority_class=MAJORITY_CLASS, random_state=RANDOM_STATE):
+    # Kelas mayoritas diambil acak sebanyak kelas terkecil lainnya, lalu digabung dengan kelas lain
+    status = encoded['Status Gizi']
+    class_counts = status.value_counts()
+    min_class_count = class_counts[class_counts.index != majority_class].min()
+
+    majority = encoded[status == majority_class].sample(n=min_class_count, random_state=random_state)
+    others = encoded[status != majority_class]
+    return pd.concat([majority, others]).rename(columns=BALANCED_COLUMNS).reset_index(drop=True)
+
+
+class StageCache:
+    # Menyimpan DataFrame per kolom dalam satu file npz: <nama tahap>-<key>.npz
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, stage, key):
+        return os.path.join(self.cache_dir, f'{stage}-{key}.npz')
+
+    def load(self, stage, key):
+        path = self._path(stage, key)
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            columns = [str(name) for name in data['__columns__']]
+            return pd.DataFrame({name: data[f'column_{i}'] for i, name in enumerate(columns)})
+
+    def save(self, stage, key, frame):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        arrays = {f'column_{i}': frame[name].to_numpy() for i, name in enumerate(frame.columns)}
+        path = self._path(stage, key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, __columns__=np.array(frame.columns, dtype=str), **arrays)
+        os.replace(tmp_path, path)
+
+        # Entri lama dari tahap yang sama sudah tidak terpakai
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(f'{stage}-') and name.endswith('.npz') and name != os.path.basename(path):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+def to_csv_bytes(frame, trailing_newline=True):
+    text = frame.to_csv(index=False, lineterminator=LINE_TERMINATOR)
+    if not trailing_newline:
+        text = text[:-len(LINE_TERMINATOR)]
+    return text.encode('utf-8')
+
+
+def run(raw_path=None, cache_dir=CACHE_DIR, use_cache=True):
+    # Mengembalikan {'encoded': DataFrame, 'balanced': DataFrame, 'stages': {tahap: 'cached' | 'computed'}}
+    raw_path = raw_path or os.path.join(DATASET_DIR, RAW_FILE)
+    cache = StageCache(cache_dir)
+    stages = {}
+
+    raw_hash = file_hash(raw_path)
+    encoded_key = stage_key('encoded', raw_hash)
+    balanced_key = stage_key('balanced', encoded_key, MAJORITY_CLASS, RANDOM_STATE)
+
+    balanced = cache.load('balanced', balanced_key) if use_cache else None
+    encoded = cache.load('encoded', encoded_key) if use_cache else None
+
+    if encoded is None:
+        encoded = encode(pd.read_csv(raw_path))
+        cache.save('encoded', encoded_key, encoded)
+        stages['encoded'] = 'computed'
+    else:
+        stages['encoded'] = 'cached'
+
+    if balanced is None:
+        balanced = balance(encoded)
+        cache.save('balanced', balanced_key, balanced)
+        stages['balanced'] = 'computed'
+    else:
+        stages['balanced'] = 'cached'
+
+    return {'encoded': encoded, 'balanced': balanced, 'stages': stages}
+
+
+def outputs(result):
+    # Isi file CSV yang dihasilkan pipeline: nama file -> bytes
+    return {
+        ENCODED_FILE: to_csv_bytes(result['encoded']),
+        BALANCED_FILE: to_csv_bytes(result['balanced'], trailing_newline=False),
+    }
+
+
+def write_outputs(result, out_dir=DATASET_DIR):
+    os.makedirs(out_dir, exist_ok=True)
+    for name, content in outputs(result).items():
+        path = os.path.join(out_dir, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == content:
+                    continue  # tidak berubah, file tidak disentuh
+        with open(path, 'wb') as f:
+            f.write(content)
+        logging.info(f"Wrote {path}")
+
+
+def verify_outputs(result, dataset_dir=DATASET_DIR):
+    # Membandingkan hasil pipeline byte per byte dengan CSV yang ada
+    report = {}
+    for name, content in outputs(result).items():
+        with open(os.path.join(dataset_dir, name), 'rb') as f:
+            report[name] = f.read() == content
+    return report
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Prepare the encoded and balanced stunting datasets')
+    parser.add_argument('--raw', default=os.path.join(DATASET_DIR, RAW_FILE))
+    parser.add_argument('--out-dir', default=DATASET_DIR)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--no-cache', action='store_true', help='recompute every stage')
+    parser.add_argument('--verify', action='store_true',
+                        help='compare the pipeline output with the CSV files in --out-dir instead of writing')
+    args = parser.parse_args()
+
+    result = run(args.raw, cache_dir=args.cache_dir, use_cache=not args.no_cache)
+    logging.info(f"Stages: {', '.join(f'{stage} {state}' for stage, state in result['stages'].items())}")
+
+    if args.verify:
+        report = verify_outputs(result, args.out_dir)
+        print(json.dumps(report, indent=2))
+        raise SystemExit(0 if all(report.values()) else 1)
+    write_outputs(result, args.out_dir)
@@ -0,0 +1,236 @@
+# Training model MLP stunting tanpa notebook, dengan pencarian hyperparameter dan seed secara paralel:
+#
+#   python train.py                                  # grid lengkap, model terbaik diekspor ke ../CC/model
+#   python train.py --search random --trials 12      # sampel acak dari grid
+#   python train.py --widths 16x16 32x32 --learning-rates 0.001 --batch-sizes 32 --seeds 0 1 2
+#
+# Setiap trial berjalan di proses terpisah dengan jumlah thread TensorFlow/BLAS yang dibatasi,
+# sehingga beberapa trial bisa berjalan bersamaan tanpa saling berebut core.
+import argparse
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import data_pipeline
+
+ML_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVING_MODEL_DIR = os.path.join(ML_DIR, '..', 'CC', 'model')
+
+FEATURES = ['Umur', 'Jenis_Kelamin', 'Tinggi_Badan']
+TARGET = 'Status_Gizi'
+NUM_CLASSES = 4
+
+# Konfigurasi notebook Model_Stunting.ipynb ada di dalam grid default
+DEFAULT_WIDTHS = ['16x16', '32x32', '64x32']
+DEFAULT_LEARNING_RATES = [1e-3, 3e-3]
+DEFAULT_BATCH_SIZES = [32, 128]
+DEFAULT_SEEDS = [0, 1, 2]
+
+SPLIT_RANDOM_STATE = 42
+
+_data = None
+
+
+def load_data():
+    # Dataset balanced dari pipeline, dinormalisasi dan dibagi 80/10/10 seperti di notebook
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import MinMaxScaler
+
+    dataset = data_pipeline.run()['balanced']
+    X = pd.DataFrame(dataset[FEATURES])
+    y = dataset[TARGET].to_numpy()
+
+    scaler = MinMaxScaler()
+    X_scaled = scaler.fit_transform(X).astype(np.float32)
+
+    X_train, X_temp, y_train, y_temp = train_test_split(
+        X_scaled, y, test_size=0.2, stratify=y, random_state=SPLIT_RANDOM_STATE)
+    X_val, X_test, y_val, y_test = train_test_split(
+        X_temp, y_temp, test_size=0.5, stratify=y_temp, random_state=SPLIT_RANDOM_STATE)
+    splits = {'train': (X_train, y_train), 'val': (X_val, y_val), 'test': (X_test, y_test)}
+    return scaler, splits
+
+
+def parse_widths(value):
+    return tuple(int(width) for width in value.lower().split('x'))
+
+
+def build_trials(widths, learning_rates, batch_sizes, seeds, search='grid', trials=None, search_seed=0):
+    grid = [
+        {'widths': list(parse_widths(w)), 'learning_rate': lr, 'batch_size': bs, 'seed': seed}
+        for w, lr, bs, seed in itertools.product(widths, learning_rates, batch_sizes, seeds)
+    ]
+    if search == 'random' and trials is not None and trials < len(grid):
+        grid = random.Random(search_seed).sample(grid, trials)
+    for trial_id, trial in enumerate(grid):
+        trial['trial_id'] = trial_id
+    return grid
+
+
+def _init_worker(threads, splits):
+    # Batasi thread sebelum TensorFlow di-import di proses ini
+    global _data
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'TF_NUM_INTRAOP_THREADS'):
+        os.environ[variable] = str(threads)
+    os.environ['TF_NUM_INTEROP_THREADS'] = '1'
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    os.environ['CUDA_VISIBLE_DEVICES'] = ''
+
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    _data = splits
+
+
+def _dataset(tf, X, y, batch_size, seed=None):
+    # Seluruh data ada di memori: cache tensor, shuffle per epoch, batch, dan prefetch
+    dataset = tf.data.Dataset.from_tensor_slices((X, y)).cache()
+    if seed is not None:
+        dataset = dataset.shuffle(len(X), seed=seed, reshuffle_each_iteration=True)
+    return dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+
+def run_trial(trial, epochs, patience, out_dir):
+    import tensorflow as tf
+    from sklearn.metrics import f1_score
+
+    started = time.perf_counter()
+    tf.keras.utils.set_random_seed(trial['seed'])
+    tf.config.experimental.enable_op_determinism()
+
+    X_train, y_train = _data['train']
+    X_val, y_val = _data['val']
+    X_test, y_test = _data['test']
+
+    model = tf.keras.Sequential(
+        [tf.keras.Input(shape=(X_train.shape[1],))]
+        + [tf.keras.layers.Dense(width, activation='relu') for width in trial['widths']]
+        + [tf.keras.layers.Dense(NUM_CLASSES, activation='softmax')]
+    )
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=trial['learning_rate']),
+                  loss='sparse_categorical_crossentropy',
+                  metrics=['accuracy'])
+
+    early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=patience,
+                                                      restore_best_weights=True)
+    history = model.fit(_dataset(tf, X_train, y_train, trial['batch_size'], seed=trial['seed']),
+                        validation_data=_dataset(tf, X_val, y_val, 1024),
+                        epochs=epochs,
+                        shuffle=False,  # sudah di-shuffle oleh tf.data
+                        callbacks=[early_stopping],
+                        verbose=0)
+
+    val_loss, val_accuracy = model.evaluate(_dataset(tf, X_val, y_val, 1024), verbose=0)
+    test_loss, test_accuracy = model.evaluate(_dataset(tf, X_test, y_test, 1024), verbose=0)
+    test_pred = model.predict(X_test, batch_size=1024, verbose=0).argmax(axis=1)
+
+    model_path = os.path.join(out_dir, f"trial-{trial['trial_id']}.h5")
+    model.save(model_path)
+
+    return {
+        **trial,
+        'epochs': len(history.history['loss']),
+        'val_loss': float(val_loss),
+        'val_accuracy': float(val_accuracy),
+        'test_loss': float(test_loss),
+        'test_accuracy': float(test_accuracy),
+        'test_f1_macro': float(f1_score(y_test, test_pred, average='macro')),
+        'wall_seconds': time.perf_counter() - started,
+        'model_path': model_path,
+    }
+
+
+def best_trial(results):
+    # Dipilih dari data validasi saja; data test hanya untuk laporan
+    return min(results, key=lambda r: (-r['val_accuracy'], r['val_loss'], r['trial_id']))
+
+
+def export(result, scaler, model_dir):
+    # Tulis ke file sementara lalu rename, agar server tidak pernah membaca file setengah jadi
+    import joblib
+
+    os.makedirs(model_dir, exist_ok=True)
+    model_target = os.path.join(model_dir, 'mlp_model.h5')
+    scaler_target = os.path.join(model_dir, 'scaler.pkl')
+    shutil.copyfile(result['model_path'], f'{model_target}.tmp')
+    joblib.dump(scaler, f'{scaler_target}.tmp')
+    os.replace(f'{model_target}.tmp', model_target)
+    os.replace(f'{scaler_target}.tmp', scaler_target)
+    return model_target, scaler_target
+
+
+def search(trials, scaler, splits, workers, threads, epochs, patience, model_dir, report_path):
+    started = time.perf_counter()
+    results = []
+    with tempfile.TemporaryDirectory(prefix='stunttrack-train-') as out_dir:
+        # spawn: setiap worker memulai TensorFlow sendiri dengan batas thread-nya
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(threads, splits)) as executor:
+            futures = [executor.submit(run_trial, trial, epochs, patience, out_dir) for trial in trials]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                logging.info(f"Trial {result['trial_id']} {result['widths']} lr={result['learning_rate']} "
+                             f"batch={result['batch_size']} seed={result['seed']}: "
+                             f"val_acc {result['val_accuracy']:.4f}, test_acc {result['test_accuracy']:.4f}, "
+                             f"{result['epochs']} epochs, {result['wall_seconds']:.1f} s")
+
+        results.sort(key=lambda r: r['trial_id'])
+        best = best_trial(results)
+        if model_dir:
+            model_target, scaler_target = export(best, scaler, model_dir)
+            logging.info(f"Best trial {best['trial_id']} exported to {model_target} and {scaler_target}")
+
+    report = {
+        'workers': workers,
+        'threads_per_worker': threads,
+        'wall_seconds': time.perf_counter() - started,
+        'best_trial': best['trial_id'],
+        'trials': [{key: value for key, value in r.items() if key != 'model_path'} for r in results],
+    }
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description='Train the stunting MLP with a parallel hyperparameter/seed search')
+    parser.add_argument('--widths', nargs='+', default=DEFAULT_WIDTHS, help='hidden layer widths, e.g. 16x16')
+    parser.add_argument('--learning-rates', nargs='+', type=float, default=DEFAULT_LEARNING_RATES)
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=DEFAULT_BATCH_SIZES)
+    parser.add_argument('--seeds', nargs='+', type=int, default=DEFAULT_SEEDS)
+    parser.add_argument('--search', choices=['grid', 'random'], default='grid')
+    parser.add_argument('--trials', type=int, default=None, help='number of sampled trials for --search random')
+    parser.add_argument('--search-seed', type=int, default=0)
+    parser.add_argument('--epochs', type=int, default=100)
+    parser.add_argument('--patience', type=int, default=10)
+    parser.add_argument('--threads', type=int, default=1, help='TensorFlow/BLAS threads per trial')
+    parser.add_argument('--workers', type=int, default=None, help='parallel trials (default: cores / threads)')
+    parser.add_argument('--model-dir', default=SERVING_MODEL_DIR, help="export directory ('' to skip export)")
+    parser.add_argument('--report', default=os.path.join(ML_DIR, 'trials.json'))
+    args = parser.parse_args()
+
+    trials = build_trials(args.widths, args.learning_rates, args.batch_sizes, args.seeds,
+                          search=args.search, trials=args.trials, search_seed=args.search_seed)
+    workers = args.workers or max(1, (os.cpu_count() or 1) // args.threads)
+    logging.info(f"Running {len(trials)} trials on {workers} workers x {args.threads} threads")
+
+    scaler, splits = load_data()
+    report = search(trials, scaler, splits, workers, args.threads, args.epochs, args.patience,
+                    args.model_dir, args.report)
+    logging.info(f"Search finished in {report['wall_seconds']:.1f} s, best trial {report['best_trial']}")